@@ -1,5 +1,8 @@
 import streamlit as st
-from supabase_db import SupabaseDB
+from supabase_db import get_db
+from config import RUN_SCRAPE_WORKER_IN_APP, RUN_SEARCH_SCHEDULER_IN_APP
+from search_scheduler import get_search_scheduler
+from scrape_worker import get_scrape_worker
 import time
 
 # Import views
@@ -13,15 +16,23 @@ st.set_page_config(page_title="AI Internship Assistant", layout="wide")
 
 # --- DATABASE INITIALIZATION ---
 try:
-    db = SupabaseDB()
+    db = get_db()
 except Exception as e:
     st.error(f"Failed to connect to the database: {e}")
     st.stop()
 
+# --- BACKGROUND SCRAPING ---
+# Started once per process, so saved continuous searches and queued manual searches
+# resume after a restart. Either can run as its own process instead (see config.py).
+if RUN_SEARCH_SCHEDULER_IN_APP:
+    get_search_scheduler()
+if RUN_SCRAPE_WORKER_IN_APP:
+    get_scrape_worker()
+
 def load_internships():
     if st.session_state.user_id:
         print(f"Loading internships for user: {st.session_state.user_id}")  # Debug print
-        internships = db.get_internships_by_user(st.session_state.user_id)
+        internships = db.get_user_internships(st.session_state.user_id)
         print(f"Loaded {len(internships) if internships else 0} internships")  # Debug print
         st.session_state.all_internships = internships or []
         return internships
@@ -40,8 +51,6 @@ defaults = {
     'show_details': None,
     'confirm_delete': None,
     'show_descriptions': {},
-    'continuous_search_active': False,
-    'search_thread': None,
     'delete_success': False  # Add this for delete confirmation handling
 }
 
@@ -177,7 +186,7 @@ else:
                     return False
 
                 try:
-                    internships = db.get_internships_by_user(user_id)
+                    internships = db.get_user_internships(user_id)
                     
                     # Ensure internships is always a list
                     if internships is None:
@@ -0,0 +1,150 @@
+import asyncio
+
+from supabase import AsyncClient, acreate_client
+
+from supabase_db import (
+    INTERNSHIP_STATUSES, SUPABASE_KEY, SUPABASE_URL, bulk_upsert_query, internships_query,
+    settle_bulk_results, split_bulk_jobs,
+)
+
+# --- Async Supabase access for the Telegram bot ---
+# The bot's handlers run on one event loop; these calls await the database instead of
+# blocking every chat while a query runs. The client (and its keep-alive connection pool)
+# is created once per event loop, guarded by a lock that belongs to that loop.
+
+_clients = {}
+_client_locks = {}
+
+
+async def get_async_supabase_client() -> AsyncClient:
+    """Returns the async Supabase client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is not None:
+        return client
+    # An asyncio.Lock may only be awaited on one loop, so each loop gets its own. setdefault
+    # doesn't yield to the loop, so one lock is created per loop.
+    async with _client_locks.setdefault(loop, asyncio.Lock()):
+        if loop not in _clients:
+            if not all([SUPABASE_URL, SUPABASE_KEY]):
+                raise ConnectionError("Supabase URL or Key is not set. Check your config.py, environment variables, or Streamlit secrets.")
+            try:
+                print(f"Initializing async Supabase client with URL: {SUPABASE_URL}")
+                _clients[loop] = await acreate_client(SUPABASE_URL, SUPABASE_KEY)
+            except Exception as e:
+                raise ConnectionError(f"Failed to initialize Supabase client: {e}") from e
+        return _clients[loop]
+
+
+async def get_async_db() -> "AsyncSupabaseDB":
+    return AsyncSupabaseDB(await get_async_supabase_client())
+
+
+class AsyncSupabaseDB:
+    """The bot's counterpart of ``SupabaseDB``: same operations and return values, awaitable."""
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def get_profile_by_telegram_id(self, telegram_user_id):
+        """Finds the profile whose Telegram chat ID is this Telegram user's ID (their private chat), or None.
+
+        Profiles are created by signing up in the web app, which owns the auth user; the
+        Telegram chat ID is linked there under Telegram Settings.
+        """
+        try:
+            response = await self.client.table('profiles').select('*').eq(
+                'telegram_chat_id', str(telegram_user_id)).limit(1).execute()
+            return response.data[0] if response.data else None
+        except Exception as e:
+            print(f"Error fetching profile for Telegram user {telegram_user_id}: {e}")
+            return None
+
+    async def get_user_profile(self, user_id):
+        try:
+            response = await self.client.table('profiles').select('*').eq('id', user_id).limit(1).execute()
+            return response.data[0] if response.data else None
+        except Exception:
+            return None
+
+    async def add_internship(self, user_id: str, job_data: dict):
+        """Adds a new internship record for a specific user."""
+        try:
+            response = await self.client.table('internships').insert({**job_data, 'user_id': user_id}).execute()
+            if response.data:
+                return {'success': True, 'data': response.data[0], 'is_new': True}
+            return {'error': 'Failed to insert data.'}
+        except Exception as e:
+            if 'duplicate key value violates unique constraint' in str(e):
+                return {"error": "duplicate", "message": "You have already saved this internship."}
+            return {"error": str(e)}
+
+    async def add_internships_bulk(self, user_id: str, jobs: list):
+        """Saves many internships in one upsert; returns the same report as ``SupabaseDB.add_internships_bulk``."""
+        results, rows, row_positions = split_bulk_jobs(user_id, jobs)
+        inserted_rows, error = [], None
+        if rows:
+            try:
+                inserted_rows = (await bulk_upsert_query(self.client, rows).execute()).data or []
+            except Exception as e:
+                print(f"Error saving {len(rows)} internships: {e}")
+                error = e
+        return settle_bulk_results(results, row_positions, inserted_rows, error)
+
+    async def get_internships_by_user(self, user_id: str, columns: str = '*', statuses=None,
+                                      limit: int = None, offset: int = 0, after: dict = None):
+        """Fetches a user's internships in list order; see ``SupabaseDB.get_internships_by_user``."""
+        if not user_id:
+            return []
+        try:
+            query = internships_query(self.client, user_id, columns, statuses, limit, offset, after)
+            response = await query.execute()
+            return response.data or []
+        except Exception as e:
+            raise Exception(f"Failed to fetch internships: {str(e)}")
+
+    async def get_internship(self, user_id: str, internship_id: int, columns: str = '*'):
+        try:
+            response = await self.client.table('internships').select(columns).match({
+                'id': int(internship_id),
+                'user_id': user_id
+            }).limit(1).execute()
+            return response.data[0] if response.data else None
+        except Exception as e:
+            print(f"Error fetching internship {internship_id}: {e}")
+            return None
+
+    async def update_internship_status(self, user_id: str, internship_id: int, new_status: str):
+        """Sets one internship's status; returns the updated row or None."""
+        rows = await self.update_internships_status(user_id, [internship_id], new_status)
+        return rows[0] if rows else None
+
+    async def update_internships_status(self, user_id: str, internship_ids, new_status: str):
+        if new_status not in INTERNSHIP_STATUSES:
+            raise ValueError(f"Invalid status: {new_status}")
+        ids = [int(internship_id) for internship_id in internship_ids]
+        if not ids:
+            return []
+        try:
+            response = await self.client.table('internships').update({
+                'status': new_status
+            }).eq('user_id', user_id).in_('id', ids).execute()
+            return response.data or []
+        except Exception as e:
+            raise Exception(f"Database error: {str(e)}")
+
+    async def delete_internship(self, user_id: str, internship_id: int):
+        """Deletes one internship; returns the deleted row or None."""
+        rows = await self.delete_internships(user_id, [internship_id])
+        return rows[0] if rows else None
+
+    async def delete_internships(self, user_id: str, internship_ids):
+        try:
+            ids = [int(internship_id) for internship_id in internship_ids]
+            if not ids:
+                return []
+            response = await self.client.table('internships').delete().eq('user_id', user_id).in_('id', ids).execute()
+            return response.data or []
+        except Exception as e:
+            print(f"Error deleting internships: {str(e)}")
+            return []
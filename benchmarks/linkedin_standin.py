@@ -0,0 +1,292 @@
+"""Local stand-in for the LinkedIn pages the scrapers request, served from the saved fixtures.
+
+Routes (all GET):
+    /jobs/search/                                  search page with the first batch of cards
+    /jobs-guest/jobs/api/seeMoreJobPostings/search guest card fragment at offset ``start``
+    /jobs-guest/jobs/api/jobPosting/<id>           guest job detail fragment
+    /jobs/view/<slug>-<id>                         job detail page
+    /authwall, /checkpoint/challenge               detail page behind a login dialog
+    /__stats                                       request counters as JSON
+
+Latency, error rate, auth-wall/checkpoint redirects and 429 throttling are configurable, and
+every random choice comes from a seeded generator so runs are reproducible. Point the
+scrapers at it with the LINKEDIN_BASE_URL environment variable (read at import time):
+
+    python benchmarks/linkedin_standin.py --port 8765 --latency 0.2 --error-rate 0.05
+    LINKEDIN_BASE_URL=http://127.0.0.1:8765 python scraper.py
+"""
+import argparse
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlparse
+
+from lxml import html as lxml_html
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# The saved detail pages carry the description and a list of job cards; the saved search
+# page is LinkedIn's empty results shell that the cards are injected into.
+DETAIL_FIXTURE = "linkedin_initial_page.html"
+SEARCH_FIXTURE = "linkedin_search_results.html"
+
+DEFAULT_TOTAL_RESULTS = 100
+DEFAULT_PAGE_SIZE = 10  # Cards per guest fragment page, like LinkedIn
+DEFAULT_SEARCH_PAGE_CARDS = 25  # Cards rendered in the full search page
+
+_LINKEDIN_ORIGIN = re.compile(r'https?://(?:[a-z]{2,3}\.)?linkedin\.com')
+_JOB_ID = re.compile(r'(?<=\D)(\d{9,10})(?=\D)')
+_TRAILING_JOB_ID = re.compile(r'(\d+)/?$')
+_ID_STEP = 10_000_000_000  # Keeps cloned card IDs clear of the fixture IDs
+
+_AUTH_DIALOG = (
+    '<div role="dialog" class="modal authwall-dialog"><h2>Sign in to see more</h2>'
+    '<a href="/login">Sign in</a></div><div class="overlay"></div>'
+)
+
+
+class StandInConfig:
+    """Failure and latency settings. Rates are probabilities between 0 and 1."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0,
+                 authwall_rate: float = 0.0, checkpoint_rate: float = 0.0, throttle_rate: float = 0.0,
+                 max_requests_per_second: float = 0.0, retry_after: int = 5,
+                 total_results: int = DEFAULT_TOTAL_RESULTS, seed: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.authwall_rate = authwall_rate
+        self.checkpoint_rate = checkpoint_rate
+        self.throttle_rate = throttle_rate
+        self.max_requests_per_second = max_requests_per_second  # 0 disables the rate limit
+        self.retry_after = retry_after
+        self.total_results = total_results
+        self.seed = seed
+
+
+def _read_fixture(name: str) -> str:
+    with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _fixture_cards(page: str) -> list:
+    """The ``<li>`` job cards of a fixture page, as HTML strings."""
+    root = lxml_html.fromstring(page)
+    items = root.xpath("//li[div[contains(concat(' ', normalize-space(@class), ' '), ' base-card ')]]")
+    return [lxml_html.tostring(item, encoding="unicode") for item in items]
+
+
+def build_card_pool(cards: list, total: int) -> list:
+    """Repeats the fixture cards until there are ``total``, each copy with fresh job IDs."""
+    pool = []
+    copy = 0
+    while len(pool) < total and cards:
+        for card in cards:
+            if len(pool) >= total:
+                break
+            pool.append(_JOB_ID.sub(lambda m: str(int(m.group(1)) + copy * _ID_STEP), card) if copy else card)
+        copy += 1
+    return pool
+
+
+class StandInServer:
+    """Threaded HTTP server with the LinkedIn routes. Use ``start()``/``stop()`` or a ``with`` block."""
+
+    def __init__(self, config: StandInConfig = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StandInConfig()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._recent = deque()
+        self._in_flight = 0
+        self.stats = Counter()
+        self.peak_in_flight = 0
+
+        detail_page = _read_fixture(DETAIL_FIXTURE)
+        self._detail_template = detail_page
+        self._search_shell = _read_fixture(SEARCH_FIXTURE)
+        self._cards = build_card_pool(_fixture_cards(detail_page), self.config.total_results)
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {'requests': dict(self.stats), 'peak_in_flight': self.peak_in_flight}
+
+    # --- Pages ---
+
+    def _rewrite_links(self, page: str) -> str:
+        return _LINKEDIN_ORIGIN.sub(self.base_url, page)
+
+    def _search_page(self) -> str:
+        cards = "".join(self._cards[:DEFAULT_SEARCH_PAGE_CARDS])
+        results = f'<ul class="jobs-search__results-list">{cards}</ul>'
+        insert_at = self._search_shell.rfind("</body>")
+        insert_at = insert_at if insert_at != -1 else len(self._search_shell)
+        return self._rewrite_links(self._search_shell[:insert_at] + results + self._search_shell[insert_at:])
+
+    def _search_fragment(self, query: dict) -> str:
+        start = int(query.get('start', ['0'])[0] or 0)
+        return self._rewrite_links("".join(self._cards[start:start + DEFAULT_PAGE_SIZE]))
+
+    def _detail_page(self, auth_wall: bool = False) -> str:
+        page = self._detail_template
+        if auth_wall:
+            insert_at = page.find("<body")
+            insert_at = page.find(">", insert_at) + 1 if insert_at != -1 else 0
+            page = page[:insert_at] + _AUTH_DIALOG + page[insert_at:]
+        return self._rewrite_links(page)
+
+    # --- Request handling ---
+
+    def _draw(self, rate: float) -> bool:
+        with self._lock:
+            return rate > 0 and self._random.random() < rate
+
+    def _over_rate_limit(self) -> bool:
+        limit = self.config.max_requests_per_second
+        if limit <= 0:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            while self._recent and now - self._recent[0] >= 1.0:
+                self._recent.popleft()
+            if len(self._recent) >= limit:
+                return True
+            self._recent.append(now)
+            return False
+
+    def _delay(self):
+        with self._lock:
+            delay = self.config.latency + (self._random.uniform(0, self.config.jitter) if self.config.jitter else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def handle(self, path: str, query: dict) -> tuple:
+        """Returns ``(status, headers, body)`` for a request."""
+        if path == "/__stats":
+            return 200, {'Content-Type': 'application/json'}, json.dumps(self.snapshot())
+
+        self._delay()
+        if self._over_rate_limit() or self._draw(self.config.throttle_rate):
+            return 429, {'Retry-After': str(self.config.retry_after)}, "Too Many Requests"
+        if self._draw(self.config.error_rate):
+            return 500, {}, "Internal Server Error"
+
+        if path.rstrip("/") == "/jobs/search":
+            return 200, {}, self._search_page()
+        if path == "/jobs-guest/jobs/api/seeMoreJobPostings/search":
+            return 200, {}, self._search_fragment(query)
+        if path.startswith("/jobs-guest/jobs/api/jobPosting/") or path.startswith("/jobs/view/"):
+            if not _TRAILING_JOB_ID.search(path):
+                return 404, {}, "Not Found"
+            if self._draw(self.config.authwall_rate):
+                return 302, {'Location': f"{self.base_url}/authwall?sessionRedirect={quote(path)}"}, ""
+            if self._draw(self.config.checkpoint_rate):
+                return 302, {'Location': f"{self.base_url}/checkpoint/challenge?redirect={quote(path)}"}, ""
+            return 200, {}, self._detail_page()
+        if path in ("/authwall", "/checkpoint/challenge"):
+            return 200, {}, self._detail_page(auth_wall=True)
+        return 404, {}, "Not Found"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                with server._lock:
+                    server._in_flight += 1
+                    server.peak_in_flight = max(server.peak_in_flight, server._in_flight)
+                try:
+                    status, headers, body = server.handle(parsed.path, parse_qs(parsed.query))
+                finally:
+                    with server._lock:
+                        server._in_flight -= 1
+                        server.stats[f"{status} {_route_name(parsed.path)}"] += 1
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header('Content-Type', headers.pop('Content-Type', 'text/html; charset=utf-8'))
+                self.send_header('Content-Length', str(len(payload)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass  # Request counters are in /__stats
+
+        return Handler
+
+
+def _route_name(path: str) -> str:
+    if path.startswith("/jobs-guest/jobs/api/jobPosting/"):
+        return "/jobs-guest/jobs/api/jobPosting"
+    if path.startswith("/jobs/view/"):
+        return "/jobs/view"
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument('--jitter', type=float, default=0.0, help="extra random latency, up to this many seconds")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="share of requests answered with HTTP 500")
+    parser.add_argument('--authwall-rate', type=float, default=0.0, help="share of detail pages redirected to /authwall")
+    parser.add_argument('--checkpoint-rate', type=float, default=0.0,
+                        help="share of detail pages redirected to /checkpoint/challenge")
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help="share of requests answered with HTTP 429")
+    parser.add_argument('--max-rps', type=float, default=0.0, help="answer HTTP 429 above this many requests/s")
+    parser.add_argument('--retry-after', type=int, default=5, help="Retry-After seconds sent with HTTP 429")
+    parser.add_argument('--total-results', type=int, default=DEFAULT_TOTAL_RESULTS, help="cards across all pages")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    config = StandInConfig(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, authwall_rate=args.authwall_rate,
+        checkpoint_rate=args.checkpoint_rate, throttle_rate=args.throttle_rate,
+        max_requests_per_second=args.max_rps, retry_after=args.retry_after,
+        total_results=args.total_results, seed=args.seed,
+    )
+    server = StandInServer(config, host=args.host, port=args.port).start()
+    print(f"🧪 LinkedIn stand-in serving {len(server._cards)} cards at {server.base_url}")
+    print(f"   export LINKEDIN_BASE_URL={server.base_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print(f"\n📊 {json.dumps(server.snapshot(), indent=2)}")
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
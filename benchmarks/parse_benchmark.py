@@ -0,0 +1,201 @@
+"""Offline benchmark for the scraper's parsing stages.
+
+Replays the saved LinkedIn HTML fixtures, plus synthetic pages with 10x and 100x the
+cards, through card parsing (``card_parser.parse_job_cards``) and description handling
+(``clean_description_text`` + ``validate_description_quality``). Reports pages/s, cards/s
+and peak memory, and compares throughput against a stored baseline.
+
+Usage (from the repository root):
+    python benchmarks/parse_benchmark.py                   # run and compare with the baseline
+    python benchmarks/parse_benchmark.py --update-baseline # run and store a new baseline
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from card_parser import parse_job_cards  # noqa: E402
+from description_text import clean_description_text, validate_description_quality  # noqa: E402
+from linkedin_guest import extract_description  # noqa: E402
+
+FIXTURES = [
+    "linkedin_initial_page.html",
+    "linkedin_after_expansion.html",
+    "linkedin_search_results.html",
+]
+SCALE_FACTORS = [10, 100]
+SCALE_SOURCE = "linkedin_initial_page.html"
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parse_baseline.json")
+DEFAULT_TOLERANCE = 0.25  # Flag a regression when throughput drops by more than this fraction
+MIN_RUN_SECONDS = 0.5
+MIN_RUNS = 3
+
+_CARD_PATTERN = re.compile(r'<div class="base-card\b.*?(?=<div class="base-card\b|</ul>)', re.DOTALL)
+_JOB_ID_PATTERN = re.compile(r'(?<=\D)(\d{9,10})(?=\D)')
+
+
+def _read_fixture(name: str) -> str:
+    with open(os.path.join(ROOT, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def build_scaled_page(page: str, factor: int) -> str:
+    """Returns ``page`` with its cards repeated ``factor`` times, each copy with fresh job IDs."""
+    cards = _CARD_PATTERN.findall(page)
+    extra = []
+    for copy in range(1, factor):
+        for card in cards:
+            extra.append(_JOB_ID_PATTERN.sub(lambda m: str(int(m.group(1)) + copy * 10_000_000_000), card))
+    insert_at = page.rfind("</body>")
+    insert_at = insert_at if insert_at != -1 else len(page)
+    return page[:insert_at] + "<ul>" + "".join(extra) + "</ul>" + page[insert_at:]
+
+
+def _quiet(func, *args, **kwargs):
+    """Runs ``func`` with stdout silenced (the parsers print progress for every page)."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def _time_runs(func) -> tuple:
+    """Runs ``func`` until both MIN_RUNS and MIN_RUN_SECONDS are reached. Returns (runs, seconds)."""
+    runs = 0
+    started = time.perf_counter()
+    while True:
+        func()
+        runs += 1
+        elapsed = time.perf_counter() - started
+        if runs >= MIN_RUNS and elapsed >= MIN_RUN_SECONDS:
+            return runs, elapsed
+
+
+def _peak_memory(func) -> int:
+    """Peak Python heap use of one call. lxml's own C allocations are not traced."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def build_cases() -> dict:
+    """Maps case names to page HTML: the fixtures as saved plus the scaled synthetic pages."""
+    cases = {name: _read_fixture(name) for name in FIXTURES}
+    source = cases[SCALE_SOURCE]
+    for factor in SCALE_FACTORS:
+        cases[f"synthetic_{factor}x"] = build_scaled_page(source, factor)
+    return cases
+
+
+def load_descriptions(cases: dict) -> list:
+    """Job descriptions found in the fixtures, used as input for the description stage."""
+    descriptions = []
+    for name in FIXTURES:
+        text = _quiet(extract_description, cases[name])
+        if text:
+            descriptions.append(text)
+    if not descriptions:
+        raise SystemExit("No job description found in the fixtures.")
+    return descriptions
+
+
+def run_benchmarks() -> dict:
+    cases = build_cases()
+    descriptions = load_descriptions(cases)
+    results = {}
+    for name, page in cases.items():
+        _, card_count, _ = _quiet(parse_job_cards, page, name)
+        runs, seconds = _time_runs(lambda: _quiet(parse_job_cards, page, name))
+        parse_memory = _peak_memory(lambda: _quiet(parse_job_cards, page, name))
+
+        # Every card gets a description, cycled from the fixture ones
+        page_descriptions = [descriptions[i % len(descriptions)] for i in range(max(card_count, 1))]
+
+        def process_descriptions():
+            for text in page_descriptions:
+                validate_description_quality(clean_description_text(text), name, verbose=False)
+
+        desc_runs, desc_seconds = _time_runs(process_descriptions)
+        desc_memory = _peak_memory(process_descriptions)
+
+        results[name] = {
+            'page_bytes': len(page.encode('utf-8')),
+            'cards': card_count,
+            'parse_pages_per_s': runs / seconds,
+            'parse_cards_per_s': runs * card_count / seconds,
+            'parse_peak_memory_bytes': parse_memory,
+            'descriptions_per_s': desc_runs * len(page_descriptions) / desc_seconds,
+            'descriptions_peak_memory_bytes': desc_memory,
+        }
+    return results
+
+
+def compare_with_baseline(results: dict, baseline: dict, tolerance: float) -> list:
+    """Returns a list of human-readable regressions (throughput metrics only)."""
+    regressions = []
+    for name, metrics in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        for metric in ('parse_pages_per_s', 'parse_cards_per_s', 'descriptions_per_s'):
+            before, now = previous.get(metric), metrics[metric]
+            if before and now < before * (1 - tolerance):
+                regressions.append(f"{name}: {metric} {now:,.1f} vs baseline {before:,.1f} ({now / before - 1:+.0%})")
+    return regressions
+
+
+def print_report(results: dict):
+    header = f"{'case':<32}{'KB':>8}{'cards':>8}{'pages/s':>12}{'cards/s':>14}{'parse MB':>10}{'desc/s':>12}{'desc MB':>9}"
+    print(header)
+    print("-" * len(header))
+    for name, m in results.items():
+        print(
+            f"{name:<32}{m['page_bytes'] / 1024:>8.0f}{m['cards']:>8}{m['parse_pages_per_s']:>12,.1f}"
+            f"{m['parse_cards_per_s']:>14,.0f}{m['parse_peak_memory_bytes'] / 2**20:>10.1f}"
+            f"{m['descriptions_per_s']:>12,.0f}{m['descriptions_peak_memory_bytes'] / 2**20:>9.1f}"
+        )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--update-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed throughput drop before a regression is reported (default 0.25)")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks()
+    print_report(results)
+
+    if args.update_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+        print(f"\n💾 Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\nⓘ No baseline found. Run with --update-baseline to create one.")
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(results, baseline, args.tolerance)
+    if regressions:
+        print("\n❌ Regressions against baseline:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\n✅ No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
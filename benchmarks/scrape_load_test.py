@@ -0,0 +1,109 @@
+"""End-to-end load test of a scraper against the local LinkedIn stand-in.
+
+Starts ``linkedin_standin.StandInServer``, points LINKEDIN_BASE_URL at it, then runs
+``--scrapes`` searches with ``--concurrency`` at a time through one of the scrapers:
+
+    guest     web_scraper.iter_scrape_linkedin (guest fragment endpoint over HTTP)
+    selenium  scraper.iter_scrape_linkedin (search page and detail pages in Chrome,
+              static detail fetch first); needs chromedriver at scraper.CHROMEDRIVER_PATH
+
+Reports scrapes/s, jobs/s, errors and the server's peak concurrent requests.
+
+    python benchmarks/scrape_load_test.py --scraper guest --scrapes 8 --concurrency 4 --latency 0.1
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from linkedin_standin import StandInConfig, StandInServer  # noqa: E402
+
+
+def _events_factory(scraper: str):
+    # Imported only once LINKEDIN_BASE_URL is set, since the scrapers read it at import time.
+    if scraper == "selenium":
+        from scraper import iter_scrape_linkedin
+
+        def events(job_title, location):
+            return iter_scrape_linkedin(job_title, location, use_cache=False)
+        return events
+
+    from web_scraper import iter_scrape_linkedin
+
+    def events(job_title, location):
+        return iter_scrape_linkedin(job_title, location)
+    return events
+
+
+def run_scrape(events_factory, job_title: str, location: str) -> dict:
+    from scrape_events import JobFound, ScrapeError
+
+    started = time.perf_counter()
+    jobs = 0
+    error = None
+    for event in events_factory(job_title, location):
+        if isinstance(event, JobFound):
+            jobs += 1
+        elif isinstance(event, ScrapeError):
+            error = event.message
+    return {'jobs': jobs, 'error': error, 'seconds': time.perf_counter() - started}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scraper', choices=("guest", "selenium"), default="guest")
+    parser.add_argument('--scrapes', type=int, default=4, help="number of searches to run")
+    parser.add_argument('--concurrency', type=int, default=2, help="searches running at the same time")
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--authwall-rate', type=float, default=0.0)
+    parser.add_argument('--checkpoint-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--max-rps', type=float, default=0.0)
+    parser.add_argument('--total-results', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--verbose', action='store_true', help="show the scrapers' own output")
+    args = parser.parse_args(argv)
+
+    config = StandInConfig(
+        latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, authwall_rate=args.authwall_rate,
+        checkpoint_rate=args.checkpoint_rate, throttle_rate=args.throttle_rate,
+        max_requests_per_second=args.max_rps, total_results=args.total_results, seed=args.seed,
+    )
+    with StandInServer(config) as server:
+        os.environ["LINKEDIN_BASE_URL"] = server.base_url
+        events_factory = _events_factory(args.scraper)
+        print(f"🧪 {args.scrapes} {args.scraper} scrapes, {args.concurrency} at a time, against {server.base_url}")
+
+        started = time.perf_counter()
+        # Silenced once around all scrapes: redirect_stdout swaps the global sys.stdout, so
+        # entering and leaving it from the concurrent scrapes would lose the report below.
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+        with output, ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            results = list(executor.map(
+                lambda i: run_scrape(events_factory, f"Software Engineer {i}", "Canada"),
+                range(args.scrapes)))
+        elapsed = time.perf_counter() - started
+        server_stats = server.snapshot()
+
+    jobs = sum(result['jobs'] for result in results)
+    errors = [result['error'] for result in results if result['error']]
+    slowest = max(result['seconds'] for result in results) if results else 0.0
+    print(f"⏱️ {elapsed:.2f} s total, slowest scrape {slowest:.2f} s")
+    print(f"📈 {args.scrapes / elapsed:.2f} scrapes/s, {jobs / elapsed:.1f} jobs/s ({jobs} jobs)")
+    print(f"❌ {len(errors)} failed scrapes" + (f", first error: {errors[0]}" if errors else ""))
+    print(f"📊 Server: {json.dumps(server_stats, indent=2, sort_keys=True)}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+import re
+import time
+
+from job_ids import extract_job_id
+
+# lxml is much faster than the pure-Python html.parser; BeautifulSoup is the fallback.
+try:
+    from lxml import etree, html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# --- Job card extraction ---
+# Search pages and guest fragments both render results as ``base-card`` elements.
+# Cards from the search list use ``base-search-card__*`` classes, cards from the
+# "similar jobs" module use ``base-main-card__*``.
+
+_MASKED_TEXT = re.compile(r'\*+')
+_WHITESPACE = re.compile(r'\s+')
+_TITLE_CLASSES = ('base-search-card__title', 'base-main-card__title')
+_SUBTITLE_CLASSES = ('base-search-card__subtitle', 'base-main-card__subtitle')
+_LINK_CLASS = 'base-card__full-link'
+
+
+def _class_test(class_name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+if lxml_html is not None:
+    _CARD_XPATH = etree.XPath(f"//div[{_class_test('base-card')}]")
+    _TITLE_XPATH = etree.XPath(f".//h3[{' or '.join(_class_test(c) for c in _TITLE_CLASSES)}]")
+    _SUBTITLE_XPATH = etree.XPath(f".//h4[{' or '.join(_class_test(c) for c in _SUBTITLE_CLASSES)}]")
+    _LINK_XPATH = etree.XPath(f".//a[{_class_test(_LINK_CLASS)}]")
+
+
+def _clean_text(text: str) -> str:
+    return _WHITESPACE.sub(' ', text or '').strip()
+
+
+def _build_job(title_text: str, company_text: str, anchor_text: str, href: str, urn: str):
+    # Fallback: sometimes the <h4> contains only ***** but the nested <a> has the real name
+    if _MASKED_TEXT.fullmatch(company_text) and anchor_text:
+        company_text = anchor_text
+
+    # Skip results clearly masked (company or title are only asterisks)
+    if not title_text or not company_text or _MASKED_TEXT.fullmatch(title_text) or _MASKED_TEXT.fullmatch(company_text):
+        return None
+
+    return {
+        'job_id': extract_job_id(href) or extract_job_id(urn or ''),
+        'job_title': title_text,
+        'company_name': company_text,
+        'application_link': href,
+        'source_site': 'LinkedIn'
+    }
+
+
+def _parse_with_lxml(page: str) -> tuple:
+    root = lxml_html.fromstring(page)
+    cards = _CARD_XPATH(root)
+    jobs = []
+    for card in cards:
+        titles, subtitles, links = _TITLE_XPATH(card), _SUBTITLE_XPATH(card), _LINK_XPATH(card)
+        if not (titles and subtitles and links and links[0].get('href')):
+            continue
+        anchors = subtitles[0].findall('.//a')
+        job = _build_job(
+            _clean_text(titles[0].text_content()),
+            _clean_text(subtitles[0].text_content()),
+            _clean_text(anchors[0].text_content()) if anchors else '',
+            links[0].get('href'),
+            card.get('data-entity-urn'),
+        )
+        if job:
+            jobs.append(job)
+    return jobs, len(cards)
+
+
+def _is_card_class(value) -> bool:
+    classes = value.split() if isinstance(value, str) else (value or [])
+    return 'base-card' in classes
+
+
+def _parse_with_soup(page: str) -> tuple:
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    # Only build the tree for the card subtrees
+    soup = BeautifulSoup(page, 'html.parser', parse_only=SoupStrainer('div', class_=_is_card_class))
+    cards = soup.find_all('div', class_='base-card')
+    jobs = []
+    for card in cards:
+        title_elem = card.find('h3', class_=_TITLE_CLASSES)
+        company_elem = card.find('h4', class_=_SUBTITLE_CLASSES)
+        link_elem = card.find('a', class_=_LINK_CLASS)
+        if not all([title_elem, company_elem, link_elem]) or not link_elem.get('href'):
+            continue
+        anchor = company_elem.find('a')
+        job = _build_job(
+            _clean_text(title_elem.get_text(' ')),
+            _clean_text(company_elem.get_text(' ')),
+            _clean_text(anchor.get_text(' ')) if anchor else '',
+            link_elem['href'],
+            card.get('data-entity-urn'),
+        )
+        if job:
+            jobs.append(job)
+    return jobs, len(cards)
+
+
+def parse_job_cards(page, label: str = "page") -> tuple:
+    """Extracts job dicts from a search page or guest search fragment.
+
+    Returns ``(jobs, card_count, parse_seconds)``; ``card_count`` includes cards that were
+    incomplete or masked. The parse time is printed for every page.
+    """
+    if isinstance(page, bytes):
+        page = page.decode('utf-8', errors='replace')
+    started = time.perf_counter()
+    if not page.strip():
+        return [], 0, 0.0
+    if lxml_html is not None:
+        jobs, card_count = _parse_with_lxml(page)
+        parser = 'lxml'
+    else:
+        jobs, card_count = _parse_with_soup(page)
+        parser = 'html.parser'
+    elapsed = time.perf_counter() - started
+    print(f"⏱️ Parsed {card_count} cards from {label} in {elapsed * 1000:.1f} ms ({parser})")
+    return jobs, card_count, elapsed
@@ -1,6 +1,8 @@
 import streamlit as st
 # --- Continuous Scraping Configuration ---
 SCRAPING_INTERVAL_MINUTES = 15 # The time in minutes between each scrape
+RUN_SEARCH_SCHEDULER_IN_APP = True # Set to False when search_scheduler.py runs as its own process
+RUN_SCRAPE_WORKER_IN_APP = True # Set to False when manual searches are run by scrape_worker.py processes
 
 # OpenAI API Key
 #OPENAI_API_KEY = "YOUR_OPENAI_API_KEY_HERE"
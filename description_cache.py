@@ -0,0 +1,107 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# --- Description cache configuration ---
+DESCRIPTION_CACHE_PATH = os.getenv("DESCRIPTION_CACHE_PATH", os.path.join(".cache", "descriptions.sqlite3"))
+DESCRIPTION_CACHE_TTL_SECONDS = 7 * 24 * 3600  # LinkedIn postings rarely change once published
+DESCRIPTION_CACHE_MAX_ENTRIES = 20000  # Least recently used entries are evicted beyond this
+
+
+class DescriptionCache:
+    """A SQLite-backed cache of cleaned job descriptions keyed by LinkedIn job ID.
+
+    Entries expire after ``ttl_seconds`` and the least recently used ones are evicted
+    once the cache holds more than ``max_entries``. Safe to share between threads.
+    """
+
+    def __init__(self, path: str = DESCRIPTION_CACHE_PATH, ttl_seconds: float = DESCRIPTION_CACHE_TTL_SECONDS,
+                 max_entries: int = DESCRIPTION_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS descriptions (
+                job_id TEXT PRIMARY KEY,
+                description TEXT NOT NULL,
+                quality TEXT,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_descriptions_last_access ON descriptions (last_access)")
+
+    def get(self, job_id: str):
+        """Returns ``{'description', 'quality', 'fetched_at'}`` for a fresh entry, or None."""
+        if not job_id:
+            return None
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT description, quality, fetched_at FROM descriptions WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[2] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM descriptions WHERE job_id = ?", (job_id,))
+                return None
+            self._conn.execute("UPDATE descriptions SET last_access = ? WHERE job_id = ?", (now, job_id))
+        return {
+            'description': row[0],
+            'quality': json.loads(row[1]) if row[1] else {},
+            'fetched_at': row[2],
+        }
+
+    def put(self, job_id: str, description: str, quality: dict = None):
+        """Stores a cleaned description and its quality metrics, evicting old entries if needed."""
+        if not job_id:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO descriptions (job_id, description, quality, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, description, json.dumps(quality or {}), now, now),
+            )
+            self._evict(now)
+
+    def _evict(self, now: float):
+        self._conn.execute("DELETE FROM descriptions WHERE fetched_at < ?", (now - self.ttl_seconds,))
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM descriptions").fetchone()
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM descriptions WHERE job_id IN "
+                "(SELECT job_id FROM descriptions ORDER BY last_access ASC LIMIT ?)",
+                (count - self.max_entries,),
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM descriptions").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_description_cache() -> DescriptionCache:
+    """Returns the process-wide description cache, opening it on first use."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = DescriptionCache()
+        return _default_cache
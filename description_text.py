@@ -0,0 +1,79 @@
+import re
+
+# Precompiled patterns for description quality checks and cleanup
+_WHITESPACE_RE = re.compile(r'\s+')
+_REQUIREMENTS_RE = re.compile(r'\b(requirements?|qualifications?|skills?|experience)\b')
+_RESPONSIBILITIES_RE = re.compile(r'\b(responsibilities|duties|role|tasks)\b')
+_BENEFITS_RE = re.compile(r'\b(benefits|compensation|salary|perks)\b')
+_COMPANY_INFO_RE = re.compile(r'\b(company|about us|our mission)\b')
+_TRUNCATION_RE = re.compile(r'(\.\.\.|…|show more|voir plus)')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_ARTIFACT_PATTERNS = [
+    re.compile(r'Show more\s*Show less', re.IGNORECASE),
+    re.compile(r'Voir plus\s*Voir moins', re.IGNORECASE),
+]
+
+
+def validate_description_quality(description: str, job_title: str, verbose: bool = True) -> dict:
+    """Enhanced validation of extracted job description quality"""
+    clean_desc = _WHITESPACE_RE.sub(' ', description.lower().strip())
+    quality_metrics = {
+        'length': len(description),
+        'word_count': len(description.split()),
+        'has_requirements': bool(_REQUIREMENTS_RE.search(clean_desc)),
+        'has_responsibilities': bool(_RESPONSIBILITIES_RE.search(clean_desc)),
+        'has_benefits': bool(_BENEFITS_RE.search(clean_desc)),
+        'has_company_info': bool(_COMPANY_INFO_RE.search(clean_desc)),
+        'truncation_indicators': bool(_TRUNCATION_RE.search(clean_desc)),
+        'completeness_score': 0
+    }
+    score = 0
+    
+    # Length scoring
+    if quality_metrics['length'] > 2000:
+        score += 4
+    elif quality_metrics['length'] > 1500:
+        score += 3
+    elif quality_metrics['length'] > 1000:
+        score += 2
+    elif quality_metrics['length'] > 500:
+        score += 1
+    
+    # Content completeness
+    if quality_metrics['has_requirements']:
+        score += 2
+    if quality_metrics['has_responsibilities']:
+        score += 2
+    if quality_metrics['has_benefits']:
+        score += 1
+    if quality_metrics['has_company_info']:
+        score += 1
+    if not quality_metrics['truncation_indicators']:
+        score += 1
+    
+    quality_metrics['completeness_score'] = score
+    
+    if not verbose:
+        return quality_metrics
+
+    # Print quality report
+    print(f"\n📊 QUALITY REPORT for '{job_title}':")
+    print(f"  📏 Length: {quality_metrics['length']} chars, {quality_metrics['word_count']} words")
+    print(f"  ✅ Has requirements: {quality_metrics['has_requirements']}")
+    print(f"  ✅ Has responsibilities: {quality_metrics['has_responsibilities']}")
+    print(f"  ✅ Has benefits: {quality_metrics['has_benefits']}")
+    print(f"  ✅ Has company info: {quality_metrics['has_company_info']}")
+    print(f"  ⚠️ Truncation indicators: {quality_metrics['truncation_indicators']}")
+    print(f"  🎯 Completeness score: {quality_metrics['completeness_score']}/11")
+    
+    return quality_metrics
+
+
+def clean_description_text(description: str) -> str:
+    """Clean and format the extracted description text"""
+    if not description:
+        return ""
+    cleaned = _BLANK_LINES_RE.sub('\n', description).strip()
+    for pattern in _ARTIFACT_PATTERNS:
+        cleaned = pattern.sub('', cleaned)
+    return cleaned.strip()
@@ -0,0 +1,130 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium.common.exceptions import WebDriverException
+
+
+class ChromeDriverPool:
+    """A bounded pool of warm headless Chrome drivers shared by the scraper.
+
+    Drivers are created lazily (up to ``size``), health-checked when borrowed,
+    reset (cookies + storage) when returned, and recycled after ``max_pages``
+    uses or as soon as a WebDriver error escapes a lease.
+    """
+
+    def __init__(self, driver_factory, size: int = 1, max_pages: int = 20, acquire_timeout: float = 120):
+        if size < 1:
+            raise ValueError("Driver pool size must be at least 1.")
+        self._driver_factory = driver_factory
+        self.size = size
+        self.max_pages = max_pages
+        self.acquire_timeout = acquire_timeout
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self.drivers_started = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    @contextmanager
+    def driver(self):
+        """Borrows a healthy driver for the duration of the ``with`` block."""
+        if self._closed:
+            raise RuntimeError("Driver pool is closed.")
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"No Chrome driver became available within {self.acquire_timeout}s.")
+        driver = None
+        try:
+            driver = self._checkout()
+            yield driver
+        except WebDriverException:
+            # The browser crashed or lost its session: never hand it out again.
+            self._discard(driver)
+            driver = None
+            raise
+        finally:
+            if driver is not None:
+                self._checkin(driver)
+            self._slots.release()
+
+    def close(self):
+        """Quits every idle driver. Drivers still on lease are quit when returned."""
+        self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+    def _checkout(self):
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return self._start_driver()
+            if self._is_healthy(driver):
+                return driver
+            print("♻️ Discarding unhealthy Chrome driver from pool.")
+            self._discard(driver)
+
+    def _checkin(self, driver):
+        with self._lock:
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            uses = self._uses[id(driver)]
+        if self._closed or uses >= self.max_pages:
+            if not self._closed:
+                print(f"♻️ Recycling Chrome driver after {uses} pages.")
+            self._discard(driver)
+            return
+        if not self._reset(driver):
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    def _start_driver(self):
+        driver = self._driver_factory()
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self.drivers_started += 1
+        print(f"🚗 Started Chrome driver {self.drivers_started} (pool size {self.size}).")
+        return driver
+
+    def _discard(self, driver):
+        if driver is None:
+            return
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_healthy(driver) -> bool:
+        try:
+            return driver.execute_script("return 1;") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _reset(driver) -> bool:
+        """Clears cookies and web storage so the next job starts from a clean session."""
+        try:
+            driver.delete_all_cookies()
+            driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            print(f"⚠️ Could not reset Chrome driver, discarding it: {e}")
+            return False
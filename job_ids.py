@@ -0,0 +1,41 @@
+import re
+
+_JOB_ID_PATTERNS = [
+    re.compile(r'[?&]currentJobId=(\d+)'),
+    re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d+)(?:[/?#]|$)'),
+    re.compile(r'jobPosting[:/](\d+)'),
+]
+
+
+def extract_job_id(url: str):
+    """Returns LinkedIn's numeric job ID from a job URL, or None if the URL has none."""
+    if not url:
+        return None
+    for pattern in _JOB_ID_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
+
+
+def job_ids_from_links(links) -> set:
+    """Maps a collection of saved job URLs to the set of their LinkedIn job IDs."""
+    return {job_id for job_id in (extract_job_id(link) for link in links or []) if job_id}
+
+
+def is_known_job(job_id, known_job_ids=None, high_water_mark=None) -> bool:
+    """True when ``job_id`` is in ``known_job_ids`` or not newer than ``high_water_mark``.
+
+    LinkedIn job IDs grow over time, so a high-water mark (the largest ID already seen)
+    marks every older posting as known without keeping the full ID set around.
+    """
+    if not job_id:
+        return False
+    if known_job_ids and job_id in known_job_ids:
+        return True
+    if high_water_mark is not None:
+        try:
+            return int(job_id) <= int(high_water_mark)
+        except ValueError:
+            return False
+    return False
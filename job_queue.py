@@ -0,0 +1,156 @@
+import os
+import sqlite3
+import time
+from contextlib import contextmanager
+
+# --- Durable scrape job queue ---
+# Manual searches are queued here by the app and run by scrape_worker.py, so a slow
+# scrape doesn't hold a Streamlit server thread and survives a redeploy of either side.
+# The queue is a SQLite file: the app and the workers must share its filesystem.
+
+SCRAPE_QUEUE_PATH = os.environ.get(
+    "SCRAPE_QUEUE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "scrape_jobs.sqlite3"))
+STALE_JOB_SECONDS = 600  # A running job without a heartbeat this long is assumed lost with its worker
+MAX_JOB_ATTEMPTS = 3  # Lost jobs are re-queued this many times before they are failed
+JOB_RETENTION_SECONDS = 7 * 24 * 3600  # Finished jobs are pruned after a week
+
+JOB_STATUSES = ('queued', 'running', 'done', 'failed')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scrape_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    job_title TEXT NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    last_24_hours INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL DEFAULT 'queued',
+    found_count INTEGER NOT NULL DEFAULT 0,
+    new_count INTEGER NOT NULL DEFAULT 0,
+    duplicate_count INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    worker_id TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    heartbeat_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS scrape_jobs_status_idx ON scrape_jobs (status, id);
+"""
+
+
+class ScrapeJobQueue:
+    """A SQLite-backed queue of manual scrape jobs, with their progress and outcome.
+
+    Safe to share between threads and processes: every call opens its own connection, and
+    claiming a job happens in a write transaction, so each job goes to exactly one worker.
+    Progress and outcome are only recorded while the job is running for the worker that
+    reports them, so a worker whose stale job was re-queued and claimed again can't
+    overwrite the new run.
+    """
+
+    def __init__(self, path: str = SCRAPE_QUEUE_PATH):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")  # Readers (the app polling) don't block the workers
+            conn.executescript(_SCHEMA)
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def enqueue(self, user_id: str, job_title: str, location: str, last_24_hours: bool) -> int:
+        """Queues a search; returns the job ID to poll with ``get``."""
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "INSERT INTO scrape_jobs (user_id, job_title, location, last_24_hours, created_at) VALUES (?, ?, ?, ?, ?)",
+                (user_id, job_title, location or '', int(bool(last_24_hours)), time.time()))
+            return cursor.lastrowid
+
+    def get(self, job_id: int, user_id: str = None):
+        """Returns the job as a dict, or None. Pass ``user_id`` to only see that user's jobs."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM scrape_jobs WHERE id = ?", (int(job_id),)).fetchone()
+        if row is None or (user_id is not None and row['user_id'] != user_id):
+            return None
+        return dict(row)
+
+    def claim(self, worker_id: str):
+        """Marks the oldest queued job as running for this worker and returns it, or None if the queue is empty."""
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute("SELECT * FROM scrape_jobs WHERE status = 'queued' ORDER BY id LIMIT 1").fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                now = time.time()
+                conn.execute(
+                    "UPDATE scrape_jobs SET status = 'running', worker_id = ?, attempts = attempts + 1, "
+                    "started_at = ?, heartbeat_at = ? WHERE id = ?", (worker_id, now, now, row['id']))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return {**dict(row), 'status': 'running', 'worker_id': worker_id, 'attempts': row['attempts'] + 1,
+                'started_at': now, 'heartbeat_at': now}
+
+    def report_progress(self, job_id: int, worker_id: str, found_count: int, new_count: int,
+                        duplicate_count: int) -> bool:
+        """Stores the running counts; doubles as the job's heartbeat.
+
+        Returns False if the job no longer runs for this worker.
+        """
+        with self._connect() as conn:
+            return conn.execute(
+                "UPDATE scrape_jobs SET found_count = ?, new_count = ?, duplicate_count = ?, heartbeat_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (found_count, new_count, duplicate_count, time.time(), job_id, worker_id)).rowcount == 1
+
+    def complete(self, job_id: int, worker_id: str, found_count: int, new_count: int, duplicate_count: int) -> bool:
+        """Marks the job done. Returns False if the job no longer runs for this worker."""
+        with self._connect() as conn:
+            return conn.execute(
+                "UPDATE scrape_jobs SET status = 'done', found_count = ?, new_count = ?, duplicate_count = ?, "
+                "error = NULL, finished_at = ? WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (found_count, new_count, duplicate_count, time.time(), job_id, worker_id)).rowcount == 1
+
+    def fail(self, job_id: int, worker_id: str, error: str) -> bool:
+        """Marks the job failed. Returns False if the job no longer runs for this worker."""
+        with self._connect() as conn:
+            return conn.execute(
+                "UPDATE scrape_jobs SET status = 'failed', error = ?, finished_at = ? "
+                "WHERE id = ? AND worker_id = ? AND status = 'running'",
+                (error, time.time(), job_id, worker_id)).rowcount == 1
+
+    def recover_stale_jobs(self, stale_seconds: float = STALE_JOB_SECONDS) -> int:
+        """Re-queues running jobs whose worker stopped sending heartbeats; fails those out of attempts.
+
+        Returns the number of jobs recovered.
+        """
+        cutoff = time.time() - stale_seconds
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                requeued = conn.execute(
+                    "UPDATE scrape_jobs SET status = 'queued', worker_id = NULL "
+                    "WHERE status = 'running' AND heartbeat_at < ? AND attempts < ?", (cutoff, MAX_JOB_ATTEMPTS)).rowcount
+                conn.execute(
+                    "UPDATE scrape_jobs SET status = 'failed', error = 'The scrape worker stopped responding.', "
+                    "finished_at = ? WHERE status = 'running' AND heartbeat_at < ?", (time.time(), cutoff))
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return requeued
+
+    def prune(self, retention_seconds: float = JOB_RETENTION_SECONDS) -> int:
+        """Deletes finished jobs older than the retention period; returns how many."""
+        with self._connect() as conn:
+            return conn.execute("DELETE FROM scrape_jobs WHERE status IN ('done', 'failed') AND finished_at < ?",
+                                (time.time() - retention_seconds,)).rowcount
@@ -0,0 +1,148 @@
+import os
+import threading
+import time
+from urllib.parse import urlencode
+
+import requests
+from bs4 import BeautifulSoup
+
+from card_parser import parse_job_cards
+from job_ids import extract_job_id, is_known_job, job_ids_from_links
+
+# --- LinkedIn guest (logged-out) endpoints ---
+# Both scrapers build their URLs from this base. Set LINKEDIN_BASE_URL before the scrapers
+# are imported to point them at a stand-in server (see benchmarks/linkedin_standin.py).
+LINKEDIN_BASE_URL = os.environ.get("LINKEDIN_BASE_URL", "https://www.linkedin.com").rstrip("/")
+SEARCH_PAGE_URL = f"{LINKEDIN_BASE_URL}/jobs/search/"
+# The guest job-posting endpoint returns the server-rendered detail page fragment,
+# which already contains the full description markup.
+GUEST_JOB_POSTING_URL = LINKEDIN_BASE_URL + "/jobs-guest/jobs/api/jobPosting/{job_id}"
+# The guest search fragment endpoint is offset based (``start``) and returns bare
+# ``base-card`` list items, without the rest of the search page.
+GUEST_SEARCH_URL = f"{LINKEDIN_BASE_URL}/jobs-guest/jobs/api/seeMoreJobPostings/search"
+
+SEARCH_PAGE_SIZE = 10  # Cards LinkedIn returns per fragment page
+SEARCH_MAX_RESULTS = 100
+SEARCH_PAGE_DELAY = 1.0  # Seconds between two page requests
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+REQUEST_TIMEOUT = 10
+
+# Selectors tried in order to locate the job description, shared with the Selenium scraper.
+DESCRIPTION_SELECTORS = [
+    ".show-more-less-html__markup", ".jobs-description-content__text", ".jobs-box__html-content",
+    ".jobs-description__content", ".description__text", "[data-job-description]",
+    ".jobs-description", ".job-description"
+]
+MIN_DESCRIPTION_LENGTH = 50
+
+_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """Returns a keep-alive HTTP session private to the calling thread."""
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        _local.session = session
+    return session
+
+
+def extract_description(html: str) -> str:
+    """Finds the description in static job page HTML using the same selectors as the browser path."""
+    soup = BeautifulSoup(html, 'html.parser')
+    for selector in DESCRIPTION_SELECTORS:
+        elements = soup.select(selector)
+        if not elements:
+            continue
+        # Find the element with the most text, as it's likely the main description
+        texts = [element.get_text(separator='\n', strip=True) for element in elements]
+        best_text = max(texts, key=len)
+        if len(best_text) > MIN_DESCRIPTION_LENGTH:
+            print(f"✅ Found static description using: {selector}")
+            return best_text
+    return ""
+
+
+def build_search_params(job_title: str, location: str, last_24_hours: bool = False, start: int = 0) -> dict:
+    """Query parameters shared by the search page and the guest search fragment endpoint."""
+    params = {
+        'keywords': f"{job_title} internship",
+        'location': location,
+        'sortBy': 'R',
+    }
+    if last_24_hours:
+        params['f_TPR'] = 'r86400'  # Only jobs posted in the last 24 hours
+    if start:
+        params['start'] = start
+    return params
+
+
+def iter_guest_search(job_title: str, location: str, last_24_hours: bool = False,
+                      page_size: int = SEARCH_PAGE_SIZE, max_results: int = SEARCH_MAX_RESULTS,
+                      known_job_ids=None, high_water_mark=None, page_delay: float = SEARCH_PAGE_DELAY,
+                      timeout: float = REQUEST_TIMEOUT):
+    """Yields job dicts page by page from the guest search fragment endpoint.
+
+    Each page is requested at offset ``start`` (advancing by ``page_size``) and parsed as
+    soon as it arrives. Pagination stops at ``max_results`` jobs, at a short or empty page,
+    or when every job on a page is already known. Known jobs are never yielded.
+    Request failures are raised as ``requests.exceptions.RequestException``.
+    """
+    session = get_session()
+    seen_ids = set()
+    yielded = 0
+    start = 0
+    while yielded < max_results:
+        if start:
+            time.sleep(page_delay)
+        url = f"{GUEST_SEARCH_URL}?{urlencode(build_search_params(job_title, location, last_24_hours, start))}"
+        response = session.get(url, timeout=timeout)
+        response.raise_for_status()
+        jobs, card_count, _ = parse_job_cards(response.content, label=f"search page at offset {start}")
+        if card_count == 0:
+            return
+
+        new_on_page = 0
+        for job in jobs:
+            job_id = job['job_id']
+            if job_id and job_id in seen_ids:
+                continue
+            seen_ids.add(job_id)
+            if is_known_job(job_id, known_job_ids, high_water_mark):
+                continue
+            new_on_page += 1
+            yield job
+            yielded += 1
+            if yielded >= max_results:
+                return
+
+        if (known_job_ids or high_water_mark is not None) and new_on_page == 0:
+            print("Page results are all already known, stopping.")
+            return
+        if card_count < page_size:
+            return
+        start += page_size
+
+
+def fetch_description_http(job_url: str, timeout: float = REQUEST_TIMEOUT) -> str:
+    """Fetches a job description without a browser.
+
+    Returns an empty string when the job ID cannot be determined, the request fails
+    or the static HTML has no description, so the caller can fall back to Selenium.
+    """
+    job_id = extract_job_id(job_url)
+    url = GUEST_JOB_POSTING_URL.format(job_id=job_id) if job_id else job_url
+    try:
+        response = get_session().get(url, timeout=timeout, allow_redirects=False)
+        if response.status_code != 200:
+            print(f"ⓘ Static fetch returned HTTP {response.status_code} for {url}")
+            return ""
+    except requests.exceptions.RequestException as e:
+        print(f"ⓘ Static fetch failed for {url}: {e}")
+        return ""
+    return extract_description(response.text)
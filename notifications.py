@@ -1,15 +1,236 @@
-import telegram
 import asyncio
+import atexit
+import threading
+import time
+
+import telegram
+from telegram.error import BadRequest, NetworkError, RetryAfter, TelegramError
+
+# --- Telegram notification dispatch ---
+# Messages are queued and sent from one long-lived event loop thread that keeps one Bot
+# per token. Bursts to the same chat are merged into digest messages, and sends are paced
+# to stay within Telegram's per-chat and per-bot limits. Messages are sent as HTML, so
+# callers escape any user or job text they put in them.
+
+MAX_MESSAGE_LENGTH = 4096  # Telegram's limit for one message
+DIGEST_WINDOW_SECONDS = 2.0  # Messages to a chat arriving this close together are merged
+DIGEST_SEPARATOR = "\n\n"
+CHAT_MIN_INTERVAL_SECONDS = 1.0  # Telegram allows about one message per second per chat
+BOT_MESSAGES_PER_SECOND = 25  # Telegram allows about 30 messages per second per bot
+MAX_SEND_ATTEMPTS = 3
+
+
+def safe_cut(text: str, limit: int) -> int:
+    """The longest prefix length of at most ``limit`` that doesn't end inside an HTML tag or entity."""
+    head = text[:limit]
+    cut = limit
+    amp = head.rfind('&')
+    if amp != -1 and ';' not in head[amp:]:
+        cut = amp
+    lt = head.rfind('<')
+    if lt != -1 and '>' not in head[lt:]:
+        cut = min(cut, lt)
+    # A broken tag or entity is still better than making no progress
+    return cut or limit
+
+
+def split_message(message: str) -> list:
+    """Splits a message longer than MAX_MESSAGE_LENGTH into parts at line breaks.
+
+    A single line that is too long on its own is cut, but never inside an HTML tag or entity.
+    """
+    if len(message) <= MAX_MESSAGE_LENGTH:
+        return [message]
+    parts = []
+    current = ""
+    for line in message.splitlines(keepends=True):
+        if current and len(current) + len(line) > MAX_MESSAGE_LENGTH:
+            parts.append(current)
+            current = ""
+        while len(line) > MAX_MESSAGE_LENGTH:
+            cut = safe_cut(line, MAX_MESSAGE_LENGTH)
+            parts.append(line[:cut])
+            line = line[cut:]
+        current += line
+    parts.append(current)
+    # Telegram rejects empty messages
+    return [part for part in parts if part.strip()]
+
+
+def pack_digests(messages) -> list:
+    """Groups messages, in order, into as few digests of at most MAX_MESSAGE_LENGTH characters as possible.
+
+    Returns each digest as the list of its parts; messages that are too long on their own
+    are split first. Join a digest's parts with DIGEST_SEPARATOR to get its text.
+    """
+    digests = []
+    current = []
+    length = 0
+    for message in (part for message in messages for part in split_message(message)):
+        if current and length + len(DIGEST_SEPARATOR) + len(message) > MAX_MESSAGE_LENGTH:
+            digests.append(current)
+            current = []
+        length = length + len(DIGEST_SEPARATOR) + len(message) if current else len(message)
+        current.append(message)
+    if current:
+        digests.append(current)
+    return digests
+
+
+def build_digests(messages) -> list:
+    """The texts of ``pack_digests(messages)``."""
+    return [DIGEST_SEPARATOR.join(parts) for parts in pack_digests(messages)]
+
+
+class NotificationDispatcher:
+    """Queues Telegram messages and delivers them from a background event loop."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._loop = None
+        # The following are only touched on the loop thread
+        self._bots = {}
+        self._queues = {}
+        self._senders = {}
+        self._next_chat_send = {}
+        self._next_bot_send = {}
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="telegram-notifications", daemon=True).start()
+            return self._loop
+
+    def submit(self, message: str, telegram_bot_token: str, telegram_chat_id):
+        """Queues a message; returns immediately."""
+        loop = self._ensure_loop()
+        with self._lock:
+            self._pending += 1
+        loop.call_soon_threadsafe(self._enqueue, telegram_bot_token, str(telegram_chat_id), message)
+
+    def flush(self, timeout: float = None) -> bool:
+        """Waits until every queued message was sent or given up on. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def _finished(self, count: int):
+        with self._idle:
+            self._pending -= count
+            self._idle.notify_all()
+
+    def _enqueue(self, token: str, chat_id: str, message: str):
+        key = (token, chat_id)
+        self._queues.setdefault(key, []).append(message)
+        if key not in self._senders:
+            self._senders[key] = self._loop.create_task(self._run_chat(key))
+
+    async def _run_chat(self, key):
+        """Sends everything queued for one chat, merging messages that arrive in bursts."""
+        token, chat_id = key
+        try:
+            while self._queues.get(key):
+                await asyncio.sleep(DIGEST_WINDOW_SECONDS)  # Let the rest of a burst arrive
+                batch = self._queues.pop(key, [])
+                try:
+                    for parts in pack_digests(batch):
+                        await self._send_digest(token, chat_id, parts)
+                finally:
+                    self._finished(len(batch))
+        finally:
+            del self._senders[key]
+            if self._queues.get(key):
+                # Messages arrived while this sender was finishing
+                self._senders[key] = self._loop.create_task(self._run_chat(key))
+
+    async def _get_bot(self, token: str):
+        bot = self._bots.get(token)
+        if bot is None:
+            bot = telegram.Bot(token=token)
+            await bot.initialize()
+            self._bots[token] = bot
+        return bot
+
+    async def _wait_for_slot(self, token: str, chat_id: str):
+        """Sleeps until both the chat and the bot may send again, and reserves that slot."""
+        now = time.monotonic()
+        start_at = max(now, self._next_chat_send.get((token, chat_id), now), self._next_bot_send.get(token, now))
+        self._next_chat_send[(token, chat_id)] = start_at + CHAT_MIN_INTERVAL_SECONDS
+        self._next_bot_send[token] = max(self._next_bot_send.get(token, now), start_at) + 1.0 / BOT_MESSAGES_PER_SECOND
+        if start_at > now:
+            await asyncio.sleep(start_at - now)
+
+    def _back_off(self, token: str, chat_id: str, seconds: float, bot_wide: bool = False):
+        """Holds back the chat's next send, and with ``bot_wide`` every chat's sends through this bot."""
+        until = time.monotonic() + seconds
+        self._next_chat_send[(token, chat_id)] = max(self._next_chat_send.get((token, chat_id), 0), until)
+        if bot_wide:
+            self._next_bot_send[token] = max(self._next_bot_send.get(token, 0), until)
+
+    async def _send_digest(self, token: str, chat_id: str, parts: list) -> bool:
+        """Sends a digest; if Telegram rejects it, sends its parts one by one so one bad message doesn't sink the rest."""
+        try:
+            return await self._send(token, chat_id, DIGEST_SEPARATOR.join(parts))
+        except BadRequest as e:
+            print(f"Error sending Telegram notification: {e}")
+            if len(parts) == 1:
+                return False
+        print(f"Sending the {len(parts)} messages of the rejected digest one by one.")
+        sent = True
+        for part in parts:
+            try:
+                sent = await self._send(token, chat_id, part) and sent
+            except BadRequest as e:
+                print(f"Error sending Telegram notification: {e}")
+                sent = False
+        return sent
+
+    async def _send(self, token: str, chat_id: str, text: str) -> bool:
+        """Sends one message, retrying flood waits and network errors. Raises ``BadRequest`` if Telegram rejects it."""
+        for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+            try:
+                bot = await self._get_bot(token)
+                await self._wait_for_slot(token, chat_id)
+                await bot.send_message(chat_id=chat_id, text=text, parse_mode='HTML')
+                print(f"Successfully sent notification to chat ID ending in ...{chat_id[-4:]}")
+                return True
+            except BadRequest:
+                # A subclass of NetworkError, but retrying the same text won't help
+                raise
+            except RetryAfter as e:
+                retry_after = e.retry_after
+                seconds = retry_after.total_seconds() if hasattr(retry_after, 'total_seconds') else float(retry_after)
+                print(f"Telegram rate limit hit, retrying in {seconds:.0f}s.")
+                # A flood limit applies to the bot, so the other chats wait too
+                self._back_off(token, chat_id, seconds, bot_wide=True)
+            except NetworkError as e:
+                print(f"Network error sending Telegram notification (attempt {attempt}): {e}")
+                self._back_off(token, chat_id, 2 ** attempt)
+            except TelegramError as e:
+                print(f"Error sending Telegram notification: {e}")
+                return False
+        print(f"Error sending Telegram notification: gave up after {MAX_SEND_ATTEMPTS} attempts.")
+        return False
+
+
+_dispatcher = NotificationDispatcher()
+# Give queued messages a chance to go out when a script exits
+atexit.register(_dispatcher.flush, 10)
+
 
 def send_telegram_notification(message, telegram_bot_token, telegram_chat_id):
+    """Queues a Telegram message for delivery; bursts to one chat are merged into digests.
+
+    The message is HTML: escape any user or job text in it with ``html.escape``.
+    """
     if not all([telegram_bot_token, telegram_chat_id]):
         print("Error: Telegram credentials not configured.")
         return
+    _dispatcher.submit(message, telegram_bot_token, telegram_chat_id)
+
 
-    try:
-        bot = telegram.Bot(token=telegram_bot_token)
-        # Always use asyncio for python-telegram-bot v20+
-        asyncio.run(bot.send_message(chat_id=telegram_chat_id, text=message, parse_mode='HTML'))
-        print(f"Successfully sent notification to chat ID ending in ...{str(telegram_chat_id)[-4:]}")
-    except Exception as e:
-        print(f"Error sending Telegram notification: {e}")
\ No newline at end of file
+def flush_notifications(timeout: float = None) -> bool:
+    """Waits until all queued notifications were delivered (or given up on)."""
+    return _dispatcher.flush(timeout)
@@ -0,0 +1,78 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+class HostThrottle:
+    """Caps concurrent requests per host and paces their starts to a per-host rate.
+
+    Each of a host's ``per_host_limit`` slots waits ``politeness_delay`` seconds between
+    requests, so the host sees at most ``per_host_limit`` request starts per
+    ``politeness_delay`` seconds, spread evenly.
+    """
+
+    def __init__(self, per_host_limit: int = 2, politeness_delay: float = 1.0):
+        if per_host_limit < 1:
+            raise ValueError("per_host_limit must be at least 1.")
+        self.per_host_limit = per_host_limit
+        self.politeness_delay = politeness_delay
+        self._start_interval = politeness_delay / per_host_limit
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._next_start = {}
+
+    @contextmanager
+    def slot(self, url: str):
+        """Blocks until a request to ``url``'s host may start, and holds the host slot while it runs."""
+        host = urlparse(url).netloc.lower()
+        with self._lock:
+            semaphore = self._semaphores.setdefault(host, threading.BoundedSemaphore(self.per_host_limit))
+        with semaphore:
+            with self._lock:
+                now = time.monotonic()
+                start_at = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start_at + self._start_interval
+            if start_at > now:
+                time.sleep(start_at - now)
+            yield
+
+
+def iter_fetch(items, fetch, url_of, max_workers: int = 4, throttle: HostThrottle = None, on_error=None):
+    """Runs ``fetch(item)`` for every item on a worker pool and yields ``(index, result)`` as each finishes.
+
+    Each call is throttled per host (``url_of(item)`` gives the URL). An exception in one
+    fetch never affects the others: its result is ``on_error(item, exc)`` instead
+    (``None`` when no handler is given). Closing the generator early cancels fetches
+    that have not started yet.
+    """
+    items = list(items)
+    if not items:
+        return
+    throttle = throttle or HostThrottle()
+
+    def run(item):
+        try:
+            with throttle.slot(url_of(item)):
+                return fetch(item)
+        except Exception as e:
+            print(f"❌ Fetch failed for {url_of(item)}: {e}")
+            return on_error(item, e) if on_error else None
+
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items))))
+    try:
+        futures = {executor.submit(run, item): index for index, item in enumerate(items)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def fetch_in_order(items, fetch, url_of, max_workers: int = 4, throttle: HostThrottle = None, on_error=None):
+    """Like ``iter_fetch`` but waits for every fetch and returns the results in input order."""
+    items = list(items)
+    results = [None] * len(items)
+    for index, result in iter_fetch(items, fetch, url_of, max_workers, throttle, on_error):
+        results[index] = result
+    return results
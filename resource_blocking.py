@@ -0,0 +1,152 @@
+import json
+import threading
+
+import trio
+
+# --- Resource blocking for scraper Chrome sessions ---
+# The scraper only reads DOM text, so images, media, fonts and stylesheets are blocked by
+# CDP resource type: Fetch interception fails those requests before they are sent, whatever
+# their URL looks like (LinkedIn's static assets mostly have no file extension). Third-party
+# trackers are blocked by URL. Image loading is also switched off in Chrome's settings, so
+# images stay blocked if the interception can't be set up.
+
+BLOCKED_CONTENT_SETTINGS = {
+    'profile.managed_default_content_settings.images': 2,
+    # Deny permission prompts a headless scraper can't answer: camera/microphone, plugins, notifications
+    'profile.managed_default_content_settings.media_stream': 2,
+    'profile.managed_default_content_settings.plugins': 2,
+    'profile.managed_default_content_settings.notifications': 2,
+}
+
+BLOCKED_RESOURCE_TYPES = ('Image', 'Media', 'Font', 'Stylesheet')  # CDP Network.ResourceType values
+
+BLOCKED_URL_PATTERNS = [
+    # Analytics and ads
+    "*google-analytics.com/*", "*googletagmanager.com/*", "*doubleclick.net/*",
+    "*px.ads.linkedin.com/*", "*ads.linkedin.com/*", "*bat.bing.com/*",
+    "*connect.facebook.net/*", "*li.protechts.net/*", "*linkedin.com/li/track*",
+]
+
+FETCH_INTERCEPTION_TIMEOUT_SECONDS = 10  # Longest wait for request interception to be set up
+
+# Typical transfer sizes used to estimate what a blocked request would have cost.
+ESTIMATED_BYTES_BY_TYPE = {
+    'Image': 25_000,
+    'Media': 250_000,
+    'Font': 40_000,
+    'Stylesheet': 60_000,
+    'Script': 30_000,
+    'Ping': 500,
+    'XHR': 2_000,
+    'Fetch': 2_000,
+    'Other': 5_000,
+}
+
+
+def apply_blocking_options(chrome_options):
+    """Adds content-settings prefs and performance logging to Chrome options."""
+    chrome_options.add_experimental_option('prefs', BLOCKED_CONTENT_SETTINGS)
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+    # Performance logs carry the CDP network events used for the bytes-saved report.
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return chrome_options
+
+
+def enable_request_blocking(driver):
+    """Turns on resource-type and tracker URL blocking for a freshly started driver.
+
+    Blocking by resource type needs a CDP event listener, which runs in a daemon thread for
+    as long as the browser does. Returns once it is in place; raises ``WebDriverException``
+    if tracker blocking can't be turned on.
+    """
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+    ready = threading.Event()
+    threading.Thread(target=trio.run, args=(_fail_blocked_requests, driver, ready),
+                     name="resource-blocking", daemon=True).start()
+    if not ready.wait(FETCH_INTERCEPTION_TIMEOUT_SECONDS):
+        print("⚠️ Request interception did not start in time; pages may load before it does.")
+
+
+async def _fail_blocked_requests(driver, ready: threading.Event):
+    """Pauses requests of the blocked resource types and fails them, until the browser closes.
+
+    When the CDP session goes away, Chrome releases its interception, so a failure here
+    lets requests through instead of stalling the page.
+    """
+    try:
+        async with driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            patterns = [devtools.fetch.RequestPattern(resource_type=devtools.network.ResourceType(resource_type),
+                                                      request_stage=devtools.fetch.RequestStage.REQUEST)
+                        for resource_type in BLOCKED_RESOURCE_TYPES]
+            # A paused event dropped by a full buffer would leave its request hanging
+            paused_requests = session.listen(devtools.fetch.RequestPaused, buffer_size=1000)
+            await session.execute(devtools.fetch.enable(patterns=patterns))
+            ready.set()
+            async for event in paused_requests:
+                await session.execute(devtools.fetch.fail_request(
+                    event.request_id, devtools.network.ErrorReason.BLOCKED_BY_CLIENT))
+    except Exception as e:
+        if not ready.is_set():
+            print(f"⚠️ Could not enable resource-type blocking: {e}")
+    finally:
+        ready.set()
+
+
+class NetworkStats:
+    """Accumulates downloaded and blocked traffic across all drivers of one scrape."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.pages = 0
+        self.bytes_downloaded = 0
+        self.blocked_requests = 0
+        self.estimated_bytes_saved = 0
+
+    def collect(self, driver):
+        """Drains the driver's performance log and adds its network events to the totals."""
+        try:
+            entries = driver.get_log('performance')
+        except Exception:
+            return
+        request_types = {}
+        downloaded = blocked = saved = 0
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                request_types[params.get('requestId')] = params.get('type', 'Other')
+            elif method == 'Network.loadingFinished':
+                downloaded += int(params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed' and (
+                    # URL blocking sets blockedReason; requests failed through Fetch only carry the error
+                    params.get('blockedReason') or params.get('errorText') == 'net::ERR_BLOCKED_BY_CLIENT'):
+                resource_type = params.get('type') or request_types.get(params.get('requestId'), 'Other')
+                blocked += 1
+                saved += ESTIMATED_BYTES_BY_TYPE.get(resource_type, ESTIMATED_BYTES_BY_TYPE['Other'])
+        with self._lock:
+            self.pages += 1
+            self.bytes_downloaded += downloaded
+            self.blocked_requests += blocked
+            self.estimated_bytes_saved += saved
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {
+                'pages': self.pages,
+                'bytes_downloaded': self.bytes_downloaded,
+                'blocked_requests': self.blocked_requests,
+                'estimated_bytes_saved': self.estimated_bytes_saved,
+            }
+
+    def report(self):
+        stats = self.as_dict()
+        print(
+            f"📉 Network: {stats['pages']} browser pages, {stats['bytes_downloaded'] / 1024:.0f} KB downloaded, "
+            f"{stats['blocked_requests']} requests blocked (~{stats['estimated_bytes_saved'] / 1024:.0f} KB saved)"
+        )
@@ -0,0 +1,94 @@
+import asyncio
+import threading
+
+# --- Scrape events ---
+# Streaming scrapers yield these instead of returning a list or an {'error': ...} dict.
+
+
+class JobFound:
+    """A scraped job dict is ready. ``index`` is the card's position in the search results."""
+
+    def __init__(self, job: dict, index: int = None):
+        self.job = job
+        self.index = index
+
+    def __repr__(self):
+        return f"JobFound({self.job.get('job_title')!r} at {self.job.get('company_name')!r}, index={self.index})"
+
+
+class ScrapeError:
+    """The scrape failed. Jobs already yielded stay valid; no further events follow."""
+
+    def __init__(self, message: str):
+        self.message = message
+
+    def __repr__(self):
+        return f"ScrapeError({self.message!r})"
+
+
+class ScrapeFinished:
+    """The scrape completed normally after ``job_count`` jobs."""
+
+    def __init__(self, job_count: int):
+        self.job_count = job_count
+
+    def __repr__(self):
+        return f"ScrapeFinished(job_count={self.job_count})"
+
+
+def collect_jobs(events):
+    """Drains an event stream into the legacy return value: a job list in card order or an error dict."""
+    found = []
+    for event in events:
+        if isinstance(event, JobFound):
+            found.append(event)
+        elif isinstance(event, ScrapeError):
+            return {'error': event.message}
+    found.sort(key=lambda event: event.index if event.index is not None else len(found))
+    return [event.job for event in found]
+
+
+async def aiter_events(events_factory, *args, **kwargs):
+    """Runs a blocking event generator on a thread and yields its events on the running loop.
+
+    ``events_factory(*args, **kwargs)`` must return an iterator of scrape events. If the
+    consumer stops early, the producer thread closes the generator at its next event.
+    ``executor`` selects the thread pool (the loop's default one when None).
+    """
+    executor = kwargs.pop('executor', None)
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    stop = threading.Event()
+    done = object()
+
+    def put(item):
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # The event loop is gone; nobody is listening any more.
+            stop.set()
+
+    def produce():
+        events = events_factory(*args, **kwargs)
+        try:
+            for event in events:
+                if stop.is_set():
+                    break
+                put(event)
+        except Exception as e:
+            put(ScrapeError(f"An unexpected error occurred: {e}"))
+        finally:
+            close = getattr(events, 'close', None)
+            if close:
+                close()
+            put(done)
+
+    loop.run_in_executor(executor, produce)
+    try:
+        while True:
+            event = await queue.get()
+            if event is done:
+                break
+            yield event
+    finally:
+        stop.set()
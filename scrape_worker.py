@@ -0,0 +1,143 @@
+import argparse
+import os
+import socket
+import threading
+import time
+
+import streamlit as st
+
+from job_queue import ScrapeJobQueue
+from scrape_events import JobFound, ScrapeError
+from search_scheduler import SAVE_BATCH_SIZE, save_new_internships
+from supabase_db import SupabaseDB
+from web_scraper import iter_scrape_linkedin
+
+# --- Scrape worker ---
+# Runs the manual searches queued in job_queue.py, saving new internships and recording
+# progress and the outcome on the job for the app to poll. Start as many worker processes
+# as scrape capacity calls for: `python scrape_worker.py --threads 2`.
+
+SCRAPE_WORKER_THREADS = 2  # Jobs one worker process runs at the same time
+WORKER_POLL_SECONDS = 1.0  # Wait between queue checks when it is empty
+PROGRESS_INTERVAL_SECONDS = 1.0  # Least time between two progress writes for a job
+MAINTENANCE_INTERVAL_SECONDS = 60  # How often lost jobs are re-queued and old ones pruned
+
+
+def run_scrape_job(db, queue: ScrapeJobQueue, job: dict) -> tuple:
+    """Scrapes one queued search and saves the internships the user doesn't have yet.
+
+    Returns ``(found_count, new_count, duplicate_count)``; raises ``RuntimeError`` when
+    LinkedIn can't be scraped. Stops early once the job was handed to another worker.
+    """
+    user_id = job['user_id']
+    existing_links = {internship['application_link'] for internship in db.get_user_internships(user_id)}
+    found_count = new_count = duplicate_count = 0
+    pending = []
+    last_report = time.monotonic()
+
+    def flush_pending():
+        nonlocal new_count, duplicate_count
+        saved = save_new_internships(db, user_id, pending)
+        new_count += saved['inserted']
+        duplicate_count += saved['duplicates']
+        pending.clear()
+
+    for event in iter_scrape_linkedin(job['job_title'], job['location'], bool(job['last_24_hours'])):
+        if isinstance(event, ScrapeError):
+            raise RuntimeError(event.message)
+        if not isinstance(event, JobFound):
+            continue
+        found_count += 1
+        link = event.job["application_link"]
+        if link not in existing_links:
+            existing_links.add(link)
+            pending.append(event.job)
+            if len(pending) >= SAVE_BATCH_SIZE:
+                flush_pending()
+        if time.monotonic() - last_report >= PROGRESS_INTERVAL_SECONDS:
+            if not queue.report_progress(job['id'], job['worker_id'], found_count, new_count, duplicate_count):
+                print(f"⚠️ Job {job['id']} was taken over by another worker; stopping.")
+                return found_count, new_count, duplicate_count
+            last_report = time.monotonic()
+    if pending:
+        flush_pending()
+    return found_count, new_count, duplicate_count
+
+
+class ScrapeWorker:
+    """Takes jobs off the scrape queue from a fixed number of threads."""
+
+    def __init__(self, queue: ScrapeJobQueue = None, db: SupabaseDB = None, threads: int = SCRAPE_WORKER_THREADS):
+        self.queue = queue or ScrapeJobQueue()
+        self.db = db or SupabaseDB()
+        self.threads = threads
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stopped = threading.Event()
+        self._threads = []
+
+    def start(self):
+        if not self._threads:
+            print(f"🛠️ Scrape worker {self.worker_id} started with {self.threads} threads.")
+            self._threads = [threading.Thread(target=self._work, name=f"scrape-worker-{i}", daemon=True)
+                             for i in range(self.threads)]
+            self._threads.append(threading.Thread(target=self._maintain, name="scrape-worker-maintenance", daemon=True))
+            for thread in self._threads:
+                thread.start()
+        return self
+
+    def stop(self, wait: bool = True):
+        """Stops taking jobs; with ``wait``, lets the running ones finish."""
+        self._stopped.set()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _work(self):
+        worker_id = f"{self.worker_id}:{threading.current_thread().name}"
+        while not self._stopped.is_set():
+            try:
+                job = self.queue.claim(worker_id)
+            except Exception as e:
+                print(f"Error reading the scrape queue: {e}")
+                job = None
+            if job is None:
+                self._stopped.wait(WORKER_POLL_SECONDS)
+                continue
+            print(f"🔎 Job {job['id']}: scraping \"{job['job_title']}\" in {job['location']} for user {job['user_id']}.")
+            try:
+                found_count, new_count, duplicate_count = run_scrape_job(self.db, self.queue, job)
+                if self.queue.complete(job['id'], worker_id, found_count, new_count, duplicate_count):
+                    print(f"✅ Job {job['id']}: found {found_count}, saved {new_count} new.")
+            except Exception as e:
+                print(f"❌ Job {job['id']} failed: {e}")
+                self.queue.fail(job['id'], worker_id, str(e))
+
+    def _maintain(self):
+        while not self._stopped.is_set():
+            try:
+                recovered = self.queue.recover_stale_jobs()
+                if recovered:
+                    print(f"♻️ Re-queued {recovered} scrape jobs from unresponsive workers.")
+                self.queue.prune()
+            except Exception as e:
+                print(f"Error maintaining the scrape queue: {e}")
+            self._stopped.wait(MAINTENANCE_INTERVAL_SECONDS)
+
+
+@st.cache_resource(show_spinner=False)
+def get_scrape_worker() -> ScrapeWorker:
+    """The app process's own worker, started on first use (see RUN_SCRAPE_WORKER_IN_APP)."""
+    return ScrapeWorker().start()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run queued LinkedIn scrape jobs.")
+    parser.add_argument("--threads", type=int, default=SCRAPE_WORKER_THREADS, help="jobs to run at the same time")
+    args = parser.parse_args()
+    worker = ScrapeWorker(threads=args.threads).start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print("Stopping scrape worker, letting running jobs finish...")
+        worker.stop()
@@ -1,284 +1,423 @@
-import time
-import re
-from bs4 import BeautifulSoup
-from urllib.parse import quote_plus
+from urllib.parse import urlencode
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 
+from driver_pool import ChromeDriverPool
+from parallel_fetch import HostThrottle, iter_fetch
+from scrape_events import JobFound, ScrapeError, ScrapeFinished, collect_jobs
+from card_parser import parse_job_cards
+from description_text import clean_description_text, validate_description_quality
+from resource_blocking import NetworkStats, apply_blocking_options, enable_request_blocking
+from linkedin_guest import (
+    DESCRIPTION_SELECTORS, MIN_DESCRIPTION_LENGTH, SEARCH_PAGE_URL, build_search_params, extract_job_id,
+    fetch_description_http, is_known_job,
+)
+from description_cache import DescriptionCache, get_description_cache
 
-def scrape_linkedin(job_title: str, location: str, last_24_hours: bool = False):
-    """
-    Scrapes LinkedIn for internship listings using Selenium, including full job descriptions.
-    """
-    print(f"🚀 Starting LinkedIn scrape for '{job_title}' in '{location}'")
-    
-    # --- Configure Selenium Chrome options ---
+CHROMEDRIVER_PATH = "drivers/chromedriver.exe"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+# --- Driver pool configuration ---
+DRIVER_POOL_SIZE = 1  # Number of warm Chrome instances kept per scrape
+DRIVER_MAX_PAGES = 20  # Recycle a driver after it has served this many pages
+BLOCK_RESOURCES = True  # Skip images, media, fonts, stylesheets and trackers in scraper browsers
+
+# --- Detail fetch concurrency ---
+DETAIL_FETCH_WORKERS = 4  # Job detail pages fetched at the same time
+PER_HOST_LIMIT = 4  # Maximum concurrent requests to a single host
+POLITENESS_DELAY = 1.0  # Seconds each per-host slot waits between requests (PER_HOST_LIMIT starts per second)
+
+# --- Readiness wait upper bounds (seconds) ---
+# Each wait returns as soon as the page is ready; these only cap how long we wait.
+INITIAL_LOAD_TIMEOUT = 3
+SCROLL_LOAD_TIMEOUT = 2
+DESCRIPTION_LOAD_TIMEOUT = 3
+AUTH_WALL_TIMEOUT = 2
+EXPANSION_TIMEOUT = 1
+WAIT_POLL_FREQUENCY = 0.1
+
+JOB_CARD_SELECTOR = "div.base-card"
+SHOW_MORE_SELECTOR = "button[data-tracking-control-name='show-more']"
+
+# --- HTTP fast path ---
+# A static description is accepted when its quality report reaches this score;
+# otherwise the job detail page is opened in a browser.
+MIN_STATIC_COMPLETENESS_SCORE = 3
+
+# Placeholder texts returned when no description could be fetched; these are never cached.
+DESCRIPTION_NOT_FOUND = "Description element not found on page."
+DESCRIPTION_ERROR_PREFIX = "Error fetching description"
+
+
+def _build_chrome_options(block_resources: bool = BLOCK_RESOURCES) -> Options:
+    """Headless Chrome options shared by the search page and the job detail pages."""
     chrome_options = Options()
     chrome_options.add_argument("--headless")
     chrome_options.add_argument("--no-sandbox")
     chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-logging")
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
     chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    if block_resources:
+        apply_blocking_options(chrome_options)
+    return chrome_options
+
+
+def _create_driver(block_resources: bool = BLOCK_RESOURCES):
+    """Starts a new headless Chrome driver. Used as the pool's driver factory."""
+    # Point to the manually downloaded chromedriver.
+    service = ChromeService(executable_path=CHROMEDRIVER_PATH)
+    driver = webdriver.Chrome(service=service, options=_build_chrome_options(block_resources))
+    if block_resources:
+        try:
+            enable_request_blocking(driver)
+        except WebDriverException as e:
+            print(f"⚠️ Could not enable network request blocking: {e}")
+    return driver
+
 
-    driver = None
+def _wait_until(driver, condition, timeout: float):
+    """Polls ``condition(driver)`` until it is truthy or ``timeout`` expires. Returns the last value."""
     try:
-                # Initialize the Chrome driver using webdriver-manager to automatically handle the driver executable.
-        # Point to the manually downloaded chromedriver.
-        service = ChromeService(executable_path="drivers/chromedriver.exe")
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.set_page_load_timeout(45)
+        return WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(condition)
+    except TimeoutException:
+        return None
+
+
+def _count_job_cards(driver) -> int:
+    return len(driver.find_elements(By.CSS_SELECTOR, JOB_CARD_SELECTOR))
+
+
+def _wait_for_more_cards(driver, previous_count: int, timeout: float) -> int:
+    """Waits until the result list grows past ``previous_count`` cards. Returns the new count."""
+    _wait_until(driver, lambda d: _count_job_cards(d) > previous_count, timeout)
+    return _count_job_cards(driver)
+
+
+def _card_job_ids(driver, start: int = 0) -> list:
+    """Returns the LinkedIn job IDs of the rendered result cards from index ``start`` on."""
+    urns = driver.execute_script(
+        "return Array.from(document.querySelectorAll(arguments[0])).slice(arguments[1])"
+        "  .map(card => card.getAttribute('data-entity-urn') || '');",
+        JOB_CARD_SELECTOR, start,
+    ) or []
+    return [extract_job_id(urn) for urn in urns]
 
+
+def _description_ready(driver) -> bool:
+    """True once one of the description containers holds a usable amount of text."""
+    return bool(driver.execute_script(
+        "return arguments[0].some(sel => Array.from(document.querySelectorAll(sel))"
+        "  .some(el => (el.innerText || '').trim().length > arguments[1]));",
+        DESCRIPTION_SELECTORS, MIN_DESCRIPTION_LENGTH,
+    ))
+
+
+def _wait_for_expansion(driver, element, previous_length: int, timeout: float):
+    """Waits until the expanded description is longer than before or the "show more" button is gone."""
+    def expanded(d):
+        if len(element.text.strip()) > previous_length:
+            return True
+        return not any(button.is_displayed() for button in d.find_elements(By.CSS_SELECTOR, SHOW_MORE_SELECTOR))
+    _wait_until(driver, expanded, timeout)
+
+
+def create_driver_pool(size: int = DRIVER_POOL_SIZE, max_pages: int = DRIVER_MAX_PAGES,
+                       block_resources: bool = BLOCK_RESOURCES) -> ChromeDriverPool:
+    """Creates a pool of warm Chrome drivers that can be shared across scrapes."""
+    return ChromeDriverPool(lambda: _create_driver(block_resources), size=size, max_pages=max_pages)
+
+
+def scrape_linkedin(job_title: str, location: str, last_24_hours: bool = False, **options):
+    """
+    Scrapes LinkedIn for internship listings using Selenium, including full job descriptions.
+
+    Returns the job dicts in search-result order, or ``{'error': ...}`` if the scrape fails.
+    Accepts the same options as ``iter_scrape_linkedin``.
+    """
+    return collect_jobs(iter_scrape_linkedin(job_title, location, last_24_hours, **options))
+
+
+def iter_scrape_linkedin(job_title: str, location: str, last_24_hours: bool = False,
+                         driver_pool: ChromeDriverPool = None, max_workers: int = DETAIL_FETCH_WORKERS,
+                         per_host_limit: int = PER_HOST_LIMIT, politeness_delay: float = POLITENESS_DELAY,
+                         use_http: bool = True, block_resources: bool = BLOCK_RESOURCES,
+                         description_cache: DescriptionCache = None, use_cache: bool = True,
+                         known_job_ids: set = None, high_water_mark: int = None, fetch_descriptions: bool = True):
+    """
+    Scrapes LinkedIn like ``scrape_linkedin`` but yields scrape events as results become ready.
+
+    Every job is yielded as a ``JobFound`` as soon as its description is available (cached
+    descriptions first, then fetched ones in completion order; ``JobFound.index`` keeps the
+    card position). With ``fetch_descriptions=False`` jobs are yielded straight from their
+    cards with an empty description. The stream ends with ``ScrapeFinished`` or ``ScrapeError``.
+
+    Browsers are borrowed from ``driver_pool``; when none is given a pool of ``max_workers``
+    drivers is created for this scrape and closed at the end, so the number of Chrome
+    startups scales with the pool size rather than with the number of results.
+    Detail pages are fetched by up to ``max_workers`` threads, at most ``per_host_limit``
+    at a time per host and at most ``per_host_limit`` starts per ``politeness_delay``
+    seconds on a host. With ``use_http`` the static guest page is tried first and a
+    browser is only used when it has no usable description.
+    ``block_resources`` controls asset blocking for a pool created here (a pool passed in
+    keeps its own setting); downloaded and saved bytes are reported at the end.
+    With ``use_cache`` descriptions are looked up by job ID in ``description_cache`` (the
+    shared on-disk cache by default) before any detail page is opened.
+
+    Jobs already known to the caller (``known_job_ids`` or IDs up to ``high_water_mark``)
+    are left out of the results without fetching their details, and scrolling stops as
+    soon as a whole batch of newly loaded cards is already known.
+    """
+    print(f"🚀 Starting LinkedIn scrape for '{job_title}' in '{location}'")
+
+    owns_pool = driver_pool is None
+    pool = driver_pool or create_driver_pool(size=max_workers, block_resources=block_resources)
+    network_stats = NetworkStats()
+    try:
         # Construct search URL
-        search_query = f"{job_title} internship"
-        url = (
-            f"https://www.linkedin.com/jobs/search/?keywords={quote_plus(search_query)}"
-            f"&location={quote_plus(location)}&sortBy=R"
-        )
-        if last_24_hours:
-            url += "&f_TPR=r86400"
-
-        print(f"Navigating to search results: {url}")
-        driver.get(url)
-        time.sleep(3) # Allow initial page load
-
-        # Scroll to load all jobs
-        scroll_pause_time = 2
-        scrolls = 5 # Limit scrolls to avoid excessive loading
-        last_height = driver.execute_script("return document.body.scrollHeight")
-        
-        print("Scrolling to load all results...")
-        for i in range(scrolls):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(scroll_pause_time)
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                print("Reached end of results.")
-                break
-            last_height = new_height
-            print(f"Scroll {i+1}/{scrolls} complete.")
-
-        # Parse job cards
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        job_cards = soup.find_all('div', class_='base-card')
-
-        if not job_cards:
-            print("⚠️ No job cards found. LinkedIn may have changed its layout or blocked the request.")
-            # Save the page source for debugging
-            try:
-                with open("linkedin_search_results.html", "w", encoding="utf-8") as f:
-                    f.write(driver.page_source)
-                print("📄 Saved page HTML to linkedin_search_results.html for debugging.")
-                driver.save_screenshot('linkedin_error.png')
-                print("📸 Saved screenshot to linkedin_error.png for debugging.")
-            except Exception as e:
-                print(f"Could not save debug files: {e}")
-            return []
-
-        print(f"✅ Found {len(job_cards)} job cards. Fetching details for each...")
-        job_listings = []
-
-        for i, card in enumerate(job_cards):
-            try:
-                title_elem = card.find('h3', class_='base-search-card__title')
-                company_elem = card.find('h4', class_='base-search-card__subtitle')
-                link_elem = card.find('a', class_='base-card__full-link')
-                
-                if all([title_elem, company_elem, link_elem]):
-                    job_url = link_elem['href'].split('?')[0]  # Clean URL
-                    job_title_text = title_elem.get_text(strip=True)
-                    company_name_text = company_elem.get_text(strip=True)
-                    
-                    # Skip entries where title or company are just asterisks
-                    if re.fullmatch(r'\*+', job_title_text) or re.fullmatch(r'\*+', company_name_text):
-                        print(f"Skipping masked entry: {job_title_text} at {company_name_text}")
-                        continue
-                    
-                    print(f"\n--- Processing Job {i+1}/{len(job_cards)}: {job_title_text} at {company_name_text} ---")
-                    
-                    # Fetch the full description using our detailed function
-                    # NOTE: This creates a new driver for each job to ensure isolation and avoid bans.
-                    full_description = _fetch_full_description(job_url, job_title_text)
-                    
-                    job_listings.append({
-                        'job_title': job_title_text,
-                        'company_name': company_name_text,
-                        'source_url': job_url,
-                        'application_link': job_url,  # Often the same, can be refined later
-                        'job_description': clean_description_text(full_description),
-                        'source_site': 'LinkedIn'
-                    })
-            except Exception as e:
-                print(f"❌ Error processing a job card: {e}")
+        url = f"{SEARCH_PAGE_URL}?{urlencode(build_search_params(job_title, location, last_24_hours))}"
+
+        with pool.driver() as driver:
+            driver.set_page_load_timeout(45)
+            print(f"Navigating to search results: {url}")
+            driver.get(url)
+            # Allow initial page load: continue as soon as the first cards are rendered
+            card_count = _wait_for_more_cards(driver, 0, INITIAL_LOAD_TIMEOUT)
+            track_known = bool(known_job_ids) or high_water_mark is not None
+
+            # Scroll to load all jobs
+            scrolls = 5 # Limit scrolls to avoid excessive loading
+
+            print("Scrolling to load all results...")
+            previous_count = 0
+            for i in range(scrolls):
+                # Stop early when the most recently loaded batch holds nothing new
+                if track_known and card_count > previous_count and all(
+                        is_known_job(job_id, known_job_ids, high_water_mark)
+                        for job_id in _card_job_ids(driver, previous_count)):
+                    print("Latest results are all already known, stopping.")
+                    break
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                new_count = _wait_for_more_cards(driver, card_count, SCROLL_LOAD_TIMEOUT)
+                if new_count == card_count:
+                    print("Reached end of results.")
+                    break
+                previous_count, card_count = card_count, new_count
+                print(f"Scroll {i+1}/{scrolls} complete ({card_count} cards).")
+
+            # Parse job cards
+            page_source = driver.page_source
+            card_jobs, card_count, _ = parse_job_cards(page_source, label="search results")
+
+            if not card_count:
+                print("⚠️ No job cards found. LinkedIn may have changed its layout or blocked the request.")
+                # Save the page source for debugging
+                try:
+                    with open("linkedin_search_results.html", "w", encoding="utf-8") as f:
+                        f.write(page_source)
+                    print("📄 Saved page HTML to linkedin_search_results.html for debugging.")
+                    driver.save_screenshot('linkedin_error.png')
+                    print("📸 Saved screenshot to linkedin_error.png for debugging.")
+                except Exception as e:
+                    print(f"Could not save debug files: {e}")
+                yield ScrapeFinished(0)
+                return
+            network_stats.collect(driver)
+
+        print(f"✅ Found {card_count} job cards. Fetching details for each...")
+        pending_jobs = []
+        known_count = 0
+
+        for i, card_job in enumerate(card_jobs):
+            job_url = card_job['application_link'].split('?')[0]  # Clean URL
+            if is_known_job(card_job['job_id'], known_job_ids, high_water_mark):
+                known_count += 1
                 continue
-        
-        print(f"\n🏁 Scrape finished. Returning {len(job_listings)} fully detailed jobs.")
-        return job_listings
+
+            pending_jobs.append({
+                'index': i,
+                'job_title': card_job['job_title'],
+                'company_name': card_job['company_name'],
+                'source_url': job_url,
+                'application_link': job_url,  # Often the same, can be refined later
+                'source_site': card_job['source_site']
+            })
+
+        if known_count:
+            print(f"⏭️ Skipped {known_count} already known jobs.")
+
+        def job_found(job, description):
+            return JobFound({
+                'job_title': job['job_title'],
+                'company_name': job['company_name'],
+                'source_url': job['source_url'],
+                'application_link': job['application_link'],
+                'job_description': description,
+                'source_site': job['source_site']
+            }, index=job['index'])
+
+        if not fetch_descriptions:
+            for job in pending_jobs:
+                yield job_found(job, "")
+            yield ScrapeFinished(len(pending_jobs))
+            return
+
+        # Serve already known descriptions from the cache before opening any detail page.
+        cache = None
+        if use_cache:
+            cache = description_cache if description_cache is not None else get_description_cache()
+        jobs_to_fetch = []
+        cached_count = 0
+        for job in pending_jobs:
+            cached = cache.get(extract_job_id(job['source_url'])) if cache is not None else None
+            if cached:
+                cached_count += 1
+                yield job_found(job, cached['description'])
+            else:
+                jobs_to_fetch.append(job)
+        if cache is not None:
+            print(f"💾 {cached_count}/{len(pending_jobs)} descriptions served from cache.")
+
+        def fetch_details(job):
+            print(f"\n--- Processing Job: {job['job_title']} at {job['company_name']} ---")
+            full_description = None
+            if use_http:
+                full_description = _fetch_static_description(job['source_url'], job['job_title'])
+            if not full_description:
+                # Fetch the full description with a pooled driver (cookies and storage are cleared between jobs).
+                full_description = _fetch_full_description(job['source_url'], job['job_title'], pool, network_stats)
+            cleaned = clean_description_text(full_description)
+            if cache is not None and cleaned and not cleaned.startswith((DESCRIPTION_NOT_FOUND, DESCRIPTION_ERROR_PREFIX)):
+                quality = validate_description_quality(cleaned, job['job_title'], verbose=False)
+                cache.put(extract_job_id(job['source_url']), cleaned, quality)
+            return cleaned
+
+        # Detail pages are fetched concurrently; each job is yielded as soon as it is done.
+        fetched = iter_fetch(
+            jobs_to_fetch,
+            fetch_details,
+            url_of=lambda job: job['source_url'],
+            max_workers=min(max_workers, pool.size),
+            throttle=HostThrottle(per_host_limit, politeness_delay),
+            on_error=lambda job, e: f"{DESCRIPTION_ERROR_PREFIX}: {e}",
+        )
+        for position, description in fetched:
+            yield job_found(jobs_to_fetch[position], description)
+
+        network_stats.report()
+        print(f"\n🏁 Scrape finished. Returned {len(pending_jobs)} fully detailed jobs.")
+        yield ScrapeFinished(len(pending_jobs))
 
     except WebDriverException as e:
         error_msg = f"A WebDriver error occurred: {e}"
         print(f"❌ {error_msg}")
-        return {'error': error_msg}
+        yield ScrapeError(error_msg)
     except Exception as e:
         error_msg = f"An unexpected error occurred: {e}"
         print(f"❌ {error_msg}")
-        return {'error': error_msg}
+        yield ScrapeError(error_msg)
     finally:
-        if driver:
-            driver.quit()
+        if owns_pool:
+            pool.close()
 
 
-def _fetch_full_description(job_url: str, job_title: str) -> str:
-    """Opens the job detail page in a fresh headless driver, expands description and returns text."""
-    chrome_options = Options()
-    chrome_options.add_argument("--headless")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--disable-logging")
-    chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-    chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
+def _fetch_static_description(job_url: str, job_title: str) -> str:
+    """Returns the description from the static guest page, or "" when the browser is needed."""
+    description = fetch_description_http(job_url)
+    if not description:
+        return ""
+    quality = validate_description_quality(description, job_title)
+    if quality['completeness_score'] < MIN_STATIC_COMPLETENESS_SCORE:
+        print("ⓘ Static description looks incomplete, falling back to the browser.")
+        return ""
+    print(f"⚡ Using static description ({len(description)} characters).")
+    return description
+
 
+def _fetch_full_description(job_url: str, job_title: str, driver_pool: ChromeDriverPool,
+                            network_stats: NetworkStats = None) -> str:
+    """Opens the job detail page in a pooled headless driver, expands description and returns text."""
     try:
-        # Point to the manually downloaded chromedriver.
-        service = ChromeService(executable_path="drivers/chromedriver.exe")
-        with webdriver.Chrome(service=service, options=chrome_options) as temp_driver:
-            temp_driver.set_page_load_timeout(30)
-            temp_driver.get(job_url)
-            print(f"📄 Page loaded for description: {temp_driver.title[:80]}...")
-            time.sleep(3)
-
-            # Strategy 1: Handle Auth Walls/Login prompts
-            try:
-                current_url = temp_driver.current_url
-                if "authwall" in current_url or "login" in current_url or "checkpoint" in current_url:
-                    print("⚠️ Detected login wall or auth challenge")
-                    # Simple script to remove modals/overlays. Might not work for all cases.
-                    temp_driver.execute_script("""
-                        const modals = document.querySelectorAll('[role="dialog"], .modal, .overlay');
-                        modals.forEach(modal => modal.remove());
-                        const overlays = document.querySelectorAll('.overlay, .backdrop');
-                        overlays.forEach(overlay => overlay.remove());
-                    """)
-                    time.sleep(2)
-            except Exception as e:
-                print(f"⚠️ Error handling auth wall: {e}")
-
-            # Strategy 2: Find the most likely description element
-            description_selectors = [
-                ".show-more-less-html__markup", ".jobs-description-content__text", ".jobs-box__html-content",
-                ".jobs-description__content", ".description__text", "[data-job-description]",
-                ".jobs-description", ".job-description"
-            ]
-            description_element = None
-            for selector in description_selectors:
-                try:
-                    elements = temp_driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        # Find the element with the most text, as it's likely the main description
-                        best_element = max(elements, key=lambda el: len(el.text))
-                        if len(best_element.text.strip()) > 50: # Basic quality check
-                            description_element = best_element
-                            print(f"✅ Found description container using: {selector}")
-                            break
-                except NoSuchElementException:
-                    continue
-            
-            if not description_element:
-                return "Description element not found on page."
-
-            # Strategy 3: Try to expand the description ("Show more" button)
+        with driver_pool.driver() as temp_driver:
             try:
-                # This selector is common for LinkedIn's "Show more" button
-                show_more_button = temp_driver.find_element(By.CSS_SELECTOR, "button[data-tracking-control-name='show-more']")
-                temp_driver.execute_script("arguments[0].click();", show_more_button)
-                print("✅ Clicked 'Show more' button to expand description.")
-                time.sleep(1) # Wait for content to load
-            except NoSuchElementException:
-                print("ⓘ 'Show more' button not found, description may be complete.")
-            except Exception as e:
-                print(f"⚠️ Error clicking 'Show more' button: {e}")
-
-            # Strategy 4: Get the final, clean text
-            final_text = description_element.text.strip()
-            print(f"📏 Final description length: {len(final_text)} characters")
-            
-            # Strategy 5: Validate quality
-            validate_description_quality(final_text, job_title)
-            
-            return final_text
+                return _read_description(temp_driver, job_url, job_title)
+            finally:
+                if network_stats:
+                    network_stats.collect(temp_driver)
 
     except Exception as e:
         print(f"❌ ERROR fetching description for {job_url}: {e}")
-        return f"Error fetching description: {e}"
-
-
-def validate_description_quality(description: str, job_title: str) -> dict:
-    """Enhanced validation of extracted job description quality"""
-    clean_desc = re.sub(r'\s+', ' ', description.lower().strip())
-    quality_metrics = {
-        'length': len(description),
-        'word_count': len(description.split()),
-        'has_requirements': bool(re.search(r'\b(requirements?|qualifications?|skills?|experience)\b', clean_desc)),
-        'has_responsibilities': bool(re.search(r'\b(responsibilities|duties|role|tasks)\b', clean_desc)),
-        'has_benefits': bool(re.search(r'\b(benefits|compensation|salary|perks)\b', clean_desc)),
-        'has_company_info': bool(re.search(r'\b(company|about us|our mission)\b', clean_desc)),
-        'truncation_indicators': bool(re.search(r'(\.\.\.|…|show more|voir plus)', clean_desc)),
-        'completeness_score': 0
-    }
-    score = 0
-    
-    # Length scoring
-    if quality_metrics['length'] > 2000:
-        score += 4
-    elif quality_metrics['length'] > 1500:
-        score += 3
-    elif quality_metrics['length'] > 1000:
-        score += 2
-    elif quality_metrics['length'] > 500:
-        score += 1
-    
-    # Content completeness
-    if quality_metrics['has_requirements']:
-        score += 2
-    if quality_metrics['has_responsibilities']:
-        score += 2
-    if quality_metrics['has_benefits']:
-        score += 1
-    if quality_metrics['has_company_info']:
-        score += 1
-    if not quality_metrics['truncation_indicators']:
-        score += 1
-    
-    quality_metrics['completeness_score'] = score
-    
-    # Print quality report
-    print(f"\n📊 QUALITY REPORT for '{job_title}':")
-    print(f"  📏 Length: {quality_metrics['length']} chars, {quality_metrics['word_count']} words")
-    print(f"  ✅ Has requirements: {quality_metrics['has_requirements']}")
-    print(f"  ✅ Has responsibilities: {quality_metrics['has_responsibilities']}")
-    print(f"  ✅ Has benefits: {quality_metrics['has_benefits']}")
-    print(f"  ✅ Has company info: {quality_metrics['has_company_info']}")
-    print(f"  ⚠️ Truncation indicators: {quality_metrics['truncation_indicators']}")
-    print(f"  🎯 Completeness score: {quality_metrics['completeness_score']}/11")
+        return f"{DESCRIPTION_ERROR_PREFIX}: {e}"
+
+
+def _read_description(temp_driver, job_url: str, job_title: str) -> str:
+    """Loads a job detail page in ``temp_driver`` and extracts the expanded description text."""
+    temp_driver.set_page_load_timeout(30)
+    temp_driver.get(job_url)
+    print(f"📄 Page loaded for description: {temp_driver.title[:80]}...")
+    _wait_until(temp_driver, _description_ready, DESCRIPTION_LOAD_TIMEOUT)
+
+    # Strategy 1: Handle Auth Walls/Login prompts
+    try:
+        current_url = temp_driver.current_url
+        if "authwall" in current_url or "login" in current_url or "checkpoint" in current_url:
+            print("⚠️ Detected login wall or auth challenge")
+            # Simple script to remove modals/overlays. Might not work for all cases.
+            temp_driver.execute_script("""
+                const modals = document.querySelectorAll('[role="dialog"], .modal, .overlay');
+                modals.forEach(modal => modal.remove());
+                const overlays = document.querySelectorAll('.overlay, .backdrop');
+                overlays.forEach(overlay => overlay.remove());
+            """)
+            _wait_until(temp_driver, _description_ready, AUTH_WALL_TIMEOUT)
+    except Exception as e:
+        print(f"⚠️ Error handling auth wall: {e}")
+
+    # Strategy 2: Find the most likely description element
+    description_element = None
+    for selector in DESCRIPTION_SELECTORS:
+        try:
+            elements = temp_driver.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                # Find the element with the most text, as it's likely the main description
+                best_element = max(elements, key=lambda el: len(el.text))
+                if len(best_element.text.strip()) > MIN_DESCRIPTION_LENGTH: # Basic quality check
+                    description_element = best_element
+                    print(f"✅ Found description container using: {selector}")
+                    break
+        except NoSuchElementException:
+            continue
     
-    return quality_metrics
+    if not description_element:
+        return DESCRIPTION_NOT_FOUND
 
+    # Strategy 3: Try to expand the description ("Show more" button)
+    try:
+        # This selector is common for LinkedIn's "Show more" button
+        show_more_button = temp_driver.find_element(By.CSS_SELECTOR, SHOW_MORE_SELECTOR)
+        collapsed_length = len(description_element.text.strip())
+        temp_driver.execute_script("arguments[0].click();", show_more_button)
+        print("✅ Clicked 'Show more' button to expand description.")
+        _wait_for_expansion(temp_driver, description_element, collapsed_length, EXPANSION_TIMEOUT)
+    except NoSuchElementException:
+        print("ⓘ 'Show more' button not found, description may be complete.")
+    except Exception as e:
+        print(f"⚠️ Error clicking 'Show more' button: {e}")
 
-def clean_description_text(description: str) -> str:
-    """Clean and format the extracted description text"""
-    if not description:
-        return ""
-    cleaned = re.sub(r'\n\s*\n', '\n', description).strip()
-    artifacts_to_remove = [r'Show more\s*Show less', r'Voir plus\s*Voir moins']
-    for pattern in artifacts_to_remove:
-        cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE)
-    return cleaned.strip()
+    # Strategy 4: Get the final, clean text
+    final_text = description_element.text.strip()
+    print(f"📏 Final description length: {len(final_text)} characters")
+    
+    # Strategy 5: Validate quality
+    validate_description_quality(final_text, job_title)
+    
+    return final_text
 
 
 # Test execution
@@ -0,0 +1,324 @@
+import html
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import streamlit as st
+
+from config import SCRAPING_INTERVAL_MINUTES
+from linkedin_guest import job_ids_from_links
+from notifications import send_telegram_notification
+from scrape_events import JobFound, ScrapeError
+from supabase_db import SupabaseDB
+from web_scraper import iter_scrape_linkedin
+
+# --- Continuous search scheduler ---
+# Every user's continuous search is a row in search_subscriptions. One scheduler thread
+# reads the due rows and hands them to a fixed worker pool, so threads stay flat however
+# many users subscribe. Users watching the same query share one scrape per interval.
+# Searches resume after a restart, and stopping one takes effect mid-run. Run one
+# scheduler per deployment: in the app (RUN_SEARCH_SCHEDULER_IN_APP) or as its own
+# process with `python search_scheduler.py`.
+
+SAVE_BATCH_SIZE = 50  # Scraped internships saved per bulk upsert
+SCHEDULER_WORKERS = 4  # Searches that run at the same time
+SCHEDULER_POLL_SECONDS = 30  # Longest wait before re-reading the subscription table
+INTERVAL_JITTER = 0.1  # Runs are spaced SCRAPING_INTERVAL_MINUTES apart, +/- 10%
+
+
+def save_new_internships(db, user_id, internships):
+    """Saves scraped internships with status "new" in one bulk upsert. Returns ``add_internships_bulk``'s report."""
+    return db.add_internships_bulk(user_id, [{**internship, "status": "new"} for internship in internships])
+
+
+def next_run_time(now: datetime = None) -> datetime:
+    """When a subscription is due next: one interval from now, jittered so runs don't bunch up."""
+    now = now or datetime.now(timezone.utc)
+    interval = SCRAPING_INTERVAL_MINUTES * 60 * random.uniform(1 - INTERVAL_JITTER, 1 + INTERVAL_JITTER)
+    return now + timedelta(seconds=interval)
+
+
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def normalize_query(subscription: dict) -> tuple:
+    """The search a subscription stands for: case and spacing don't make a different LinkedIn query."""
+    return (' '.join(subscription['job_title'].lower().split()),
+            ' '.join((subscription['location'] or '').lower().split()))
+
+
+def notify_new_internship(internship, telegram_bot_token, telegram_chat_id):
+    # Notifications are sent as HTML, so scraped text is escaped
+    job_title = html.escape(internship['job_title'])
+    company_name = html.escape(internship['company_name'])
+    link = html.escape(internship['application_link'])
+    description = html.escape((internship.get('job_description') or '').split('Posted')[0])
+    detail_message = (
+        f"✨ New Internship: {job_title}\n"
+        f"🏢 Company: {company_name}\n"
+        f"🔗 Apply Here ({link})\n\n"
+        f"LinkedIn ({link})\n"
+        f"{company_name} hiring {job_title}\n"
+        f"{description}"
+    )
+    try:
+        print(f"[DEBUG] Sending Telegram notification for internship: {detail_message}")
+        send_telegram_notification(detail_message, telegram_bot_token, telegram_chat_id)
+    except Exception as notify_err:
+        print(f"[ERROR] Failed to send Telegram notification: {notify_err}")
+
+
+def notify_summary(new_internships, telegram_bot_token, telegram_chat_id):
+    summary = f"🎯 Found {len(new_internships)} new internships!\n\n"
+    for idx, internship in enumerate(new_internships, 1):
+        summary += f"{idx}. {html.escape(internship['job_title'])} at {html.escape(internship['company_name'])}\n"
+    try:
+        print(f"[DEBUG] Sending Telegram summary notification: {summary}")
+        send_telegram_notification(summary, telegram_bot_token, telegram_chat_id)
+    except Exception as notify_err:
+        print(f"[ERROR] Failed to send Telegram summary notification: {notify_err}")
+
+
+class SubscriberRun:
+    """One subscriber's share of a search run: their duplicate check, save batches and notifications."""
+
+    def __init__(self, db, subscription: dict, cancelled: threading.Event):
+        self.db = db
+        self.subscription = subscription
+        self.user_id = subscription['user_id']
+        self.cancelled = cancelled
+        self.error = None
+        # Read the Telegram config on every run, so changes in Telegram Settings apply
+        user_profile = db.get_user_profile(self.user_id) or {}
+        self.telegram_bot_token = user_profile.get('telegram_bot_token')
+        self.telegram_chat_id = user_profile.get('telegram_chat_id')
+        self.existing_links = {internship['application_link'] for internship in db.get_user_internships(self.user_id)}
+        self.new_internships = []
+        self.pending = []
+
+    @property
+    def accepting(self) -> bool:
+        return self.error is None and not self.cancelled.is_set()
+
+    def offer(self, internship: dict):
+        """Queues a scraped internship unless the user already has it; saves full batches."""
+        link = internship["application_link"]
+        if link in self.existing_links:
+            return
+        self.existing_links.add(link)
+        self.pending.append(internship)
+        if len(self.pending) >= SAVE_BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Saves the queued internships in bulk and announces the ones that were new."""
+        saved = save_new_internships(self.db, self.user_id, self.pending)
+        notify = self.telegram_bot_token and self.telegram_chat_id
+        for internship, outcome in zip(self.pending, saved['results']):
+            if outcome['status'] != 'inserted':
+                continue
+            self.new_internships.append(internship)
+            if notify:
+                notify_new_internship(internship, self.telegram_bot_token, self.telegram_chat_id)
+        self.pending.clear()
+
+    def finish(self):
+        if self.pending:
+            self.flush()
+        print(f"[DEBUG] Found {len(self.new_internships)} new internships for user {self.user_id}.")
+        if self.new_internships and self.telegram_bot_token and self.telegram_chat_id:
+            notify_summary(self.new_internships, self.telegram_bot_token, self.telegram_chat_id)
+        elif self.new_internships:
+            print(f"[ERROR] Telegram config missing for user {self.user_id}.")
+
+
+def run_query_search(query: tuple, runs: list):
+    """Scrapes one query once and hands every result to each subscriber's run.
+
+    Stops between result pages once every subscriber is cancelled. A subscriber whose
+    save fails gets ``error`` set and is left out of the rest of the run. Raises
+    ``RuntimeError`` when the scrape fails outright.
+    """
+    job_title, location = query
+    # Postings every subscriber already has need not be fetched at all
+    known_job_ids = set.intersection(*(set(job_ids_from_links(run.existing_links)) for run in runs))
+    scraped_count = 0
+
+    def deliver(run, action, *args):
+        if not run.accepting:
+            return
+        try:
+            action(*args)
+        except Exception as e:
+            run.error = str(e)
+            print(f"Error in continuous scraping for user {run.user_id}: {e}")
+
+    for event in iter_scrape_linkedin(job_title, location, True, known_job_ids=tuple(sorted(known_job_ids))):  # Only last 24h
+        if not any(run.accepting for run in runs):
+            print(f"[DEBUG] Continuous search for \"{job_title}\" has no subscribers left; stopping.")
+            break
+        if isinstance(event, ScrapeError):
+            raise RuntimeError(event.message)
+        if not isinstance(event, JobFound):
+            continue
+        scraped_count += 1
+        for run in runs:
+            deliver(run, run.offer, event.job)
+    print(f"[DEBUG] Scraped {scraped_count} internships from LinkedIn for {len(runs)} subscribers.")
+    for run in runs:
+        deliver(run, run.finish)
+
+
+class SearchScheduler:
+    """Runs all active continuous searches from one scheduler thread and a fixed worker pool."""
+
+    def __init__(self, db: SupabaseDB = None, workers: int = SCHEDULER_WORKERS,
+                 poll_seconds: float = SCHEDULER_POLL_SECONDS):
+        self.db = db or SupabaseDB()
+        self.workers = workers
+        self.poll_seconds = poll_seconds
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='search-worker')
+        self._running = {}  # subscription id -> (user_id, query, cancel event)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self.run, name='search-scheduler', daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self, wait: bool = True):
+        """Stops scheduling and cancels running searches."""
+        self._stopped.set()
+        self._wake.set()
+        with self._lock:
+            for _, _, cancelled in self._running.values():
+                cancelled.set()
+        self._executor.shutdown(wait=wait)
+
+    def wake(self):
+        """Re-reads the subscription table now, e.g. right after a search was started or stopped."""
+        self._wake.set()
+
+    def cancel_user(self, user_id: str):
+        """Cancels the user's part in a running search, if any, without waiting for the next poll."""
+        with self._lock:
+            for run_user_id, _, cancelled in self._running.values():
+                if run_user_id == user_id:
+                    cancelled.set()
+        self._wake.set()
+
+    def run(self):
+        """The scheduler loop; ``start`` runs it in a background thread."""
+        print(f"🗓️ Search scheduler started with {self.workers} workers.")
+        while not self._stopped.is_set():
+            try:
+                wait = self._tick()
+            except Exception as e:
+                print(f"Error in search scheduler: {e}")
+                wait = self.poll_seconds
+            self._wake.wait(wait)
+            self._wake.clear()
+
+    def _tick(self) -> float:
+        """Starts the due queries there are free workers for; returns how long to wait before the next tick.
+
+        Subscriptions are grouped by normalized query: when one is due, the query runs once
+        for every active subscriber of it, and they all become due together again.
+        """
+        subscriptions = self.db.get_active_search_subscriptions()
+        active = {subscription['id']: subscription for subscription in subscriptions}
+        with self._lock:
+            # Cancel runs whose subscription was stopped or switched to another query
+            for subscription_id, (_, query, cancelled) in self._running.items():
+                subscription = active.get(subscription_id)
+                if subscription is None or normalize_query(subscription) != query:
+                    cancelled.set()
+            running = set(self._running)
+            running_queries = {query for _, query, _ in self._running.values()}
+
+        subscribers = {}
+        for subscription in subscriptions:
+            if subscription['id'] not in running:
+                subscribers.setdefault(normalize_query(subscription), []).append(subscription)
+
+        now = datetime.now(timezone.utc)
+        free = self.workers - len(running_queries)
+        for subscription in subscriptions:  # In due order
+            query = normalize_query(subscription)
+            if subscription['id'] in running or query in running_queries:
+                continue  # A subscriber who joined mid-run is picked up once it finishes
+            due_in = (_parse_time(subscription['next_run_at']) - now).total_seconds()
+            if due_in > 0:
+                return min(self.poll_seconds, due_in)
+            if free <= 0:
+                break  # A finishing run wakes the scheduler
+            self._launch(query, subscribers[query])
+            running_queries.add(query)
+            free -= 1
+        return self.poll_seconds
+
+    def _launch(self, query: tuple, subscriptions: list):
+        # Move the due time forward first, so a restart during the run doesn't repeat it at once
+        self.db.update_search_subscriptions_run([subscription['id'] for subscription in subscriptions], next_run_time())
+        cancels = {}
+        with self._lock:
+            for subscription in subscriptions:
+                cancels[subscription['id']] = threading.Event()
+                self._running[subscription['id']] = (subscription['user_id'], query, cancels[subscription['id']])
+        self._executor.submit(self._run_query, query, subscriptions, cancels)
+
+    def _run_query(self, query: tuple, subscriptions: list, cancels: dict):
+        errors = {}
+        try:
+            runs = []
+            for subscription in subscriptions:
+                try:
+                    runs.append(SubscriberRun(self.db, subscription, cancels[subscription['id']]))
+                except Exception as e:
+                    errors[subscription['id']] = str(e)
+                    print(f"Error in continuous scraping for user {subscription['user_id']}: {e}")
+            if runs:
+                try:
+                    run_query_search(query, runs)
+                except Exception as e:
+                    print(f"Error in continuous scraping for \"{query[0]}\": {e}")
+                    for run in runs:
+                        run.error = run.error or str(e)
+                errors.update((run.subscription['id'], run.error) for run in runs if run.error)
+        finally:
+            with self._lock:
+                for subscription in subscriptions:
+                    self._running.pop(subscription['id'], None)
+            self._wake.set()
+
+        # The interval counts from the end of a run; subscribers of a query stay on one schedule
+        now = datetime.now(timezone.utc)
+        next_run_at = next_run_time(now)
+        finished = {}
+        for subscription in subscriptions:
+            if not cancels[subscription['id']].is_set():
+                finished.setdefault(errors.get(subscription['id']), []).append(subscription['id'])
+        for error, subscription_ids in finished.items():
+            self.db.update_search_subscriptions_run(subscription_ids, next_run_at, last_run_at=now, last_error=error)
+
+
+@st.cache_resource(show_spinner=False)
+def get_search_scheduler() -> SearchScheduler:
+    """The app process's scheduler, started on first use."""
+    return SearchScheduler().start()
+
+
+if __name__ == "__main__":
+    scheduler = SearchScheduler()
+    try:
+        scheduler.run()
+    except KeyboardInterrupt:
+        print("Stopping search scheduler...")
+        scheduler.stop()
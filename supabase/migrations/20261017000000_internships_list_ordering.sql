@@ -0,0 +1,22 @@
+-- Server-side ordering and light list rows for internships.
+-- status_rank orders a user's internships new -> applied -> rejected -> anything else,
+-- job_description_preview lets list views skip the full description text.
+
+alter table public.internships
+    add column if not exists status_rank smallint generated always as (
+        case status
+            when 'new' then 0
+            when 'applied' then 1
+            when 'rejected' then 2
+            else 3
+        end
+    ) stored;
+
+alter table public.internships
+    add column if not exists job_description_preview text generated always as (
+        left(job_description, 150)
+    ) stored;
+
+-- Matches the list order, so pages and keyset cursors are index range scans.
+create index if not exists internships_user_list_order_idx
+    on public.internships (user_id, status_rank, created_at desc, id desc);
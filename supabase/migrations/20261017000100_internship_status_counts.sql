@@ -0,0 +1,11 @@
+-- Per-status internship counts for a user in one grouped query (dashboard metrics).
+create or replace function public.internship_status_counts(p_user_id uuid)
+returns table (status text, count bigint)
+language sql
+stable
+as $$
+    select status::text, count(*)
+    from public.internships
+    where user_id = p_user_id
+    group by status;
+$$;
@@ -0,0 +1,23 @@
+-- Change stamp for per-user internship caches: (max(updated_at), count) changes on every
+-- insert, update and delete of a user's internships.
+
+alter table public.internships
+    add column if not exists updated_at timestamptz not null default now();
+
+create or replace function public.set_updated_at()
+returns trigger
+language plpgsql
+as $$
+begin
+    new.updated_at := now();
+    return new;
+end;
+$$;
+
+drop trigger if exists internships_set_updated_at on public.internships;
+create trigger internships_set_updated_at
+    before update on public.internships
+    for each row execute function public.set_updated_at();
+
+create index if not exists internships_user_updated_at_idx
+    on public.internships (user_id, updated_at desc);
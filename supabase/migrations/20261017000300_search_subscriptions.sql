@@ -0,0 +1,25 @@
+-- Continuous searches, one per user. The search scheduler runs every active row when
+-- next_run_at comes due, so searches survive restarts and stop as soon as active is cleared.
+
+create table if not exists public.search_subscriptions (
+    id bigint generated always as identity primary key,
+    user_id uuid not null unique references auth.users (id) on delete cascade,
+    job_title text not null,
+    location text not null default '',
+    active boolean not null default true,
+    next_run_at timestamptz not null default now(),
+    last_run_at timestamptz,
+    last_error text,
+    created_at timestamptz not null default now(),
+    updated_at timestamptz not null default now()
+);
+
+drop trigger if exists search_subscriptions_set_updated_at on public.search_subscriptions;
+create trigger search_subscriptions_set_updated_at
+    before update on public.search_subscriptions
+    for each row execute function public.set_updated_at();
+
+-- The scheduler's poll: active subscriptions in due order.
+create index if not exists search_subscriptions_due_idx
+    on public.search_subscriptions (next_run_at)
+    where active;
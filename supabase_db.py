@@ -1,7 +1,10 @@
 import os
+import threading
 import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from supabase import create_client, Client
+from supabase.lib.client_options import ClientOptions
 import time
 import re
 import streamlit as st
@@ -19,21 +22,231 @@ except ImportError:
         SUPABASE_URL = os.getenv("SUPABASE_URL")
         SUPABASE_KEY = os.getenv("SUPABASE_ANON_KEY") or os.getenv("SUPABASE_KEY")
 
+# --- Internship list queries ---
+# Columns for list views: everything but the full description, plus its short preview.
+INTERNSHIP_LIST_COLUMNS = (
+    'id,job_title,company_name,status,created_at,updated_at,application_link,source_url,source_site,'
+    'job_description_preview'
+)
+INTERNSHIP_STATUSES = ('new', 'applied', 'rejected')
+# Sort key of every internship list; also the keyset cursor fields
+_ORDER_COLUMNS = ('status_rank', 'created_at', 'id')
+
+def internships_query(client, user_id: str, columns: str = '*', statuses=None,
+                      limit: int = None, offset: int = 0, after: dict = None):
+    """Builds the ordered, optionally filtered and paged internship list query (not executed).
+
+    Shared by SupabaseDB and the bot's AsyncSupabaseDB; see ``get_internships_by_user``.
+    """
+    if columns != '*':
+        selected = [column.strip() for column in columns.split(',')]
+        columns = ','.join(selected + [c for c in _ORDER_COLUMNS if c not in selected])
+    query = client.table('internships').select(columns).eq('user_id', user_id)
+    if statuses:
+        query = query.in_('status', list(statuses))
+    if after:
+        rank, created_at, last_id = after['status_rank'], after['created_at'], after['id']
+        query = query.or_(
+            f'status_rank.gt.{rank},'
+            f'and(status_rank.eq.{rank},created_at.lt."{created_at}"),'
+            f'and(status_rank.eq.{rank},created_at.eq."{created_at}",id.lt.{last_id})'
+        )
+    query = query.order('status_rank').order('created_at', desc=True).order('id', desc=True)
+    if limit is not None:
+        query = query.range(offset, offset + limit - 1)
+    elif offset:
+        query = query.offset(offset)
+    return query
+
+
+# --- Bulk inserts ---
+# Shared by SupabaseDB and AsyncSupabaseDB: split the batch, upsert it, settle each job's outcome.
+
+def split_bulk_jobs(user_id: str, jobs: list) -> tuple:
+    """Returns ``(results, rows, row_positions)``: early outcomes, rows to upsert, and link -> job position."""
+    results = [None] * len(jobs)
+    rows = []
+    row_positions = {}
+    for position, job in enumerate(jobs):
+        link = job.get('application_link')
+        if not link:
+            results[position] = {'status': 'error', 'error': 'Missing application_link.'}
+        elif link in row_positions:
+            # The same posting twice in one batch: only the first copy is saved
+            results[position] = {'status': 'duplicate'}
+        else:
+            row_positions[link] = position
+            rows.append({**job, 'user_id': user_id})
+    return results, rows, row_positions
+
+
+def bulk_upsert_query(client, rows: list):
+    """ON CONFLICT DO NOTHING upsert: only the rows actually inserted come back."""
+    return client.table('internships').upsert(rows, on_conflict='user_id,application_link', ignore_duplicates=True)
+
+
+def settle_bulk_results(results: list, row_positions: dict, inserted_rows, error: Exception = None) -> dict:
+    """Fills in the outcome of every upserted job and returns the bulk report."""
+    if error is not None:
+        for position in row_positions.values():
+            results[position] = {'status': 'error', 'error': str(error)}
+    else:
+        pending = dict(row_positions)
+        for row in inserted_rows:
+            position = pending.pop(row.get('application_link'), None)
+            if position is not None:
+                results[position] = {'status': 'inserted', 'data': row}
+        for position in pending.values():
+            results[position] = {'status': 'duplicate'}
+    counts = {status: sum(1 for result in results if result['status'] == status)
+              for status in ('inserted', 'duplicate', 'error')}
+    return {
+        'success': counts['error'] == 0,
+        'results': results,
+        'inserted': counts['inserted'],
+        'duplicates': counts['duplicate'],
+        'errors': counts['error'],
+    }
+
+
+# --- Status counts ---
+# Counts come from the internship_status_counts RPC (supabase/migrations), or from count
+# queries when the RPC fails. They are cached per user in this process, adjusted by this
+# process's own writes, and served stale when neither can be read.
+STATUS_COUNTS_TTL_SECONDS = 60
+_MISSING_FUNCTION_CODE = 'PGRST202'  # PostgREST's error code when an RPC function doesn't exist
+_status_counts = {}
+_status_counts_lock = threading.Lock()
+_status_counts_rpc = {'available': True}  # Cleared once the database reports the RPC missing
+
+
+def _empty_status_counts() -> dict:
+    return {'total': 0, **{status: 0 for status in INTERNSHIP_STATUSES}}
+
+
+def _adjust_status_counts(user_id: str, rows, sign: int):
+    """Applies inserted (sign=1) or deleted (sign=-1) rows to the user's cached counts."""
+    with _status_counts_lock:
+        cached = _status_counts.get(user_id)
+        if not cached:
+            return
+        counts = cached['counts']
+        for row in rows:
+            counts['total'] = max(0, counts['total'] + sign)
+            status = row.get('status')
+            if status in counts:
+                counts[status] = max(0, counts[status] + sign)
+
+
+def _invalidate_status_counts(user_id: str):
+    with _status_counts_lock:
+        cached = _status_counts.get(user_id)
+        if cached:
+            cached['stale'] = True  # Refetched on next read, kept as a fallback meanwhile
+
+
+# --- Per-user internship lists ---
+# Each user's list (INTERNSHIP_LIST_COLUMNS, in list order) is cached in this process and
+# this process's writes are applied to it directly. Its version stamp is (max(updated_at),
+# row count), which every insert, update and delete changes (supabase/migrations), so a
+# cached list is revalidated with one tiny query and reloaded only when the database
+# changed since it was read.
+INTERNSHIP_CACHE_REVALIDATE_SECONDS = 3  # Reuse a list this long without asking the database
+INTERNSHIP_CACHE_MAX_USERS = 500  # Lists kept per process; the least recently used are evicted
+_LIST_FIELDS = tuple(dict.fromkeys(INTERNSHIP_LIST_COLUMNS.split(',') + list(_ORDER_COLUMNS)))
+_internship_lists = OrderedDict()
+_internship_lists_lock = threading.Lock()
+
+
+def _list_version(rows) -> tuple:
+    return max((row.get('updated_at') or '' for row in rows), default=''), len(rows)
+
+
+def _sort_internships(rows):
+    """Sorts rows in list order: status rank, then newest first."""
+    rows.sort(key=lambda row: row.get('id') or 0, reverse=True)
+    rows.sort(key=lambda row: row.get('created_at') or '', reverse=True)
+    rows.sort(key=lambda row: row.get('status_rank', 3))
+
+
+def _apply_to_internship_list(user_id: str, inserted, updated, deleted):
+    with _internship_lists_lock:
+        entry = _internship_lists.get(user_id)
+        if not entry:
+            return
+        changed = [{field: row.get(field) for field in _LIST_FIELDS} for row in [*inserted, *updated]]
+        removed_ids = {row.get('id') for row in [*updated, *deleted]}
+        rows = [row for row in entry['rows'] if row.get('id') not in removed_ids] + changed
+        _sort_internships(rows)
+        entry['rows'] = rows
+
+
+def _record_write(user_id: str, inserted=(), updated=(), deleted=()):
+    """Applies rows returned by this process's writes to the user's cached list and counts."""
+    _apply_to_internship_list(user_id, inserted, updated, deleted)
+    _adjust_status_counts(user_id, inserted, 1)
+    _adjust_status_counts(user_id, deleted, -1)
+    if updated:
+        # The previous statuses are unknown, so the cached counts are refreshed on next read
+        _invalidate_status_counts(user_id)
+
+
+# --- Shared clients ---
+# One client per process: its HTTP connection pool is kept alive and reused by every
+# SupabaseDB, so a page interaction no longer pays for client setup and a TLS handshake.
+# Sign-in and sign-up go through a separate auth client, because signing in switches a
+# client's requests to that user's token and the data client is shared by all sessions.
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _create_client(options: ClientOptions = None) -> Client:
+    if not all([SUPABASE_URL, SUPABASE_KEY]):
+        raise ConnectionError("Supabase URL or Key is not set. Check your config.py, environment variables, or Streamlit secrets.")
+    try:
+        print(f"Initializing Supabase client with URL: {SUPABASE_URL}")
+        client = create_client(SUPABASE_URL, SUPABASE_KEY, options) if options else create_client(SUPABASE_URL, SUPABASE_KEY)
+        print("Supabase client initialized successfully")
+        return client
+    except Exception as e:
+        print(f"Supabase initialization error: {str(e)}")
+        raise ConnectionError(f"Failed to initialize Supabase client: {e}") from e
+
+
+def get_supabase_client() -> Client:
+    """Returns the process-wide Supabase data client, creating it on first use. Never sign in on it."""
+    with _clients_lock:
+        if 'data' not in _clients:
+            client = _create_client()
+            client.postgrest  # Build the pooled HTTP client now rather than racing on first use
+            _clients['data'] = client
+        return _clients['data']
+
+
+def get_auth_client() -> Client:
+    """Returns the process-wide client used only for sign-in and sign-up calls."""
+    with _clients_lock:
+        if 'auth' not in _clients:
+            _clients['auth'] = _create_client(ClientOptions(auto_refresh_token=False, persist_session=False))
+        return _clients['auth']
+
+
+@st.cache_resource(show_spinner=False)
+def _ui_supabase_client() -> Client:
+    return get_supabase_client()
+
+
+def get_db() -> "SupabaseDB":
+    """The database for the current Streamlit session: the shared client with this session's auth context."""
+    return SupabaseDB(user_session=st.session_state.get('user_session'), client=_ui_supabase_client())
+
+
 class SupabaseDB:
     """A class to manage all interactions with the Supabase database."""
-    def __init__(self):
-        """Initializes the Supabase client."""
-        if not all([SUPABASE_URL, SUPABASE_KEY]):
-            raise ConnectionError("Supabase URL or Key is not set. Check your config.py, environment variables, or Streamlit secrets.")
-        
-        try:
-            print(f"Initializing Supabase client with URL: {SUPABASE_URL}")
-            # Simple initialization without any additional parameters
-            self.client: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-            print("Supabase client initialized successfully")
-        except Exception as e:
-            print(f"Supabase initialization error: {str(e)}")
-            raise ConnectionError(f"Failed to initialize Supabase client: {e}") from e
+    def __init__(self, user_session=None, client: Client = None):
+        """Binds the shared Supabase client to an optional signed-in user session."""
+        self.client: Client = client or get_supabase_client()
+        self.user_session = user_session
 
     def sign_up_user(self, email, password, username, telegram_bot_token=None, telegram_chat_id=None):
         """Signs up a new user, creates their profile, and sets up a default subscription."""
@@ -51,7 +264,8 @@ class SupabaseDB:
                     return {"error": "Invalid Telegram Chat ID format. It should be a number (can be negative for groups)."}
 
             # 1. Create auth user
-            res = self.client.auth.sign_up({"email": email, "password": password})
+            auth = get_auth_client().auth
+            res = auth.sign_up({"email": email, "password": password})
             user = res.user
             if not user:
                 return {"error": "Failed to create authentication user."}
@@ -59,7 +273,7 @@ class SupabaseDB:
             # 2. Wait for user to exist in auth.users (retry up to 10 times)
             user_exists = False
             for _ in range(10):
-                user_check = self.client.auth.admin.get_user_by_id(user.id)
+                user_check = auth.admin.get_user_by_id(user.id)
                 if user_check and getattr(user_check, 'user', None):
                     user_exists = True
                     break
@@ -101,11 +315,11 @@ class SupabaseDB:
                 try:
                     user_check = None
                     try:
-                        user_check = self.client.auth.admin.get_user_by_id(user.id)
+                        user_check = get_auth_client().auth.admin.get_user_by_id(user.id)
                     except Exception:
                         pass
                     if user_check and getattr(user_check, 'user', None):
-                        self.client.auth.admin.delete_user(user.id)
+                        get_auth_client().auth.admin.delete_user(user.id)
                     else:
                         print(f"WARNING: User {user.id} not found in auth system, nothing to clean up after sign-up error.")
                 except Exception as admin_e:
@@ -118,20 +332,21 @@ class SupabaseDB:
             return {"error": f"An unexpected error occurred during sign-up: {e}"}
 
     def sign_in_user(self, email, password):
-        """Signs in an existing user."""
+        """Signs in an existing user and binds this instance to the new session."""
         try:
-            res = self.client.auth.sign_in_with_password({"email": email, "password": password})
+            res = get_auth_client().auth.sign_in_with_password({"email": email, "password": password})
+            self.user_session = res.session
             return {"success": True, "session": res.session}
         except Exception as e:
             return {"error": "Invalid login credentials."}
 
     def get_user_profile(self, user_id=None):
-        """Gets the profile of the specified user, or the currently authenticated user if user_id is None."""
+        """Gets the profile of the specified user, or the session's user if user_id is None."""
         try:
             if user_id is None:
-                user_response = self.client.auth.get_user()
-                if user_response and user_response.user:
-                    user_id = user_response.user.id
+                session_user = getattr(self.user_session, 'user', None)
+                if session_user:
+                    user_id = session_user.id
                 else:
                     return None
             profile_res = self.client.table('profiles').select('*').eq('id', user_id).single().execute()
@@ -145,6 +360,7 @@ class SupabaseDB:
             job_data['user_id'] = user_id
             data, count = self.client.table('internships').insert(job_data).execute()
             if data and len(data[1]) > 0:
+                _record_write(user_id, inserted=data[1][:1])
                 return {'success': True, 'data': data[1][0], 'is_new': True}
             else:
                 return {'error': 'Failed to insert data.'}
@@ -153,100 +369,199 @@ class SupabaseDB:
                 return {"error": "duplicate", "message": "You have already saved this internship."}
             return {"error": str(e)}
 
-    def get_internships_by_user(self, user_id: str):
-        """Fetches all internship records for a specific user."""
+    def add_internships_bulk(self, user_id: str, jobs: list):
+        """Saves many internships for a user in one upsert, skipping links the user already has.
+
+        Returns ``{'success', 'results', 'inserted', 'duplicates', 'errors'}``. ``results`` has
+        one entry per job, in order: ``{'status': 'inserted', 'data': row}``,
+        ``{'status': 'duplicate'}`` or ``{'status': 'error', 'error': message}``.
+        """
+        results, rows, row_positions = split_bulk_jobs(user_id, jobs)
+        inserted_rows, error = [], None
+        if rows:
+            try:
+                inserted_rows = bulk_upsert_query(self.client, rows).execute().data or []
+            except Exception as e:
+                print(f"Error saving {len(rows)} internships: {e}")
+                error = e
+        report = settle_bulk_results(results, row_positions, inserted_rows, error)
+        _record_write(user_id, inserted=[result['data'] for result in results if result['status'] == 'inserted'])
+        return report
+
+    def get_internships_by_user(self, user_id: str, columns: str = '*', statuses=None,
+                                limit: int = None, offset: int = 0, after: dict = None):
+        """Fetches internship records for a specific user, ordered by the database.
+
+        Rows come new -> applied -> rejected, newest first within a status (the
+        ``status_rank`` column from supabase/migrations). ``columns`` is a select list such
+        as ``INTERNSHIP_LIST_COLUMNS``; ``statuses`` keeps only those statuses. Page with
+        ``limit`` and ``offset``, or pass the last row of the previous page as ``after``
+        for a keyset cursor (it needs the ``status_rank``, ``created_at`` and ``id`` columns,
+        which are always selected when a projection is given).
+        """
         if not user_id:
             return []
-            
+
         try:
-            response = self.client.table('internships').select('*').eq('user_id', user_id).execute()
-            
-            # Get data from response
-            data = response.data if hasattr(response, 'data') else response
-            
-            if not data:
-                return []
-                
-            internships = data if isinstance(data, list) else []
-            
-            # Sort internships by status priority (new -> applied -> rejected) and then by date
-            try:
-                sorted_internships = sorted(
-                    internships,
-                    key=lambda x: (
-                        # Status priority (0: new, 1: applied, 2: rejected)
-                        {'new': 0, 'applied': 1, 'rejected': 2}.get(x.get('status', 'new'), 3),
-                        # Reverse date order (newest first)
-                        -int(datetime.fromisoformat(x.get('created_at', '').replace('Z', '+00:00')).timestamp() if x.get('created_at') else 0)
-                    )
-                )
-                return sorted_internships
-            except Exception:
-                # If sorting fails, return unsorted internships
-                return internships
+            query = internships_query(self.client, user_id, columns, statuses, limit, offset, after)
+            response = query.execute()
+            return response.data or []
         except Exception as e:
             raise Exception(f"Failed to fetch internships: {str(e)}")
 
-    def update_internship_status(self, user_id: str, internship_id: int, new_status: str):
-        """Updates the status of a specific internship for a user."""
+    def get_user_internships(self, user_id: str):
+        """The user's internship list (``INTERNSHIP_LIST_COLUMNS``, list order), read through the process cache.
+
+        The cached list is returned as is for INTERNSHIP_CACHE_REVALIDATE_SECONDS after a
+        check, then revalidated against the database's version stamp and reloaded when it
+        differs from the stamp of the last load (this process's own writes included, as
+        they may have been interleaved with others'). If the stamp cannot be read, the
+        cached list is served.
+        """
+        if not user_id:
+            return []
+        with _internship_lists_lock:
+            entry = _internship_lists.get(user_id)
+            if entry:
+                _internship_lists.move_to_end(user_id)
+                if time.monotonic() - entry['checked_at'] < INTERNSHIP_CACHE_REVALIDATE_SECONDS:
+                    return list(entry['rows'])
+                cached_version = entry['version']
+
+        if entry:
+            try:
+                current = self._internships_version(user_id) == cached_version
+            except Exception as e:
+                print(f"Error revalidating internships: {e}")
+                current = True
+            if current:
+                with _internship_lists_lock:
+                    entry['checked_at'] = time.monotonic()
+                    return list(entry['rows'])
+
+        rows = self.get_internships_by_user(user_id, columns=INTERNSHIP_LIST_COLUMNS)
+        with _internship_lists_lock:
+            # The stamp of this database read; local writes change the rows but not the stamp,
+            # so the next revalidation still sees (and loads) other processes' changes
+            _internship_lists[user_id] = {'rows': list(rows), 'version': _list_version(rows),
+                                          'checked_at': time.monotonic()}
+            _internship_lists.move_to_end(user_id)
+            while len(_internship_lists) > INTERNSHIP_CACHE_MAX_USERS:
+                _internship_lists.popitem(last=False)
+        return list(rows)
+
+    def _internships_version(self, user_id: str) -> tuple:
+        """The (max(updated_at), count) stamp of a user's internships, in one small request."""
+        response = self.client.table('internships').select('updated_at', count='exact').eq(
+            'user_id', user_id).order('updated_at', desc=True).limit(1).execute()
+        latest = (response.data[0].get('updated_at') or '') if response.data else ''
+        return latest, response.count or 0
+
+    def get_status_counts(self, user_id: str) -> dict:
+        """Returns ``{'total', 'new', 'applied', 'rejected'}`` counts for a user without loading the rows."""
+        if not user_id:
+            return _empty_status_counts()
+        with _status_counts_lock:
+            cached = _status_counts.get(user_id)
+            if cached and not cached['stale'] and time.monotonic() - cached['fetched_at'] < STATUS_COUNTS_TTL_SECONDS:
+                return dict(cached['counts'])
+
         try:
-            # Validate status
-            if new_status not in ['new', 'applied', 'rejected']:
-                raise ValueError(f"Invalid status: {new_status}")
+            counts = self._status_counts_from_rpc(user_id) if _status_counts_rpc['available'] else None
+        except Exception as e:
+            print(f"Error fetching status counts: {e}")
+            if getattr(e, 'code', None) == _MISSING_FUNCTION_CODE:
+                print("ⓘ internship_status_counts is not installed; counting with count queries from now on.")
+                _status_counts_rpc['available'] = False
+            counts = None
+        if counts is None:
+            try:
+                counts = self._count_statuses(user_id)
+            except Exception as count_error:
+                print(f"Error counting statuses: {count_error}")
+                return dict(cached['counts']) if cached else _empty_status_counts()
 
-            # Ensure internship_id is an integer
-            internship_id = int(internship_id)
-            
-            # First verify the internship exists and belongs to the user
-            verify = self.client.table('internships').select('id').match({
-                'id': internship_id,
+        with _status_counts_lock:
+            _status_counts[user_id] = {'counts': counts, 'fetched_at': time.monotonic(), 'stale': False}
+        return dict(counts)
+
+    def _status_counts_from_rpc(self, user_id: str) -> dict:
+        response = self.client.rpc('internship_status_counts', {'p_user_id': user_id}).execute()
+        counts = _empty_status_counts()
+        for row in response.data or []:
+            counts['total'] += row['count']
+            if row['status'] in counts:
+                counts[row['status']] = row['count']
+        return counts
+
+    def _count_statuses(self, user_id: str) -> dict:
+        """Status counts from header-only count queries, for databases without the RPC."""
+        def count(query):
+            return query.execute().count or 0
+
+        table = self.client.table('internships')
+        counts = {'total': count(table.select('id', count='exact', head=True).eq('user_id', user_id))}
+        for status in INTERNSHIP_STATUSES:
+            counts[status] = count(
+                table.select('id', count='exact', head=True).eq('user_id', user_id).eq('status', status))
+        return counts
+
+    def get_internship(self, user_id: str, internship_id: int, columns: str = '*'):
+        """Fetches one internship of a user (for example its full description), or None."""
+        try:
+            response = self.client.table('internships').select(columns).match({
+                'id': int(internship_id),
                 'user_id': user_id
-            }).execute()
-            
-            if not verify.data or len(verify.data) == 0:
-                raise ValueError(f"Internship not found or access denied")
-            
-            # Update the status
+            }).limit(1).execute()
+            return response.data[0] if response.data else None
+        except Exception as e:
+            print(f"Error fetching internship {internship_id}: {e}")
+            return None
+
+    def update_internship_status(self, user_id: str, internship_id: int, new_status: str):
+        """Updates the status of a specific internship for a user in one statement.
+
+        Returns the updated row, or None when the internship does not exist or belongs
+        to another user.
+        """
+        rows = self.update_internships_status(user_id, [internship_id], new_status)
+        return rows[0] if rows else None
+
+    def update_internships_status(self, user_id: str, internship_ids, new_status: str):
+        """Sets the status of many of a user's internships in one statement. Returns the updated rows."""
+        # Validate status
+        if new_status not in INTERNSHIP_STATUSES:
+            raise ValueError(f"Invalid status: {new_status}")
+        ids = [int(internship_id) for internship_id in internship_ids]
+        if not ids:
+            return []
+        try:
+            # The user_id condition makes the update a no-op for other users' rows
             response = self.client.table('internships').update({
                 'status': new_status
-            }).match({
-                'id': internship_id,
-                'user_id': user_id
-            }).execute()
-            
-            if not response.data or len(response.data) == 0:
-                return False
-                
-            return True
-            
-        except ValueError as e:
-            raise ValueError(str(e))
+            }).eq('user_id', user_id).in_('id', ids).execute()
+            _record_write(user_id, updated=response.data or [])
+            return response.data or []
         except Exception as e:
             raise Exception(f"Database error: {str(e)}")
 
     def delete_internship(self, user_id: str, internship_id: int):
-        """Deletes a specific internship for a user."""
+        """Deletes a specific internship for a user. Returns the deleted row, or None."""
+        rows = self.delete_internships(user_id, [internship_id])
+        return rows[0] if rows else None
+
+    def delete_internships(self, user_id: str, internship_ids):
+        """Deletes many of a user's internships in one statement. Returns the deleted rows."""
         try:
-            # Convert internship_id to integer if it's a string
-            if isinstance(internship_id, str):
-                internship_id = int(internship_id)
-                
-            response = self.client.table('internships').delete().match({
-                'id': internship_id,
-                'user_id': user_id
-            }).execute()
-            
-            # Debug prints
-            print(f"Delete response: {response}")
-            if hasattr(response, 'data'):
-                print(f"Response data: {response.data}")
-                if len(response.data) > 0:
-                    return True
-            
-            return False
+            ids = [int(internship_id) for internship_id in internship_ids]
+            if not ids:
+                return []
+            response = self.client.table('internships').delete().eq('user_id', user_id).in_('id', ids).execute()
+            _record_write(user_id, deleted=response.data or [])
+            return response.data or []
         except Exception as e:
-            print(f"Error deleting internship: {str(e)}")  # Debug print
-            return False
+            print(f"Error deleting internships: {str(e)}")
+            return []
 
     def get_all_internship_links(self, user_id: str):
         """Fetches all application_link URLs for a specific user to prevent duplicates."""
@@ -267,4 +582,60 @@ class SupabaseDB:
             return hasattr(res, 'data') and res.data is not None
         except Exception as e:
             print(f"Error updating Telegram config: {e}")
-            return False
\ No newline at end of file
+            return False
+
+    # --- Continuous search subscriptions ---
+
+    def get_search_subscription(self, user_id: str):
+        """Returns the user's continuous search row (active or stopped), or None."""
+        try:
+            response = self.client.table('search_subscriptions').select('*').eq('user_id', user_id).limit(1).execute()
+            return response.data[0] if response.data else None
+        except Exception as e:
+            print(f"Error fetching search subscription: {e}")
+            return None
+
+    def start_search_subscription(self, user_id: str, job_title: str, location: str, next_run_at: datetime):
+        """Starts (or restarts with a new query) the user's continuous search; returns the row or None."""
+        try:
+            response = self.client.table('search_subscriptions').upsert({
+                'user_id': user_id,
+                'job_title': job_title,
+                'location': location or '',
+                'active': True,
+                'next_run_at': next_run_at.isoformat(),
+                'last_error': None,
+            }, on_conflict='user_id').execute()
+            return response.data[0] if response.data else None
+        except Exception as e:
+            print(f"Error starting search subscription: {e}")
+            return None
+
+    def stop_search_subscription(self, user_id: str) -> bool:
+        try:
+            self.client.table('search_subscriptions').update({'active': False}).eq('user_id', user_id).execute()
+            return True
+        except Exception as e:
+            print(f"Error stopping search subscription: {e}")
+            return False
+
+    def get_active_search_subscriptions(self):
+        """All active continuous searches in due order."""
+        response = self.client.table('search_subscriptions').select(
+            'id,user_id,job_title,location,next_run_at').eq('active', True).order('next_run_at').execute()
+        return response.data or []
+
+    def update_search_subscriptions_run(self, subscription_ids, next_run_at: datetime,
+                                        last_run_at: datetime = None, last_error: str = None):
+        """Records a scheduled run: when the subscriptions are due next, and how the last run went."""
+        update_data = {'next_run_at': next_run_at.isoformat()}
+        if last_run_at is not None:
+            update_data['last_run_at'] = last_run_at.isoformat()
+            update_data['last_error'] = last_error
+        ids = [int(subscription_id) for subscription_id in subscription_ids]
+        if not ids:
+            return
+        try:
+            self.client.table('search_subscriptions').update(update_data).in_('id', ids).execute()
+        except Exception as e:
+            print(f"Error updating search subscriptions {ids}: {e}")
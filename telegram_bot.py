@@ -1,4 +1,9 @@
+import asyncio
 import logging
+from html import escape
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from telegram import Update, ReplyKeyboardMarkup, ReplyKeyboardRemove, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import (
     Application,
@@ -9,8 +14,11 @@ from telegram.ext import (
     CallbackQueryHandler,
     filters,
 )
-from supabase_db import get_supabase_client, get_or_create_user_by_telegram_id, add_internship, get_internships_by_user, delete_internship, update_internship_status
-from scraper import scrape_linkedin
+from telegram.error import TelegramError
+from async_supabase_db import get_async_db
+from notifications import MAX_MESSAGE_LENGTH, safe_cut
+from scraper import iter_scrape_linkedin
+from scrape_events import JobFound, ScrapeError, aiter_events
 
 # Import config
 try:
@@ -29,40 +37,58 @@ logger = logging.getLogger(__name__)
 GET_TITLE, GET_COMPANY, GET_LINK, GET_DESCRIPTION, GET_SOURCE_URL, GET_SOURCE_SITE = range(6)
 GET_SCRAPE_QUERY, GET_SCRAPE_LOCATION = range(7, 9)
 
+# --- Background scrapes ---
+SCRAPE_WORKERS = 2  # Scrapes running at the same time, across all users
+MAX_SCRAPES_PER_USER = 1  # Scrapes a single user may have queued or running
+SCRAPE_SAVE_BATCH_SIZE = 50  # Scraped internships saved per bulk upsert
+PROGRESS_EDIT_INTERVAL = 3.0  # Seconds between two edits of a progress message
+
+scrape_executor = ThreadPoolExecutor(max_workers=SCRAPE_WORKERS, thread_name_prefix="scrape")
+_scrape_slots = asyncio.Semaphore(SCRAPE_WORKERS)
+_active_scrapes = Counter()
+
 # --- Constants for Internship Statuses ---
-STATUS_OPTIONS = ["Applied", "Interviewing", "Offer", "Rejected", "Saved"]
+# Labels for the statuses stored in the database (see supabase_db.INTERNSHIP_STATUSES)
+STATUS_OPTIONS = ["New", "Applied", "Rejected"]
 
 # --- Bot Handlers ---
 
+async def get_profile(context: ContextTypes.DEFAULT_TYPE, telegram_user):
+    """Returns the web app profile linked to this Telegram user, remembering it for the conversation."""
+    profile = context.user_data.get('profile')
+    if not profile:
+        db = await get_async_db()
+        profile = await db.get_profile_by_telegram_id(telegram_user.id)
+        if profile:
+            context.user_data['profile'] = profile
+    return profile
+
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     user = update.effective_user
     logger.info(f"/start by {user.username}")
-    supabase = get_supabase_client()
-    if not supabase:
+    try:
+        profile = await get_profile(context, user)
+    except ConnectionError:
         await update.message.reply_text("DB connection failed.")
         return
 
-    profile, is_new = get_or_create_user_by_telegram_id(supabase, {'id': user.id, 'username': user.username})
-    context.user_data['profile'] = profile
-
     if profile:
         reply = f"Welcome back, {user.mention_html()}!"
-        if is_new:
-            reply = f"Welcome, {user.mention_html()}! Your account is set up."
         reply += "\n\nUse /add to save an internship or /view to see your list."
         await update.message.reply_html(reply)
     else:
-        await update.message.reply_text("Sorry, could not set up your account.")
+        await update.message.reply_text(
+            f"I couldn't find your account. Sign up in the web app and set your Telegram Chat ID to {user.id} "
+            "under Telegram Settings, then send /start again."
+        )
 
 async def add_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     """Starts the conversation to add a new internship."""
     user = update.effective_user
-    supabase = get_supabase_client()
-    profile, _ = get_or_create_user_by_telegram_id(supabase, {'id': user.id, 'username': user.username})
+    profile = await get_profile(context, user)
     if not profile:
         await update.message.reply_text("Could not find your profile. Please try /start again.")
         return ConversationHandler.END
-    context.user_data['profile'] = profile
     
     await update.message.reply_text("Let's add a new internship. What is the job title?")
     return GET_TITLE
@@ -94,8 +120,8 @@ async def get_source_url(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 async def _save_internship(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Helper function to save internship data to the database."""
-    supabase = get_supabase_client()
-    profile = context.user_data.get('profile')
+    db = await get_async_db()
+    profile = await get_profile(context, update.effective_user)
 
     job_data = {
         'job_title': context.user_data.get('job_title'),
@@ -106,10 +132,10 @@ async def _save_internship(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         'source_site': context.user_data.get('source_site'),
     }
 
-    result = add_internship(supabase, profile['id'], job_data)
+    result = await db.add_internship(profile['id'], job_data)
 
     if result and 'error' in result:
-        await update.message.reply_text(f"Error: {result['message']}")
+        await update.message.reply_text(f"Error: {result.get('message', result['error'])}")
     elif result:
         await update.message.reply_text("Success! I've saved this internship.")
     else:
@@ -155,94 +181,230 @@ async def get_scrape_query(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     return GET_SCRAPE_LOCATION
 
 async def get_scrape_location(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
-    """Stores location, runs scraper, saves results, and notifies user."""
+    """Stores location and queues the scrape; results are reported in a progress message."""
     location = update.message.text
-    query = context.user_data['scrape_query']
+    query = context.user_data.pop('scrape_query', None)
     user = update.effective_user
-    
-    await update.message.reply_text(f"Scraping for '{query}' in '{location}'. This might take a moment...")
 
-    supabase = get_supabase_client()
-    profile = context.user_data.get('profile')
+    profile = await get_profile(context, user)
     if not profile:
-        profile, _ = get_or_create_user_by_telegram_id(supabase, {'id': user.id, 'username': user.username})
-        if not profile:
-            await update.message.reply_text("I couldn't find your profile to save the jobs. Please try /start first.")
-            return ConversationHandler.END
-    
-    scraped_jobs = scrape_linkedin(job_title=query, location=location)
-    
-    if not scraped_jobs:
-        await update.message.reply_text("I couldn't find any new internships with that query. Try a different search.")
+        await update.message.reply_text("I couldn't find your profile to save the jobs. Please try /start first.")
         return ConversationHandler.END
-        
-    new_count = 0
-    duplicate_count = 0
-    error_count = 0
-    
-    for job in scraped_jobs:
-        result = add_internship(supabase, profile['id'], job)
-        if result and 'error' in result and result['error'] == 'duplicate':
-            duplicate_count += 1
-        elif result:
-            new_count += 1
-        else:
-            error_count += 1
-            
+
+    if _active_scrapes[user.id] >= MAX_SCRAPES_PER_USER:
+        await update.message.reply_text("You already have a search running. I'll post its results when it finishes.")
+        return ConversationHandler.END
+
+    # The scrape runs in the background so the bot keeps answering everyone meanwhile
+    _active_scrapes[user.id] += 1
+    try:
+        progress_message = await update.message.reply_text(f"⏳ Queued a search for '{query}' in '{location}'...")
+    except TelegramError:
+        _active_scrapes[user.id] -= 1
+        raise
+    context.application.create_task(
+        run_scrape_job(progress_message, profile['id'], user, query, location), update=update)
+    return ConversationHandler.END
+
+async def _edit_progress(message, text: str) -> None:
+    try:
+        await message.edit_text(text)
+    except TelegramError as e:
+        # Progress edits are best effort (e.g. "message is not modified" or flood control)
+        logger.warning(f"Could not update progress message: {e}")
+
+async def run_scrape_job(progress_message, user_id, telegram_user, query: str, location: str) -> None:
+    """Runs one scrape on the worker pool, saving jobs in batches and editing the progress message as they
+    arrive, then posts a summary."""
+    try:
+        async with _scrape_slots:
+            await _edit_progress(progress_message, f"🔎 Scraping for '{query}' in '{location}'. This might take a moment...")
+            db = await get_async_db()
+            found_count = new_count = duplicate_count = error_count = 0
+            scrape_error = None
+            pending = []
+            last_edit = time.monotonic()
+
+            async def flush_pending():
+                nonlocal new_count, duplicate_count, error_count
+                saved = await db.add_internships_bulk(user_id, pending)
+                new_count += saved['inserted']
+                duplicate_count += saved['duplicates']
+                error_count += saved['errors']
+                pending.clear()
+
+            async for event in aiter_events(iter_scrape_linkedin, job_title=query, location=location,
+                                            executor=scrape_executor):
+                if isinstance(event, ScrapeError):
+                    scrape_error = event.message
+                    break
+                if not isinstance(event, JobFound):
+                    continue
+                found_count += 1
+                pending.append(event.job)
+                if len(pending) >= SCRAPE_SAVE_BATCH_SIZE:
+                    await flush_pending()
+                if time.monotonic() - last_edit >= PROGRESS_EDIT_INTERVAL:
+                    last_edit = time.monotonic()
+                    await _edit_progress(
+                        progress_message, f"🔎 Scraping for '{query}' in '{location}'... {found_count} internships found so far.")
+            if pending:
+                await flush_pending()
+    except Exception as e:
+        logger.exception(f"Scrape job failed for {telegram_user.username}: {e}")
+        await _edit_progress(progress_message, "Sorry, the search failed. Please try again later.")
+        return
+    finally:
+        _active_scrapes[telegram_user.id] -= 1
+        if _active_scrapes[telegram_user.id] <= 0:
+            del _active_scrapes[telegram_user.id]
+
+    if scrape_error and not found_count:
+        logger.error(f"Scrape failed for {telegram_user.username}: {scrape_error}")
+        await _edit_progress(progress_message, "Sorry, the search failed. Please try again later.")
+        return
+
+    if not found_count:
+        await _edit_progress(progress_message, "I couldn't find any new internships with that query. Try a different search.")
+        return
+
+    await _edit_progress(progress_message, f"✅ Search for '{query}' in '{location}' finished: {found_count} internships found.")
     message = f"Scraping complete! ✨\n\n"
     message += f"✅ Found and saved {new_count} new internships.\n"
     if duplicate_count > 0:
         message += f"👍 Found {duplicate_count} internships that were already in your list.\n"
     if error_count > 0:
         message += f"❌ Encountered {error_count} errors while saving.\n"
-        
+
     message += "\nYou can see them all with the /view command."
-    
-    await update.message.reply_text(message)
-    
-    context.user_data.clear()
-    return ConversationHandler.END
+
+    await progress_message.reply_text(message)
 
 async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     await update.message.reply_text("Operation cancelled.")
     context.user_data.clear()
     return ConversationHandler.END
 
+# --- /view pages ---
+VIEW_PAGE_SIZE = 10  # Internships listed per /view message
+VIEW_COLUMNS = 'id,job_title,company_name,status,application_link'
+MAX_DESCRIPTION_CHARS = 3000  # Longest escaped description shown in a details message
+STATUS_EMOJI = {'new': '✨', 'applied': '✅', 'rejected': '❌'}
+
+async def render_internship_page(db, user_id, page: int):
+    """Returns ``(text, reply_markup)`` for one /view page, or ``(None, None)`` when the user has no internships."""
+    # One extra row tells whether a next page exists
+    rows = await db.get_internships_by_user(
+        user_id, columns=VIEW_COLUMNS, limit=VIEW_PAGE_SIZE + 1, offset=page * VIEW_PAGE_SIZE)
+    if not rows and page > 0:
+        page = 0
+        rows = await db.get_internships_by_user(user_id, columns=VIEW_COLUMNS, limit=VIEW_PAGE_SIZE + 1)
+    if not rows:
+        return None, None
+    has_next = len(rows) > VIEW_PAGE_SIZE
+    rows = rows[:VIEW_PAGE_SIZE]
+
+    lines = [f"<b>Your saved internships</b> (page {page + 1})\n"]
+    for number, job in enumerate(rows, start=page * VIEW_PAGE_SIZE + 1):
+        status = job.get('status') or 'new'
+        lines.append(
+            f"{number}. {STATUS_EMOJI.get(status, '❔')} <b>{escape(job['job_title'] or '')}</b> at "
+            f"{escape(job['company_name'] or '')} - <a href='{escape(job.get('application_link') or '#')}'>Apply</a>"
+        )
+
+    detail_buttons = [
+        InlineKeyboardButton(f"ℹ️ {number}", callback_data=f"details_{job['id']}_{page}")
+        for number, job in enumerate(rows, start=page * VIEW_PAGE_SIZE + 1)
+    ]
+    keyboard = [detail_buttons[i:i + 5] for i in range(0, len(detail_buttons), 5)]
+    navigation = []
+    if page > 0:
+        navigation.append(InlineKeyboardButton("◀️ Prev", callback_data=f"page_{page - 1}"))
+    if has_next:
+        navigation.append(InlineKeyboardButton("Next ▶️", callback_data=f"page_{page + 1}"))
+    if navigation:
+        keyboard.append(navigation)
+    return "\n".join(lines), InlineKeyboardMarkup(keyboard)
+
+def render_internship_details(job: dict, page: int = 0):
+    """Returns ``(text, reply_markup)`` showing one internship with its actions."""
+    def build_text(description):
+        return (
+            f"<b>{escape(job['job_title'] or '')} at {escape(job['company_name'] or '')}</b>\n"
+            f"- <b>Status:</b> {escape(job.get('status') or 'N/A')}\n"
+            f"- <b>Description:</b> {description}\n"
+            f"- <b>Source:</b> <a href='{escape(job.get('source_url') or '#')}'>{escape(job.get('source_site') or 'N/A')}</a>\n"
+            f"- <b>Apply:</b> <a href='{escape(job.get('application_link') or '#')}'>Link</a>"
+        )
+
+    # Truncate after escaping, so the sent text fits Telegram's limit and no entity is cut
+    description = escape(job.get('job_description') or 'N/A')
+    limit = min(MAX_DESCRIPTION_CHARS, MAX_MESSAGE_LENGTH - len(build_text('...')))
+    if len(description) > limit:
+        description = description[:safe_cut(description, max(limit, 0))] + '...'
+    text = build_text(description)
+    keyboard = [
+        [
+            InlineKeyboardButton("✏️ Update Status", callback_data=f"update_{job['id']}_{page}"),
+            InlineKeyboardButton("🗑️ Delete", callback_data=f"delete_{job['id']}_{page}")
+        ],
+        [InlineKeyboardButton("⬅️ Back to list", callback_data=f"page_{page}")]
+    ]
+    return text, InlineKeyboardMarkup(keyboard)
+
 async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handles inline button presses for updating and deleting internships."""
+    """Handles inline button presses: /view paging, details, status updates and deletes."""
     query = update.callback_query
     await query.answer() # Acknowledge the button press
 
-    # Callback data is in the format "action_internshipId_optionalData"
+    # Callback data is "page_<page>" or "<action>_<internshipId>_<page>[_<status>]"
     parts = query.data.split('_')
     action = parts[0]
-    internship_id = int(parts[1])
 
-    user_id = context.user_data.get('user_id')
-    supabase = get_supabase_client()
+    db = await get_async_db()
+    profile = await get_profile(context, query.from_user)
+    if not profile:
+        await query.edit_message_text(text="Error: Could not identify your profile. Please /start again.")
+        return
+    user_id = profile['id']
 
-    # Ensure user_id is available, fetching if necessary
-    if not user_id:
-        telegram_user = query.from_user
-        user_id, _ = get_or_create_user_by_telegram_id(supabase, telegram_user.id, telegram_user.username)
-        if user_id:
-            context.user_data['user_id'] = user_id
-        else:
-            await query.edit_message_text(text="Error: Could not identify your profile. Please /start again.")
+    # --- Handle PAGE action (show a page of the list in the same message) ---
+    if action == 'page':
+        text, reply_markup = await render_internship_page(db, user_id, int(parts[1]))
+        if text is None:
+            await query.edit_message_text(text="You haven't saved any internships yet. Use /add.")
+            return
+        await query.edit_message_text(text=text, reply_markup=reply_markup, parse_mode='HTML',
+                                      disable_web_page_preview=True)
+        return
+
+    internship_id = int(parts[1])
+    page = int(parts[2]) if len(parts) > 2 else 0
+
+    # --- Handle DETAILS action (load the full description on demand) ---
+    if action == 'details':
+        job = await db.get_internship(user_id, internship_id)
+        if not job:
+            await query.edit_message_text(text="Error: Could not find this internship.")
             return
+        text, reply_markup = render_internship_details(job, page)
+        await query.edit_message_text(text=text, reply_markup=reply_markup, parse_mode='HTML',
+                                      disable_web_page_preview=True)
 
     # --- Handle DELETE action ---
-    if action == 'delete':
-        success = delete_internship(supabase, user_id, internship_id)
+    elif action == 'delete':
+        success = await db.delete_internship(user_id, internship_id)
         if success:
-            await query.edit_message_text(text="🗑️ Internship has been deleted.")
+            await query.edit_message_text(
+                text="🗑️ Internship has been deleted.",
+                reply_markup=InlineKeyboardMarkup([[InlineKeyboardButton("⬅️ Back to list", callback_data=f"page_{page}")]]))
         else:
             await query.edit_message_text(text="Error: Could not delete internship.")
 
     # --- Handle UPDATE action (show status options) ---
     elif action == 'update':
         status_buttons = [
-            InlineKeyboardButton(status, callback_data=f"setstatus_{internship_id}_{status}")
+            InlineKeyboardButton(status, callback_data=f"setstatus_{internship_id}_{page}_{status}")
             for status in STATUS_OPTIONS
         ]
         # Group buttons into rows of 2 for a cleaner look
@@ -252,29 +414,18 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     # --- Handle SETSTATUS action (apply the new status) ---
     elif action == 'setstatus':
-        new_status = parts[2]
-        updated_job = update_internship_status(supabase, user_id, internship_id, new_status)
+        new_status = parts[3].lower()
+        try:
+            updated_job = await db.update_internship_status(user_id, internship_id, new_status)
+        except Exception as e:
+            logger.error(f"Status update failed: {e}")
+            updated_job = None
 
         if updated_job:
-            # Re-create the original keyboard with Delete and Update buttons
-            original_keyboard = [
-                [
-                    InlineKeyboardButton("✏️ Update Status", callback_data=f"update_{updated_job['id']}"),
-                    InlineKeyboardButton("🗑️ Delete", callback_data=f"delete_{updated_job['id']}")
-                ]
-            ]
-            reply_markup = InlineKeyboardMarkup(original_keyboard)
-
-            # Re-create the message content with the new status
-            message_text = (
-                f"<b>{updated_job['job_title']} at {updated_job['company_name']}</b>\n"
-                f"- <b>Status:</b> {updated_job.get('status', 'N/A')}\n"
-                f"- <b>Description:</b> {updated_job.get('job_description', 'N/A')}\n"
-                f"- <b>Source:</b> <a href='{updated_job.get('source_url', '#')}'>{updated_job.get('source_site', 'N/A')}</a>\n"
-                f"- <b>Apply:</b> <a href='{updated_job.get('application_link', '#')}'>Link</a>"
-            )
+            # Re-create the details message with the new status
+            text, reply_markup = render_internship_details(updated_job, page)
             await query.edit_message_text(
-                text=message_text,
+                text=text,
                 reply_markup=reply_markup,
                 parse_mode='HTML',
                 disable_web_page_preview=True
@@ -283,43 +434,20 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             await query.edit_message_text(text="Error: Could not update status.")
 
 async def view_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Displays all saved internships for the user."""
+    """Shows the user's saved internships, one page per message with inline navigation."""
     user = update.effective_user
     logger.info(f"/view by {user.username}")
-    supabase = get_supabase_client()
-
-    profile = context.user_data.get('profile')
+    profile = await get_profile(context, user)
     if not profile:
-        profile, _ = get_or_create_user_by_telegram_id(supabase, {'id': user.id, 'username': user.username})
-        if not profile:
-            await update.message.reply_text("Could not find your profile. Please try /start.")
-            return
-        context.user_data['profile'] = profile
-
-    internships = get_internships_by_user(supabase, profile['id'])
+        await update.message.reply_text("Could not find your profile. Please try /start.")
+        return
 
-    if not internships:
+    db = await get_async_db()
+    text, reply_markup = await render_internship_page(db, profile['id'], 0)
+    if text is None:
         await update.message.reply_text("You haven't saved any internships yet. Use /add.")
         return
-
-    await update.message.reply_text("Here are your saved internships:")
-    for job in internships:
-        keyboard = [
-            [
-                InlineKeyboardButton("✏️ Update Status", callback_data=f"update_{job['id']}"),
-                InlineKeyboardButton("🗑️ Delete", callback_data=f"delete_{job['id']}")
-            ]
-        ]
-        reply_markup = InlineKeyboardMarkup(keyboard)
-
-        message = (
-            f"<b>{job['job_title']} at {job['company_name']}</b>\n"
-            f"- <b>Status:</b> {job.get('status', 'N/A')}\n"
-            f"- <b>Description:</b> {job.get('job_description', 'N/A')}\n"
-            f"- <b>Source:</b> <a href='{job.get('source_url', '#')}'>{job.get('source_site', 'N/A')}</a>\n"
-            f"- <b>Apply:</b> <a href='{job.get('application_link', '#')}'>Link</a>"
-        )
-        await update.message.reply_html(message, reply_markup=reply_markup, disable_web_page_preview=True)
+    await update.message.reply_html(text, reply_markup=reply_markup, disable_web_page_preview=True)
 
 def main() -> None:
     """Sets up and runs the bot."""
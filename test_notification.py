@@ -1,4 +1,4 @@
-from notifications import send_telegram_notification
+from notifications import flush_notifications, send_telegram_notification
 
 telegram_bot_token = "bot_token"
 telegram_chat_id = "YOUR_CHAT_ID_HERE"
@@ -10,4 +10,8 @@ else:
     print("Sending a test notification to your Telegram...")
     message = "👋 Hello! This is a test message from your AI Internship Assistant. If you received this, your notifications are working correctly!"
     send_telegram_notification(message, telegram_bot_token, telegram_chat_id)
-    print("Success: Test notification script finished.")
+    # Notifications are sent in the background; wait for delivery before exiting
+    if flush_notifications(timeout=30):
+        print("Success: Test notification script finished.")
+    else:
+        print("Error: Timed out waiting for the notification to be sent.")
@@ -0,0 +1,45 @@
+import time
+
+from job_queue import ScrapeJobQueue
+
+
+def make_queue(tmp_path):
+    return ScrapeJobQueue(str(tmp_path / "scrape_jobs.sqlite3"))
+
+
+def test_each_job_is_claimed_once(tmp_path):
+    queue = make_queue(tmp_path)
+    job_id = queue.enqueue("user-1", "Software Engineer Intern", "Canada", True)
+
+    job = queue.claim("worker-a")
+    assert job['id'] == job_id and job['status'] == 'running'
+    assert queue.claim("worker-b") is None
+
+
+def test_stale_worker_cannot_overwrite_a_reclaimed_job(tmp_path):
+    queue = make_queue(tmp_path)
+    job_id = queue.enqueue("user-1", "Software Engineer Intern", "Canada", False)
+    queue.claim("stale-worker")
+
+    time.sleep(0.01)
+    assert queue.recover_stale_jobs(stale_seconds=0) == 1
+    assert queue.claim("live-worker")['id'] == job_id
+
+    assert not queue.report_progress(job_id, "stale-worker", 99, 99, 99)
+    assert not queue.complete(job_id, "stale-worker", 99, 99, 99)
+    assert not queue.fail(job_id, "stale-worker", "lost")
+    assert queue.report_progress(job_id, "live-worker", 5, 3, 1)
+
+    job = queue.get(job_id)
+    assert (job['status'], job['worker_id'], job['found_count'], job['new_count']) == ('running', 'live-worker', 5, 3)
+
+    assert queue.complete(job_id, "live-worker", 10, 6, 2)
+    assert not queue.complete(job_id, "live-worker", 10, 6, 2)  # Done only once
+    assert queue.get(job_id)['status'] == 'done'
+
+
+def test_get_hides_other_users_jobs(tmp_path):
+    queue = make_queue(tmp_path)
+    job_id = queue.enqueue("user-1", "Data Intern", "", False)
+    assert queue.get(job_id, "user-1")['job_title'] == "Data Intern"
+    assert queue.get(job_id, "user-2") is None
@@ -0,0 +1,101 @@
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("telegram")
+
+from telegram.error import BadRequest, RetryAfter
+
+import notifications
+from notifications import MAX_MESSAGE_LENGTH, NotificationDispatcher, build_digests, pack_digests, split_message
+
+
+def test_digests_merge_small_messages_in_order():
+    assert build_digests(["one", "two", "three"]) == [f"one{notifications.DIGEST_SEPARATOR}two"
+                                                      f"{notifications.DIGEST_SEPARATOR}three"]
+
+
+def test_oversize_message_is_split_within_the_limit():
+    line = "x" * 100 + "\n"
+    message = line * 100  # 10,100 characters
+    parts = split_message(message)
+    assert len(parts) == 3
+    assert all(len(part) <= MAX_MESSAGE_LENGTH for part in parts)
+    assert "".join(parts) == message
+
+
+def test_oversize_line_is_cut_and_digests_stay_within_the_limit():
+    digests = build_digests(["short", "y" * (MAX_MESSAGE_LENGTH * 2 + 10), "tail"])
+    assert all(0 < len(digest) <= MAX_MESSAGE_LENGTH for digest in digests)
+    assert sum(digest.count("y") for digest in digests) == MAX_MESSAGE_LENGTH * 2 + 10
+
+
+def test_oversize_line_is_not_cut_inside_an_entity():
+    # "&amp;" straddles the limit, so the cut has to move in front of it
+    line = "x" * (MAX_MESSAGE_LENGTH - 2) + "&amp;" + "y" * 10
+    parts = split_message(line)
+    assert parts == ["x" * (MAX_MESSAGE_LENGTH - 2), "&amp;" + "y" * 10]
+
+
+def test_digest_parts_join_to_the_digest_text():
+    messages = ["a" * 3500, "b" * 1000, "c" * 1000]
+    assert pack_digests(messages) == [["a" * 3500], ["b" * 1000, "c" * 1000]]
+    assert build_digests(messages) == ["a" * 3500, "b" * 1000 + notifications.DIGEST_SEPARATOR + "c" * 1000]
+
+
+class PickyBot:
+    """Rejects any text containing "<bad>" as Telegram would reject malformed HTML, and records the rest."""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send_message(self, chat_id, text, parse_mode):
+        if "<bad>" in text:
+            raise BadRequest("Can't parse entities")
+        self.sent.append(text)
+
+
+def test_rejected_digest_is_resent_message_by_message(monkeypatch):
+    monkeypatch.setattr(notifications, "CHAT_MIN_INTERVAL_SECONDS", 0)
+    dispatcher = NotificationDispatcher()
+    bot = PickyBot()
+    dispatcher._bots["token"] = bot
+    sent = asyncio.run(dispatcher._send_digest("token", "111", ["first", "<bad>", "third"]))
+    assert sent is False
+    # Only the bad message is lost, and it was not retried as if it were a network error
+    assert bot.sent == ["first", "third"]
+
+
+class FloodedBot:
+    """Answers the first message with a one-second flood wait, then records when each chat got through."""
+
+    def __init__(self):
+        self.flooded = False
+        self.sent_at = {}
+
+    async def send_message(self, chat_id, text, parse_mode):
+        if not self.flooded:
+            self.flooded = True
+            raise RetryAfter(1)
+        self.sent_at[chat_id] = time.monotonic()
+
+
+def test_retry_after_holds_back_every_chat_of_the_bot(monkeypatch):
+    monkeypatch.setattr(notifications, "CHAT_MIN_INTERVAL_SECONDS", 0)
+    # Give up after the flood wait, so no retry of the flooded chat holds the bot's slot
+    monkeypatch.setattr(notifications, "MAX_SEND_ATTEMPTS", 1)
+    dispatcher = NotificationDispatcher()
+    bot = FloodedBot()
+    dispatcher._bots["token"] = bot
+
+    async def send_to_two_chats():
+        flooded_chat = asyncio.ensure_future(dispatcher._send("token", "111", "hello"))
+        await asyncio.sleep(0.1)  # The flood wait has been received by now
+        other_chat = await dispatcher._send("token", "222", "hello")
+        return await flooded_chat, other_chat
+
+    started = time.monotonic()
+    assert asyncio.run(send_to_two_chats()) == (False, True)
+    # The other chat waited out the flood limit too, instead of hitting it again
+    assert bot.sent_at["222"] - started >= 0.95
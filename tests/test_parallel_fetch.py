@@ -0,0 +1,34 @@
+import time
+
+from parallel_fetch import HostThrottle, fetch_in_order
+
+LATENCY = 0.3
+
+
+def slow_fetch(url):
+    time.sleep(LATENCY)
+    return url
+
+
+def test_fetches_to_one_host_run_concurrently_up_to_the_worker_count():
+    urls = [f"https://www.linkedin.com/jobs/view/{i}" for i in range(8)]
+    workers = 4
+    started = time.perf_counter()
+    results = fetch_in_order(urls, slow_fetch, url_of=lambda url: url, max_workers=workers,
+                             throttle=HostThrottle(per_host_limit=workers, politeness_delay=LATENCY))
+    elapsed = time.perf_counter() - started
+
+    assert results == urls
+    expected = len(urls) / workers * LATENCY
+    assert elapsed < expected * 1.6  # One after another would take len(urls) * LATENCY
+
+
+def test_throttle_caps_request_starts_per_host():
+    throttle = HostThrottle(per_host_limit=2, politeness_delay=0.2)
+    starts = []
+    started = time.perf_counter()
+    for _ in range(5):
+        with throttle.slot("https://www.linkedin.com/jobs/view/1"):
+            starts.append(time.perf_counter() - started)
+    # Two starts per 0.2 s, evenly spaced
+    assert starts[-1] >= 4 * 0.1 - 0.02
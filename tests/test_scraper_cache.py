@@ -0,0 +1,73 @@
+import os
+
+import pytest
+
+pytest.importorskip("selenium")
+
+import scraper
+from description_cache import DescriptionCache
+from driver_pool import ChromeDriverPool
+from scrape_events import JobFound
+
+FIXTURE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "linkedin_initial_page.html")
+DESCRIPTION = "About the role: " + "Build and ship internship projects with the team. " * 20
+
+
+class FakeDriver:
+    """Serves the saved search page; detail pages are never opened because the HTTP path succeeds."""
+
+    def __init__(self, page_source):
+        self.page_source = page_source
+        self.card_count = page_source.count('class="base-card')
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script, *args):
+        return 1 if script == "return 1;" else []
+
+    def find_elements(self, by, selector):
+        return [object()] * self.card_count
+
+    def delete_all_cookies(self):
+        pass
+
+    def get_log(self, name):
+        return []
+
+    def quit(self):
+        pass
+
+
+def run_scrape(cache):
+    with open(FIXTURE, encoding="utf-8") as f:
+        page_source = f.read()
+    pool = ChromeDriverPool(lambda: FakeDriver(page_source), size=1)
+    events = scraper.iter_scrape_linkedin("Software Engineer Intern", "Canada", driver_pool=pool,
+                                          description_cache=cache, politeness_delay=0)
+    return [event.job for event in events if isinstance(event, JobFound)]
+
+
+def test_second_scrape_reads_descriptions_from_a_fresh_cache(tmp_path, monkeypatch):
+    fetched = []
+
+    def fetch_static(job_url, job_title):
+        fetched.append(job_url)
+        return DESCRIPTION
+
+    monkeypatch.setattr(scraper, "_fetch_static_description", fetch_static)
+    cache = DescriptionCache(str(tmp_path / "descriptions.sqlite3"))
+    assert len(cache) == 0
+
+    first = run_scrape(cache)
+    assert first and len(fetched) == len(first)
+    assert len(cache) == len(first)
+
+    fetched.clear()
+    second = run_scrape(cache)
+    assert fetched == []
+    assert sorted(job['source_url'] for job in second) == sorted(job['source_url'] for job in first)
+    assert all(job['job_description'] for job in second)
@@ -1,15 +1,7 @@
 import streamlit as st
-from supabase_db import SupabaseDB
+from supabase_db import get_db
 from datetime import datetime
 import time
-from dateutil import parser
-
-def parse_date(date_str):
-    """Helper function to parse dates in various formats"""
-    try:
-        return parser.parse(date_str)
-    except (ValueError, TypeError):
-        return datetime.min
 
 # Status configurations for consistent UI
 STATUS_INFO = {
@@ -23,6 +15,39 @@ def get_status_info(status):
     status = status.title() if status else 'New'
     return STATUS_INFO.get(status, {'color': 'gray', 'emoji': '❔'})
 
+def get_full_description(user_id, internship_id):
+    """Loads a job description on demand; the list rows only carry a short preview."""
+    descriptions = st.session_state.setdefault('full_descriptions', {})
+    if internship_id not in descriptions:
+        row = get_db().get_internship(user_id, internship_id, columns='job_description')
+        descriptions[internship_id] = (row or {}).get('job_description') or ''
+    return descriptions[internship_id]
+
+BULK_ACTIONS = {
+    'applied': "✅ Mark Applied",
+    'rejected': "❌ Reject",
+    'delete': "🗑️ Delete",
+}
+
+def run_bulk_action(user_id, action):
+    """Button callback: applies ``action`` to every selected internship in one database statement."""
+    internship_ids = st.session_state.get('bulk_selection') or []
+    if not internship_ids:
+        return
+    db = get_db()
+    try:
+        if action == 'delete':
+            changed = db.delete_internships(user_id, internship_ids)
+        else:
+            changed = db.update_internships_status(user_id, internship_ids, action)
+    except Exception as e:
+        st.session_state.bulk_message = ('error', f"Bulk action failed: {str(e)}")
+        return
+    verb = "deleted" if action == 'delete' else f"marked as {action}"
+    st.session_state.bulk_message = ('success', f"✅ {len(changed)} internships {verb}.")
+    st.session_state.bulk_selection = []
+    st.session_state.all_internships = None
+
 def show_dashboard_page():
     """Renders the main content of the dashboard page."""
     st.title("📊 Internship Dashboard")
@@ -37,7 +62,8 @@ def show_dashboard_page():
         'delete_success': False,
         'reject_success': False,
         'last_action': None,
-        'last_action_status': None
+        'last_action_status': None,
+        'show_descriptions': {}
     }
     
     for key, default_value in state_defaults.items():
@@ -46,34 +72,25 @@ def show_dashboard_page():
         
     user_id = st.session_state.get('user_id')
     
-    # Load internships if needed
-    if not st.session_state.all_internships:
-        if user_id:
-            db = SupabaseDB()
-            internships = db.get_internships_by_user(user_id)
-            if internships is not None:
-                st.session_state.all_internships = internships
-    
-    all_internships = st.session_state.all_internships
-
-    # Display Statistics with emojis
+    # Display Statistics with emojis (counted by the database, without loading the list)
     st.markdown("### 📈 Overview")
     col1, col2, col3, col4 = st.columns(4)
-    
-    # Calculate statistics
-    total_internships = len(all_internships) if all_internships is not None else 0
-    new_internships = len([i for i in (all_internships or []) if i.get('status') == 'new'])
-    applied_internships = len([i for i in (all_internships or []) if i.get('status') == 'applied'])
-    rejected_internships = len([i for i in (all_internships or []) if i.get('status') == 'rejected'])
+    counts = get_db().get_status_counts(user_id)
     
     with col1:
-        st.metric("🎯 Total", total_internships)
+        st.metric("🎯 Total", counts['total'])
     with col2:
-        st.metric("✨ New", new_internships)
+        st.metric("✨ New", counts['new'])
     with col3:
-        st.metric("✅ Applied", applied_internships)
+        st.metric("✅ Applied", counts['applied'])
     with col4:
-        st.metric("❌ Rejected", rejected_internships)
+        st.metric("❌ Rejected", counts['rejected'])
+    
+    # Load internships (served from the per-user cache, reloaded only when the database changed)
+    if user_id:
+        st.session_state.all_internships = get_db().get_user_internships(user_id)
+    
+    all_internships = st.session_state.all_internships
     
     st.markdown("---")
 
@@ -94,38 +111,20 @@ def show_dashboard_page():
         key='status_filter'
     )
 
-    # Apply filter based on radio button selection
+    # Apply filter based on radio button selection (rows arrive already ordered by status and date)
     if selected_status == 'All':
         filtered_internships = all_internships
     else:
         filtered_internships = [i for i in all_internships if i.get('status') == selected_status]
     
-    # Sort internships by status (new -> applied -> rejected) and then by date
-    try:
-        # Define status priority (new first, then applied, then rejected)
-        status_priority = {'new': 0, 'applied': 1, 'rejected': 2}
-        
-        # Sort function that considers both status and date
-        def sort_key(internship):
-            # Get status priority (default to highest number if status not found)
-            status_prio = status_priority.get(internship.get('status', 'new'), 3)
-            # Get date (default to earliest date if not found)
-            date = parse_date(internship.get('created_at'))
-            # Return tuple for sorting (status priority first, then date in reverse order)
-            return (status_prio, -date.timestamp())
-        
-        filtered_internships = sorted(filtered_internships, key=sort_key)
-    except Exception as e:
-        st.warning(f"Note: Could not sort internships. Using default order.")
-    
     # Refresh button
     if st.button('🔄 Refresh', use_container_width=True):
         st.session_state.all_internships = None
         if not st.session_state.user_id:
             st.error("You must be logged in to view internships.")
             return
-        db = SupabaseDB()
-        internships = db.get_internships_by_user(st.session_state.user_id)
+        db = get_db()
+        internships = db.get_user_internships(st.session_state.user_id)
         if internships is None:
             st.error("Failed to load internships. Please try again.")
             return
@@ -187,9 +186,10 @@ def show_dashboard_page():
                             st.markdown(f"**Added:** {internship['created_at'].split('T')[0]}")
                     
                     # Description
-                    if internship.get('job_description'):
+                    description = get_full_description(user_id, internship['id'])
+                    if description:
                         st.markdown("### Description")
-                        st.markdown(internship['job_description'])
+                        st.markdown(description)
                 
                 with right_col:
                     # Status with color and emoji
@@ -223,7 +223,7 @@ def show_dashboard_page():
                         reject_key = f"reject_detail_{internship['id']}_{st.session_state.button_counter}"
                         if st.button("❌ Reject", key=reject_key, type="secondary", use_container_width=True):
                             try:
-                                db = SupabaseDB()
+                                db = get_db()
                                 result = db.update_internship_status(user_id, internship['id'], 'rejected')
                                 if result:
                                     st.success("✅ Internship successfully rejected!")
@@ -245,7 +245,7 @@ def show_dashboard_page():
                             apply_key = f"apply_detail_{internship['id']}_{st.session_state.button_counter}"
                             if st.button("✅ Apply", key=apply_key, type="primary", use_container_width=True):
                                 try:
-                                    db = SupabaseDB()
+                                    db = get_db()
                                     internship_id = int(internship['id'])
                                     # First update the status
                                     result = db.update_internship_status(user_id, internship_id, 'applied')
@@ -267,7 +267,7 @@ def show_dashboard_page():
                             reject_key = f"reject_detail_{internship['id']}_{st.session_state.button_counter}"
                             if st.button("❌ Reject", key=reject_key, type="secondary", use_container_width=True):
                                 try:
-                                    db = SupabaseDB()
+                                    db = get_db()
                                     internship_id = int(internship['id'])
                                     # First update the status
                                     result = db.update_internship_status(user_id, internship_id, 'rejected')
@@ -315,19 +315,15 @@ def show_dashboard_page():
                     col1, col2 = st.columns(2)
                     with col1:
                         if st.button("Yes, Delete", type="primary", key="confirm_yes", use_container_width=True):
-                            db = SupabaseDB()
-                            # First mark as rejected
-                            if db.update_internship_status(user_id, internship_to_delete['id'], 'rejected'):
-                                st.success("✅ Internship successfully marked as rejected!")
+                            db = get_db()
+                            if db.delete_internship(user_id, internship_to_delete['id']):
+                                # Store success message in session state
+                                st.session_state.delete_success = True
                                 st.session_state.all_internships = None
-                                time.sleep(1)  # Give time to see the rejection message
-                                # Then delete the internship
-                                if db.delete_internship(user_id, internship_to_delete['id']):
-                                    # Store success message in session state
-                                    st.session_state.delete_success = True
-                                    st.session_state.all_internships = None
-                                    st.session_state.confirm_delete = None
-                                    st.rerun()
+                                st.session_state.confirm_delete = None
+                                st.rerun()
+                            else:
+                                st.error("Failed to delete internship. Please try again.")
                     with col2:
                         if st.button("No, Cancel", type="secondary", key="confirm_no", use_container_width=True):
                             st.session_state.confirm_delete = None
@@ -356,7 +352,7 @@ def show_dashboard_page():
                     col1, col2 = st.columns(2)
                     with col1:
                         if st.button("Yes, Reject", type="primary", key="confirm_reject_yes", use_container_width=True):
-                            db = SupabaseDB()
+                            db = get_db()
                             if db.update_internship_status(user_id, internship_to_reject['id'], 'rejected'):
                                 # Store success message in session state
                                 st.session_state.reject_success = True
@@ -394,11 +390,32 @@ def show_dashboard_page():
 
     # Display internships
     st.info(f"Displaying {len(filtered_internships)} of {len(all_internships)} total internships.")
+
+    # Bulk actions: one statement for all selected internships
+    bulk_message = st.session_state.pop('bulk_message', None)
+    if bulk_message:
+        kind, text = bulk_message
+        if kind == 'success':
+            st.success(text)
+        else:
+            st.error(text)
+    with st.expander("☑️ Bulk actions"):
+        labels = {
+            i['id']: f"{i.get('job_title', 'Untitled Position')} at {i.get('company_name', 'N/A')}"
+            for i in all_internships
+        }
+        st.multiselect("Select internships", options=list(labels), format_func=labels.get, key='bulk_selection')
+        action_cols = st.columns(len(BULK_ACTIONS))
+        for col, (action, label) in zip(action_cols, BULK_ACTIONS.items()):
+            with col:
+                st.button(label, key=f"bulk_{action}", use_container_width=True,
+                          disabled=not st.session_state.get('bulk_selection'),
+                          on_click=run_bulk_action, args=(user_id, action))
     
     def update_internship_status_async(internship_id, new_status):
         """Helper function to update internship status"""
         try:
-            db = SupabaseDB()
+            db = get_db()
             result = db.update_internship_status(user_id, internship_id, new_status)
             if result:
                 st.session_state.all_internships = None
@@ -454,16 +471,22 @@ def show_dashboard_page():
                     st.markdown(f"**Added:** {str(internship['created_at']).split('T')[0]}")
             
             # Preview of description
-            if internship.get('job_description'):
-                description = internship['job_description']
-                preview = description[:150] + ('...' if len(description) > 150 else '')
+            if internship.get('job_description_preview'):
+                preview = internship['job_description_preview']
+                preview = preview + ('...' if len(preview) >= 150 else '')
                 st.markdown(f"**Preview:** {preview}")
             
             # Actions section
             with st.expander("📋 View Details"):
-                if internship.get('job_description'):
-                    st.markdown("### Description")
-                    st.markdown(internship['job_description'])
+                # The full description is only fetched when asked for
+                if internship.get('job_description_preview'):
+                    shown = st.session_state.show_descriptions.get(internship['id'])
+                    if shown:
+                        st.markdown("### Description")
+                        st.markdown(get_full_description(user_id, internship['id']))
+                    elif st.button("📄 Show full description", key=f"description_{internship['id']}"):
+                        st.session_state.show_descriptions[internship['id']] = True
+                        st.rerun()
                 
                 st.markdown("### 🎯 Actions")
                 current_status = internship.get('status', 'new').lower()
@@ -1,20 +1,20 @@
 import streamlit as st
 import pandas as pd
-from supabase_db import SupabaseDB
+from supabase_db import get_db
 
 def show_history_page():
     """Renders the main content of the application history page.""" 
     st.title("📜 Application History")
 
     try:
-        db = SupabaseDB()
+        db = get_db()
         user_id = st.session_state.get('user_id')
         if not user_id:
             st.error("User not identified. Please log in again.")
             st.stop()
 
         st.write("Here is a log of all your past application activities.")
-        all_internships = db.get_internships_by_user(user_id)
+        all_internships = db.get_user_internships(user_id)
 
     except Exception as e:
         st.error(f"Failed to load data: {e}")
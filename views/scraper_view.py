@@ -1,83 +1,80 @@
 import streamlit as st
-from supabase_db import SupabaseDB
-from web_scraper import scrape_linkedin
-import asyncio
-import threading
 import time
-from datetime import datetime
-from notifications import send_telegram_notification
-from config import SCRAPING_INTERVAL_MINUTES
-
-
-def continuous_scraping(job_title, location, user_id):
-    """Background task to continuously scrape LinkedIn for new internships."""
-    db = SupabaseDB()
-    # Fetch user's Telegram config once at the start
-    user_profile = db.get_user_profile(user_id)
-    telegram_bot_token = user_profile.get('telegram_bot_token')
-    telegram_chat_id = user_profile.get('telegram_chat_id')
-    print(f"[DEBUG] Telegram config for user {user_id}: token={telegram_bot_token}, chat_id={telegram_chat_id}")
-
-    while True:
-        try:
-            # Get current internships from database
-            all_internships = db.get_internships_by_user(user_id)
-            existing_links = {internship['application_link'] for internship in all_internships}
-
-            # Scrape LinkedIn
-            result = scrape_linkedin(job_title, location, True)  # Only last 24h
-            print(f"[DEBUG] Scraped {len(result) if isinstance(result, list) else 0} internships from LinkedIn.")
-
-            if isinstance(result, list):
-                new_internships = []
-                for internship in result:
-                    link = internship["application_link"]
-                    if link not in existing_links:
-                        save_data = {
-                            **internship,
-                            "status": "new",
-                        }
-                        resp = db.add_internship(user_id, save_data)
-                        if resp.get("success"):
-                            new_internships.append(internship)
-                print(f"[DEBUG] Found {len(new_internships)} new internships for user {user_id}.")
-
-                # Send notification if new internships found
-                if new_internships and telegram_bot_token and telegram_chat_id:
-                    # Send individual detailed messages for each internship
-                    for internship in new_internships:
-                        detail_message = (
-                            f"✨ New Internship: {internship['job_title']}\n"
-                            f"🏢 Company: {internship['company_name']}\n"
-                            f"🔗 Apply Here ({internship['application_link']})\n\n"
-                            f"LinkedIn ({internship['application_link']})\n"
-                            f"{internship['company_name']} hiring {internship['job_title']}\n"
-                            f"{internship.get('job_description', '').split('Posted')[0]}"
-                        )
-                        try:
-                            print(f"[DEBUG] Sending Telegram notification for internship: {detail_message}")
-                            send_telegram_notification(detail_message, telegram_bot_token, telegram_chat_id)
-                        except Exception as notify_err:
-                            print(f"[ERROR] Failed to send Telegram notification: {notify_err}")
-                    # Send summary message
-                    summary = f"🎯 Found {len(new_internships)} new internships!\n\n"
-                    for idx, internship in enumerate(new_internships, 1):
-                        summary += f"{idx}. {internship['job_title']} at {internship['company_name']}\n"
-                    try:
-                        print(f"[DEBUG] Sending Telegram summary notification: {summary}")
-                        send_telegram_notification(summary, telegram_bot_token, telegram_chat_id)
-                    except Exception as notify_err:
-                        print(f"[ERROR] Failed to send Telegram summary notification: {notify_err}")
-                elif not new_internships:
-                    print(f"[DEBUG] No new internships found for user {user_id}.")
-                elif not (telegram_bot_token and telegram_chat_id):
-                    print(f"[ERROR] Telegram config missing for user {user_id}.")
-
-        except Exception as e:
-            print(f"Error in continuous scraping: {e}")
-
-        # Wait for the specified interval
-        time.sleep(SCRAPING_INTERVAL_MINUTES * 60)
+from supabase_db import get_db
+from config import RUN_SEARCH_SCHEDULER_IN_APP, SCRAPING_INTERVAL_MINUTES
+from job_queue import ScrapeJobQueue
+from search_scheduler import get_search_scheduler, next_run_time
+
+
+SCRAPE_POLL_SECONDS = 1.5  # How often the page re-reads a queued search's progress
+
+
+@st.cache_resource(show_spinner=False)
+def _scrape_queue() -> ScrapeJobQueue:
+    return ScrapeJobQueue()
+
+
+def start_continuous_search(db, user_id, job_title, location):
+    """Saves the user's continuous search; the scheduler runs it from the next interval on."""
+    subscription = db.start_search_subscription(user_id, job_title, location, next_run_time())
+    if subscription and RUN_SEARCH_SCHEDULER_IN_APP:
+        get_search_scheduler().wake()
+    return subscription
+
+
+def stop_continuous_search(db, user_id):
+    """Stops the user's continuous search, cancelling a run in progress."""
+    stopped = db.stop_search_subscription(user_id)
+    if stopped and RUN_SEARCH_SCHEDULER_IN_APP:
+        get_search_scheduler().cancel_user(user_id)
+    return stopped
+
+
+def queue_scrape(job_title, location, last_24_hours, user_id):
+    """Queues a manual search for the scrape workers; this session then polls it with ``show_scrape_job``."""
+    job_id = _scrape_queue().enqueue(user_id, job_title, location, last_24_hours)
+    st.session_state.scrape_job_id = job_id
+    return job_id
+
+
+def show_scrape_job(user_id):
+    """Shows this session's queued search: live progress while it runs, then its summary once."""
+    job_id = st.session_state.get('scrape_job_id')
+    if not job_id:
+        return
+    job = _scrape_queue().get(job_id, user_id)
+    if job is None:
+        st.session_state.scrape_job_id = None
+        return
+
+    if job['status'] in ('queued', 'running'):
+        if job['status'] == 'queued':
+            st.info("⏳ Your search is queued and will start as soon as a scrape worker is free...")
+        else:
+            st.info(f"🔎 Scraping LinkedIn: found {job['found_count']} internships so far, {job['new_count']} saved...")
+        time.sleep(SCRAPE_POLL_SECONDS)
+        st.rerun()
+
+    st.session_state.scrape_job_id = None
+    if job['status'] == 'failed':
+        st.error(job['error'])
+        return
+    if job['new_count']:
+        # Clear the session state to force a refresh of internships
+        st.session_state.all_internships = None
+    show_scrape_summary(job['found_count'], job['new_count'], job['duplicate_count'])
+
+
+def show_scrape_summary(found_count, new_internships_count, duplicate_count):
+    """Shows the outcome of a manual search."""
+    if not found_count:
+        st.warning("No internships found. Try adjusting your search criteria.")
+    elif new_internships_count > 0:
+        st.success(f"✨ Added {new_internships_count} new internships! Check your dashboard to review them.")
+    elif duplicate_count > 0:
+        st.info("All found internships were already in your dashboard.")
+    else:
+        st.warning("No new internships were found to add.")
 
 
 def show_scraper_page():
@@ -87,11 +84,6 @@ def show_scraper_page():
     st.markdown("Search LinkedIn for the latest internship opportunities and save them to your dashboard.")
     st.markdown("---")
 
-    # Initialize continuous search state
-    if 'continuous_search_active' not in st.session_state:
-        st.session_state.continuous_search_active = False
-        st.session_state.search_thread = None
-
     # --- Search Form ---
     with st.form("scraper_form", clear_on_submit=False):
         col1, col2, col3 = st.columns(3)
@@ -116,71 +108,36 @@ def show_scraper_page():
     last_job_title = st.session_state.get('last_job_title', '')
     last_location = st.session_state.get('last_location', 'United States')
     if user_id:
+        db = get_db()
+        subscription = db.get_search_subscription(user_id)
+        search_active = bool(subscription and subscription['active'])
         col1, col2 = st.columns([3, 1])
         with col1:
             st.info(f"Continuous search will check for new internships every {SCRAPING_INTERVAL_MINUTES} minutes.")
         with col2:
-            if not st.session_state.continuous_search_active:
+            if not search_active:
                 if st.button("Start Continuous Search", type="primary", use_container_width=True):
                     if not last_job_title:
                         st.error("Please enter a job title first (in the form above).")
                     else:
-                        # --- Run a manual search first (same as 'Search' button) ---
-                        with st.spinner("Scraping LinkedIn. Please wait..."):
-                            result = scrape_linkedin(last_job_title, last_location, last_24_hours)
-
-                        if isinstance(result, dict) and result.get("error"):
-                            st.error(result["error"])
-                            return
-
-                        if not result:
-                            st.warning("No internships found. Try adjusting your search criteria.")
-                        else:
-                            # --- Process and Save Results ---
-                            all_internships = st.session_state.get('all_internships', [])
-                            existing_links = {internship['application_link'] for internship in all_internships}
-                            db = SupabaseDB()
-                            new_internships_count = 0
-                            duplicate_count = 0
-                            for internship in result:
-                                link = internship["application_link"]
-                                if link not in existing_links:
-                                    save_data = {
-                                        **internship,
-                                        "status": "new",
-                                    }
-                                    resp = db.add_internship(user_id, save_data)
-                                    if resp.get("success"):
-                                        new_internships_count += 1
-                                    elif resp.get("error") == "duplicate":
-                                        duplicate_count += 1
-                            st.session_state.all_internships = None
-                            if new_internships_count > 0:
-                                st.success(f"✨ Added {new_internships_count} new internships! Check your dashboard to review them.")
-                            else:
-                                if duplicate_count > 0:
-                                    st.info("All found internships were already in your dashboard.")
-                                else:
-                                    st.warning("No new internships were found to add.")
-                        # --- Start continuous search in background ---
-                        search_thread = threading.Thread(
-                            target=continuous_scraping,
-                            args=(last_job_title, last_location, user_id),
-                            daemon=True
-                        )
-                        search_thread.start()
-                        st.session_state.search_thread = search_thread
-                        st.session_state.continuous_search_active = True
-                        st.rerun()
+                        # --- Queue a manual search first (same as 'Search' button) ---
+                        queue_scrape(last_job_title, last_location, last_24_hours, user_id)
+                        # --- Hand the search to the scheduler ---
+                        if start_continuous_search(db, user_id, last_job_title, last_location):
+                            st.rerun()
+                        st.error("Could not start continuous search. Please try again.")
             else:
                 if st.button("Stop Continuous Search", type="secondary", use_container_width=True):
-                    st.session_state.continuous_search_active = False
-                    st.session_state.search_thread = None
-                    st.rerun()
+                    if stop_continuous_search(db, user_id):
+                        st.rerun()
+                    st.error("Could not stop continuous search. Please try again.")
 
-    # Show continuous search status
-    if st.session_state.continuous_search_active:
-        st.success("🔄 Continuous search is active. You'll receive Telegram notifications for new internships.")
+        # Show continuous search status
+        if search_active:
+            st.success(f"🔄 Continuous search for \"{subscription['job_title']}\" in {subscription['location'] or 'any location'} "
+                       "is active. You'll receive Telegram notifications for new internships.")
+            if subscription.get('last_error'):
+                st.warning(f"The last continuous search run failed: {subscription['last_error']}")
 
     if submitted:
         if not job_title:
@@ -190,48 +147,13 @@ def show_scraper_page():
         st.session_state['last_job_title'] = job_title
         st.session_state['last_location'] = location
 
-        with st.spinner("Scraping LinkedIn. Please wait..."):
-            result = scrape_linkedin(job_title, location, last_24_hours)
-
-        if isinstance(result, dict) and result.get("error"):
-            st.error(result["error"])
-            return
-
-        if not result:
-            st.warning("No internships found. Try adjusting your search criteria.")
-            return
-
-        # --- Process and Save Results ---
+        # --- Queue the scrape; a scrape worker saves results as they arrive ---
         user_id = st.session_state.get("user_id")
-        all_internships = st.session_state.get('all_internships', [])
-        existing_links = {internship['application_link'] for internship in all_internships}
-
-        db = SupabaseDB()
-        new_internships_count = 0
-        duplicate_count = 0
-
-        with st.spinner("Processing and saving new internships..."):
-            for internship in result:
-                link = internship["application_link"]
-                if link not in existing_links:
-                    save_data = {
-                        **internship,
-                        "status": "new",
-                    }
-                    resp = db.add_internship(user_id, save_data)
-                    if resp.get("success"):
-                        new_internships_count += 1
-                    elif resp.get("error") == "duplicate":
-                        duplicate_count += 1
-
-        # Clear the session state to force a refresh of internships
-        st.session_state.all_internships = None
+        if not user_id:
+            st.warning("Please log in to save internships.")
+            st.stop()
+        queue_scrape(job_title, location, last_24_hours, user_id)
 
-        # Show results summary
-        if new_internships_count > 0:
-            st.success(f"✨ Added {new_internships_count} new internships! Check your dashboard to review them.")
-        else:
-            if duplicate_count > 0:
-                st.info("All found internships were already in your dashboard.")
-            else:
-                st.warning("No new internships were found to add.")
+    # Progress and outcome of this session's queued search
+    if user_id:
+        show_scrape_job(user_id)
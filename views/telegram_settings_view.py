@@ -1,9 +1,9 @@
 import streamlit as st
-from supabase_db import SupabaseDB
+from supabase_db import get_db
 
 def show_telegram_settings_page():
     st.header("🔧 Telegram Settings")
-    db = SupabaseDB()
+    db = get_db()
     user_id = st.session_state.get('user_id')
     if not user_id:
         st.error("You must be logged in to view this page.")
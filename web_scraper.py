@@ -1,7 +1,7 @@
 import requests
-from bs4 import BeautifulSoup
 import streamlit as st
-import re
+from linkedin_guest import SEARCH_MAX_RESULTS, SEARCH_PAGE_SIZE, iter_guest_search
+from scrape_events import JobFound, ScrapeError, ScrapeFinished, collect_jobs
 
 # --- LinkedIn Scraper ---
 
@@ -11,72 +11,48 @@ import re
 # and potentially a headless browser like Selenium.
 
 @st.cache_data(ttl=3600)  # Cache results for 1 hour to avoid re-scraping
-def scrape_linkedin(job_title: str, location: str = "Canada", last_24_hours: bool = False):
+def scrape_linkedin(job_title: str, location: str = "Canada", last_24_hours: bool = False,
+                    known_job_ids: tuple = (), high_water_mark: int = None,
+                    max_results: int = SEARCH_MAX_RESULTS, page_size: int = SEARCH_PAGE_SIZE):
     """Scrapes LinkedIn for internship listings.
 
     Args:
         job_title: The job title keyword(s) to search.
         location: Location string (default "United States").
         last_24_hours: If True, only return jobs posted in the last 24 hours.
+        known_job_ids: LinkedIn job IDs the caller already has; these are left out of the
+            results. Pass a sorted tuple so the Streamlit cache key stays stable.
+        high_water_mark: Largest job ID already seen; older postings are treated as known.
+        max_results: Maximum number of jobs to collect across result pages.
+        page_size: Offset step between two result pages.
     """
-    search_query = f"{job_title} internship"
-    url = (
-        f"https://www.linkedin.com/jobs/search/?keywords={search_query.replace(' ', '%20')}"
-        f"&location={location.replace(' ', '%20')}"
-        f"&sortBy=R"  # Most recent first
-    )
-    if last_24_hours:
-        url += "&f_TPR=r86400"  # Only jobs posted in the last 24 hours
-    
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-    }
+    return collect_jobs(iter_scrape_linkedin(job_title, location, last_24_hours, known_job_ids=known_job_ids,
+                                             high_water_mark=high_water_mark, max_results=max_results,
+                                             page_size=page_size))
 
-    try:
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status() # Raise an exception for bad status codes
-    except requests.exceptions.RequestException as e:
-        return {'error': f"Failed to retrieve data from LinkedIn: {e}"}
-
-    soup = BeautifulSoup(response.content, 'html.parser')
-    
-    job_listings = []
-    # Find all job posting cards. The class name might need updating if LinkedIn changes its layout.
-    job_cards = soup.find_all('div', class_='base-card')
-
-    if not job_cards:
-        return {'error': 'No job cards found. LinkedIn may have changed its layout or blocked the request.'}
-
-    for card in job_cards:
-        try:
-            title_elem = card.find('h3', class_='base-search-card__title')
-            company_elem = card.find('h4', class_='base-search-card__subtitle')
-            link_elem = card.find('a', class_='base-card__full-link')
-            
-            if not all([title_elem, company_elem, link_elem]):
-                continue
 
-            title_text = title_elem.get_text(strip=True)
-            company_text = company_elem.get_text(strip=True)
+def iter_scrape_linkedin(job_title: str, location: str = "Canada", last_24_hours: bool = False,
+                         known_job_ids=(), high_water_mark: int = None,
+                         max_results: int = SEARCH_MAX_RESULTS, page_size: int = SEARCH_PAGE_SIZE):
+    """Yields scrape events for a LinkedIn search as each result page is parsed.
 
-            # Fallback: sometimes the <h4> contains only ***** but the nested <a> has the real name
-            if re.fullmatch(r'\*+', company_text):
-                anchor = company_elem.find('a')
-                if anchor:
-                    company_text = anchor.get_text(strip=True)
-
-            # Skip results clearly masked (company or title are only asterisks)
-            if re.fullmatch(r'\*+', title_text) or re.fullmatch(r'\*+', company_text):
-                continue
+    Takes the same arguments as ``scrape_linkedin``. Every job is a ``JobFound``; the stream
+    ends with ``ScrapeFinished``, or with ``ScrapeError`` when the first page cannot be
+    retrieved (a failure on a later page keeps the jobs already yielded and finishes).
+    """
+    count = 0
+    try:
+        for job in iter_guest_search(job_title, location, last_24_hours, page_size=page_size,
+                                     max_results=max_results, known_job_ids=set(known_job_ids or ()),
+                                     high_water_mark=high_water_mark):
+            job.pop('job_id', None)
+            yield JobFound(job, index=count)
+            count += 1
+    except requests.exceptions.RequestException as e:
+        if not count:
+            yield ScrapeError(f"Failed to retrieve data from LinkedIn: {e}")
+            return
+        # Keep the pages that did arrive
+        print(f"⚠️ Stopped paginating after {count} jobs: {e}")
 
-            job_listings.append({
-                'job_title': title_text,
-                'company_name': company_text,
-                'application_link': link_elem['href'],
-                'source_site': 'LinkedIn'
-            })
-        except Exception:
-            # Ignore cards that can't be parsed
-            continue
-            
-    return job_listings
+    yield ScrapeFinished(count)